@@ -0,0 +1,62 @@
+"""Throughput benchmark for the Russian date/time expression parser"""
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.services.nlp.datetime_parser import RussianDateTimeParser
+
+
+SAMPLES = [
+    "завтра в три",
+    "в пятницу в 10 утра",
+    "через 2 часа",
+    "через полчаса",
+    "послезавтра с девяти утра до шести вечера",
+    "15 марта в 14:30",
+    "в следующий вторник в двадцать три часа",
+    "создай встречу с Иваном",
+    "в понедельник в полдень",
+    "с трёх до пяти",
+]
+
+
+def run_benchmark(iterations: int) -> float:
+    """
+    Parse sample corpus repeatedly
+
+    Args:
+        iterations: Number of passes over the sample corpus
+
+    Returns:
+        Throughput in parses per second
+    """
+    parser = RussianDateTimeParser()
+    now = datetime(2025, 11, 5, 12, 0)
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for sample in SAMPLES:
+            parser.parse(sample, now=now)
+    elapsed = time.perf_counter() - started
+
+    return iterations * len(SAMPLES) / elapsed
+
+
+def main():
+    """Run benchmark and print results"""
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--iterations", type=int, default=10000)
+    args = arg_parser.parse_args()
+
+    throughput = run_benchmark(args.iterations)
+    print(f"Parsed {args.iterations * len(SAMPLES)} expressions: {throughput:,.0f} parses/sec")
+
+
+if __name__ == "__main__":
+    main()
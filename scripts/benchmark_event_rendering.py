@@ -0,0 +1,91 @@
+"""Rendering benchmark for long event lists (string concatenation vs join and pages)"""
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, List
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.bot.rendering import PageStore, event_blocks, first_page, paginate, render_events
+from src.services.calendar.models import Event
+
+
+def make_events(count: int) -> List[Event]:
+    """Synthetic agenda with attendees and locations"""
+    start = datetime(2025, 11, 5, 8, 0)
+    return [
+        Event(
+            id=str(i),
+            title=f"Встреча по проекту №{i} с командой разработки",
+            start=start + timedelta(minutes=i),
+            end=start + timedelta(minutes=i + 30),
+            attendees=["ivan@example.com", "maria@example.com"],
+            location="Переговорная 3",
+            source="yandex",
+            raw_data={}
+        )
+        for i in range(count)
+    ]
+
+
+def render_concatenated(events: List[Event], context: str) -> str:
+    """Previous renderer: repeated += into one unbounded string"""
+    response = f"У вас {len(events)} событий {context}:\n\n"
+    for i, event in enumerate(events, 1):
+        response += f"{i}. {event.title}\n"
+        response += f"   Время: {event.start.strftime('%H:%M')} - {event.end.strftime('%H:%M')}\n"
+        if event.attendees:
+            response += f"   Участники: {len(event.attendees)}\n"
+        if event.location:
+            response += f"   Место: {event.location}\n"
+        response += "\n"
+    return response.strip()
+
+
+def measure(render: Callable[[], object], iterations: int) -> float:
+    """
+    Time repeated renders
+
+    Args:
+        render: Renderer call
+        iterations: Number of renders
+
+    Returns:
+        Average milliseconds per render
+    """
+    started = time.perf_counter()
+    for _ in range(iterations):
+        render()
+    return (time.perf_counter() - started) / iterations * 1000
+
+
+def main():
+    """Run benchmark and print results"""
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--events", type=int, default=1000)
+    arg_parser.add_argument("--iterations", type=int, default=200)
+    args = arg_parser.parse_args()
+
+    events = make_events(args.events)
+    context = "на сегодня"
+    pages = list(paginate(event_blocks(events, context)))
+    assert render_concatenated(events, context) == render_events(events, context)
+
+    results = {
+        "concatenation (one message)": measure(lambda: render_concatenated(events, context), args.iterations),
+        "join (one message)": measure(lambda: render_events(events, context), args.iterations),
+        "join, all pages": measure(lambda: list(paginate(event_blocks(events, context))), args.iterations),
+        "first page only": measure(lambda: first_page(event_blocks(events, context), PageStore()), args.iterations),
+    }
+
+    print(f"{args.events} events: {len(render_events(events, context))} characters, {len(pages)} pages")
+    for name, ms in results.items():
+        print(f"  {name:<28} {ms:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
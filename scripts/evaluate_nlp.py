@@ -0,0 +1,100 @@
+"""Offline NLP evaluation: intent/slot accuracy, latency and token usage"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+from openai import AsyncOpenAI
+from src.services.nlp.nlp_service import NLPService
+from src.services.nlp.evaluation import (
+    ReplayChatClient,
+    RecordingChatClient,
+    evaluate,
+    load_corpus,
+)
+
+FIXTURES = project_root / "tests" / "fixtures"
+
+
+async def run(args) -> int:
+    """
+    Run evaluation and compare against baseline
+
+    Returns:
+        Process exit code (1 on regression)
+    """
+    cases = load_corpus(args.corpus)
+    api_key = os.getenv("OPENAI_API_KEY", "offline")
+
+    if args.record:
+        client = RecordingChatClient(AsyncOpenAI(api_key=api_key))
+    else:
+        client = ReplayChatClient.from_file(args.recordings, latency_scale=args.latency_scale)
+    service = NLPService(api_key=api_key, model=args.model, client=client)
+
+    try:
+        report = await evaluate(service, cases, client=client, concurrency=args.concurrency)
+    finally:
+        if args.record:
+            client.save(args.recordings)
+            print(f"Recordings saved to {args.recordings}")
+        await client.close()
+
+    print(json.dumps(report.to_dict(), indent=2))
+    for failure in report.failures:
+        print(f"  ✗ {json.dumps(failure, ensure_ascii=False)}")
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report.to_dict(), f, indent=2)
+            f.write("\n")
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    if not Path(args.baseline).exists():
+        print("No baseline found, run with --update-baseline to create one")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    regressions = report.compare(baseline)
+    if regressions:
+        print("❌ Regressions against baseline:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+
+    print("✅ No regressions against baseline")
+    return 0
+
+
+def main():
+    """Parse arguments and run evaluation"""
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", default=str(FIXTURES / "nlp_corpus.json"))
+    parser.add_argument("--recordings", default=str(FIXTURES / "nlp_recordings.json"))
+    parser.add_argument("--baseline", default=str(FIXTURES / "nlp_baseline.json"))
+    parser.add_argument("--model", default="gpt-4")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency-scale", type=float, default=1.0,
+                        help="Multiplier for recorded latencies (0 = instant replay)")
+    parser.add_argument("--record", action="store_true",
+                        help="Call the real OpenAI API and overwrite recordings")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Per-request deadline budget shared by processing stages"""
+from dataclasses import dataclass, field
+from typing import Awaitable, Dict, Optional, TypeVar
+import asyncio
+import math
+import time
+
+T = TypeVar("T")
+
+
+class DeadlineExceeded(TimeoutError):
+    """Stage ran out of its share of the request budget"""
+
+    def __init__(self, stage: str):
+        super().__init__(f"Deadline exceeded in stage {stage}")
+        self.stage = stage
+
+
+@dataclass
+class DeadlineStats:
+    """Counters for request deadlines"""
+    requests: int = 0
+    misses: Dict[str, int] = field(default_factory=dict)
+    degraded: int = 0
+
+    @property
+    def total_misses(self) -> int:
+        """Deadline misses over all stages"""
+        return sum(self.misses.values())
+
+
+class Deadline:
+    """
+    Time budget of one request
+
+    Counted from the request's arrival; every stage gets a share of
+    whatever is left when it starts, so time lost in queues or earlier
+    stages shrinks later stages instead of extending the request. A
+    stage that runs out is cancelled (cancelling its HTTP call) and
+    DeadlineExceeded is raised for the caller to degrade.
+    """
+
+    def __init__(
+        self,
+        budget_seconds: Optional[float],
+        stats: Optional[DeadlineStats] = None,
+        started: Optional[float] = None
+    ):
+        """
+        Initialize deadline
+
+        Args:
+            budget_seconds: Total budget (None: no deadline)
+            stats: Shared counters (default: own counters)
+            started: time.monotonic() of the request's arrival (default: now)
+        """
+        self.stats = stats or DeadlineStats()
+        self.stats.requests += 1
+        if started is None:
+            started = time.monotonic()
+        self._expires = None if budget_seconds is None else started + budget_seconds
+
+    @property
+    def remaining(self) -> float:
+        """Seconds left (infinite without deadline)"""
+        if self._expires is None:
+            return math.inf
+        return max(0.0, self._expires - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the budget is used up"""
+        return self.remaining <= 0
+
+    def timeout(self, share: float = 1.0) -> Optional[float]:
+        """
+        Timeout for a stage taking `share` of the remaining budget
+
+        Args:
+            share: Fraction of the remaining budget (0-1]
+
+        Returns:
+            Seconds, or None without deadline
+        """
+        if self._expires is None:
+            return None
+        return self.remaining * share
+
+    async def run(self, stage: str, awaitable: Awaitable[T], share: float = 1.0) -> T:
+        """
+        Await within the stage's share of the remaining budget
+
+        Args:
+            stage: Stage name for miss counters
+            awaitable: Stage work
+            share: Fraction of the remaining budget
+
+        Returns:
+            Result of the awaitable
+
+        Raises:
+            DeadlineExceeded: If the share ran out (the work is cancelled)
+            TimeoutError: Timeouts raised by the work itself, unchanged
+        """
+        timeout = self.timeout(share)
+        if timeout is not None and timeout <= 0:
+            # Not even started, like wait_for() with no time left
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise self._miss(stage)
+
+        # Only the scope's own expiry is a miss: TimeoutErrors of the work
+        # (client timeouts, nested deadlines) propagate as they are
+        scope = asyncio.timeout(timeout)
+        try:
+            async with scope:
+                return await awaitable
+        except TimeoutError:
+            if not scope.expired():
+                raise
+            raise self._miss(stage) from None
+
+    def _miss(self, stage: str) -> DeadlineExceeded:
+        """Count a missed deadline and build its exception"""
+        self.stats.misses[stage] = self.stats.misses.get(stage, 0) + 1
+        return DeadlineExceeded(stage)
@@ -1,28 +1,97 @@
 """Telegram Bot Handlers"""
-from typing import List
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import io
 import os
 import tempfile
+import uuid
 from datetime import datetime
-from telegram import Update
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Message, Update, Voice
+from telegram.error import BadRequest
 from telegram.ext import ContextTypes
 from loguru import logger
 
+from src.services.voice.admission import STTOverloadedError
 from src.services.voice.stt_service import STTService
 from src.services.voice.tts_service import TTSService
+from src.services.voice.voice_format import VoiceFormatError, is_ogg_opus
 from src.services.nlp.nlp_service import NLPService
+from src.services.nlp.datetime_parser import RussianDateTimeParser
 from src.services.calendar.aggregator import CalendarAggregator
-from src.services.calendar.models import Event, Intent
+from src.services.calendar.prefetch import CalendarPrefetch, CalendarPrefetcher
+from src.services.calendar.models import Command, Event, Intent
+from .deadline import Deadline, DeadlineExceeded, DeadlineStats
+from .pipeline import Stage, StagedPipeline
+from .progress import ProgressMessage, ProgressStats
+from .rendering import PageStore, event_blocks, paginate, render_events
+from .reply_policy import ReplyDecision, ReplyMode, ReplyPolicy
+from .update_processor import FairUpdateProcessor
+from .voice_file_cache import VoiceFileIdCache
+
+
+@dataclass
+class VoiceJob:
+    """One voice message and the results of its processing stages"""
+    update: Update
+    context: ContextTypes.DEFAULT_TYPE
+    deadline: Deadline = field(default_factory=lambda: Deadline(None))
+    progress: Optional[ProgressMessage] = None
+    prefetch: Optional[CalendarPrefetch] = None
+    notice: str = ""
+    audio: Optional[memoryview] = None
+    temp_path: Optional[str] = None
+    text: Optional[str] = None
+    command: Optional[Command] = None
+    response_text: str = ""
+    events: List[Event] = field(default_factory=list)
+    events_context: str = ""
+    decision: Optional[ReplyDecision] = None
+    reply_audio: Optional[bytes] = None
+
+    @property
+    def voice(self) -> Voice:
+        """Voice attachment of the message"""
+        return self.update.message.voice
+
+    def discard_download(self):
+        """Drop downloaded audio and remove its temporary file"""
+        self.audio = None
+        if self.temp_path is not None:
+            os.unlink(self.temp_path)
+            self.temp_path = None
 
 
 class BotHandlers:
     """Telegram bot handlers for voice calendar"""
 
+    # Share of the remaining request budget each voice stage may use
+    STAGE_BUDGET_SHARES = {"download": 0.25, "stt": 0.6, "nlp": 0.5, "calendar": 0.6, "tts": 1.0}
+
+    # Calendar answers kept for replies when the calendar misses its deadline
+    RECENT_EVENTS_SIZE = 100
+
+    # callback_data prefix of the "show more" button under long replies
+    SHOW_MORE_CALLBACK = "more:"
+
     def __init__(
         self,
         stt_service: STTService,
         tts_service: TTSService,
         nlp_service: NLPService,
-        calendar_aggregator: CalendarAggregator
+        calendar_aggregator: CalendarAggregator,
+        datetime_parser: Optional[RussianDateTimeParser] = None,
+        max_in_memory_voice_bytes: int = 10 * 1024 * 1024,
+        voice_file_cache: Optional[VoiceFileIdCache] = None,
+        reply_policy: Optional[ReplyPolicy] = None,
+        calendar_prefetcher: Optional[CalendarPrefetcher] = None,
+        stage_workers: Optional[Dict[str, int]] = None,
+        stage_queue_size: int = 16,
+        deadline_seconds: Optional[float] = None,
+        deadline_per_audio_second: float = 0.0,
+        page_store: Optional[PageStore] = None,
+        eager_pages: int = 3
     ):
         """
         Initialize bot handlers
@@ -32,11 +101,44 @@ class BotHandlers:
             tts_service: Text-to-speech service
             nlp_service: NLP command parser
             calendar_aggregator: Calendar aggregator
+            datetime_parser: Parser for event times (default: Moscow timezone)
+            max_in_memory_voice_bytes: Larger voice files are downloaded to disk
+            voice_file_cache: Telegram file_id cache for repeated voice replies
+            reply_policy: Chooses voice, spoken summary or text replies
+            calendar_prefetcher: Fetches likely calendar windows during STT
+            stage_workers: Workers per voice stage (see voice_stages()); when
+                given, voice messages run through a staged pipeline that must
+                be started, otherwise stages run inline one after another
+            stage_queue_size: Jobs waiting for each stage before upstream blocks
+            deadline_seconds: Time budget of one voice message (None: unlimited)
+            deadline_per_audio_second: Budget added per second of voice, so
+                long (chunked) messages get time to be transcribed
+            page_store: Unsent pages of long replies
+            eager_pages: Pages of a long reply sent right away; the rest
+                wait behind a "show more" button
         """
         self.stt_service = stt_service
         self.tts_service = tts_service
         self.nlp_service = nlp_service
         self.calendar_aggregator = calendar_aggregator
+        self.datetime_parser = datetime_parser or RussianDateTimeParser()
+        self.max_in_memory_voice_bytes = max_in_memory_voice_bytes
+        self.voice_file_cache = voice_file_cache or VoiceFileIdCache()
+        self.reply_policy = reply_policy or ReplyPolicy()
+        self.progress_stats = ProgressStats()
+        self.calendar_prefetcher = calendar_prefetcher
+        self.deadline_seconds = deadline_seconds
+        self.deadline_per_audio_second = deadline_per_audio_second
+        self.deadline_stats = DeadlineStats()
+        self.page_store = page_store or PageStore()
+        self.eager_pages = max(1, eager_pages)
+        self._recent_events: "OrderedDict[tuple, Tuple[Tuple[str, List[Event], str], datetime]]" = OrderedDict()
+        self.voice_pipeline: Optional[StagedPipeline] = None
+        if stage_workers is not None:
+            self.voice_pipeline = StagedPipeline([
+                Stage(name, handler, workers=stage_workers.get(name, 1), queue_size=stage_queue_size)
+                for name, handler in self.voice_stages()
+            ])
 
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """
@@ -85,6 +187,8 @@ class BotHandlers:
 
 📝 Формат ответа:
 Я отвечу голосовым сообщением со списком ваших событий.
+Длинные списки я кратко озвучиваю и присылаю текстом.
+/reply voice | summary | text | auto - выбрать формат ответа
 
 💡 Советы:
 • Говорите четко и не спешите
@@ -96,6 +200,22 @@ class BotHandlers:
         await update.message.reply_text(help_message)
         logger.info(f"User {update.effective_user.id} requested help")
 
+    def voice_stages(self) -> List[Tuple[str, Callable[[VoiceJob], Awaitable[None]]]]:
+        """
+        Voice message processing steps in order
+
+        Returns:
+            (stage name, handler) pairs
+        """
+        return [
+            ("download", self._download_stage),
+            ("stt", self._stt_stage),
+            ("nlp", self._nlp_stage),
+            ("calendar", self._calendar_stage),
+            ("tts", self._tts_stage),
+            ("send", self._send_stage),
+        ]
+
     async def voice_message_handler(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """
         Handle voice messages
@@ -107,51 +227,417 @@ class BotHandlers:
         user_id = update.effective_user.id
         logger.info(f"Received voice message from user {user_id}")
 
+        # One status message, sent and edited without blocking the pipeline;
+        # most commands ask about today or tomorrow: fetch them while STT runs
+        job = VoiceJob(
+            update=update,
+            context=context,
+            deadline=self._voice_deadline(update, context),
+            progress=ProgressMessage(update.message, stats=self.progress_stats),
+            prefetch=self.calendar_prefetcher.start(user_id) if self.calendar_prefetcher else None
+        )
+
         try:
-            # Download voice message
-            voice = update.message.voice
-            voice_file = await context.bot.get_file(voice.file_id)
+            job.progress.start("🎤 Распознаю голосовое сообщение...")
+            if self.voice_pipeline is not None:
+                await self.voice_pipeline.run(job)
+            else:
+                for _, stage in self.voice_stages():
+                    await stage(job)
 
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".ogg") as temp_file:
-                temp_path = temp_file.name
-                await voice_file.download_to_drive(temp_path)
+        except DeadlineExceeded as e:
+            logger.warning(f"Voice message from user {user_id} not recognized in time: {e}")
+            await update.message.reply_text(
+                "⏱ Не успел распознать голосовое сообщение. Попробуйте еще раз."
+            )
 
-            logger.info(f"Voice file downloaded: {temp_path}")
+        except STTOverloadedError as e:
+            logger.warning(f"Voice message from user {user_id} rejected: {e}")
+            await update.message.reply_text(
+                "⏳ Сейчас слишком много голосовых сообщений. Попробуйте через минуту."
+            )
 
-            # Step 1: Speech-to-Text
-            await update.message.reply_text("🎤 Распознаю голосовое сообщение...")
-            text = await self.stt_service.transcribe(temp_path, language="ru")
-            logger.info(f"Transcribed text: {text}")
+        except Exception as e:
+            logger.error(f"Error processing voice message: {e}")
+            await update.message.reply_text(
+                "❌ Произошла ошибка при обработке голосового сообщения. Попробуйте еще раз."
+            )
 
-            # Clean up temp file
-            os.unlink(temp_path)
+        finally:
+            # The answer replaces the status message
+            job.discard_download()
+            if job.prefetch:
+                job.prefetch.close()
+            await job.progress.finish()
 
-            # Step 2: Parse command with NLP
-            command = await self.nlp_service.parse(text)
-            logger.info(f"Parsed command: intent={command.intent.value}, confidence={command.confidence}")
+    def _voice_deadline(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> Deadline:
+        """
+        Deadline of a voice message, counted from the update's arrival
 
-            # Step 3: Execute command
-            response_text = await self._execute_command(command)
+        The budget grows with the length of the voice note: long messages
+        are transcribed in chunks and would otherwise always run out of
+        time in STT.
+
+        Args:
+            update: Telegram update
+            context: Telegram context
+
+        Returns:
+            Deadline of the message
+        """
+        budget = self.deadline_seconds
+        if budget is not None:
+            budget += (update.message.voice.duration or 0) * self.deadline_per_audio_second
+
+        processor = context.application.update_processor
+        started = processor.arrival_time(update) if isinstance(processor, FairUpdateProcessor) else None
+        return Deadline(budget, stats=self.deadline_stats, started=started)
+
+    async def _download_stage(self, job: VoiceJob):
+        """
+        Download voice message within its deadline share
+
+        Args:
+            job: Voice job
+
+        Raises:
+            DeadlineExceeded: If the download does not finish in time
+        """
+        await job.deadline.run("download", self._download_voice(job), self.STAGE_BUDGET_SHARES["download"])
+
+    async def _download_voice(self, job: VoiceJob):
+        """
+        Download voice message unless its transcription is cached
+
+        Already transcribed voice notes (e.g., forwarded ones) are served
+        from the STT cache without downloading. Others are downloaded into
+        memory; files larger than max_in_memory_voice_bytes go to a
+        temporary file, removed after STT or by job.discard_download().
+
+        Args:
+            job: Voice job
+        """
+        voice = job.voice
+        cached = await self.stt_service.get_cached_transcription(voice.file_unique_id, language="ru")
+        if cached is not None:
+            job.text = cached
+            return
 
-            # Step 4: Try to send voice response
+        voice_file = await job.context.bot.get_file(voice.file_id)
+
+        if (voice.file_size or 0) > self.max_in_memory_voice_bytes:
+            with tempfile.NamedTemporaryFile(delete=False, suffix=".ogg") as temp_file:
+                job.temp_path = temp_file.name
+            await voice_file.download_to_drive(job.temp_path)
+            logger.info(f"Voice file downloaded: {job.temp_path}")
+            return
+
+        buffer = io.BytesIO()
+        await voice_file.download_to_memory(out=buffer)
+        logger.info(f"Voice file downloaded to memory ({buffer.tell()} bytes)")
+        job.audio = buffer.getbuffer()
+
+    async def _stt_stage(self, job: VoiceJob):
+        """
+        Transcribe downloaded voice, passing in-memory audio as a memoryview
+
+        Args:
+            job: Voice job
+
+        Raises:
+            DeadlineExceeded: If recognition does not finish in time
+        """
+        if job.text is None:
             try:
-                await update.message.reply_text("🔊 Генерирую ответ...")
-                audio_data = await self.tts_service.synthesize(response_text)
+                if job.temp_path is not None:
+                    transcription = self.stt_service.transcribe(
+                        job.temp_path,
+                        language="ru",
+                        file_unique_id=job.voice.file_unique_id,
+                        duration=job.voice.duration
+                    )
+                else:
+                    transcription = self.stt_service.transcribe_bytes(
+                        job.audio,
+                        filename="voice.ogg",
+                        language="ru",
+                        file_unique_id=job.voice.file_unique_id,
+                        duration=job.voice.duration
+                    )
+                job.text = await job.deadline.run("stt", transcription, self.STAGE_BUDGET_SHARES["stt"])
+            finally:
+                job.discard_download()
+
+        logger.info(f"Transcribed text: {job.text}")
+
+    async def _nlp_stage(self, job: VoiceJob):
+        """
+        Parse transcribed text into a command
 
-                # Try to send voice
-                await update.message.reply_voice(voice=audio_data)
-                logger.info(f"Voice response sent to user {user_id}")
-            except Exception as voice_error:
-                # Fallback to text if voice sending fails
-                logger.warning(f"Could not send voice message ({voice_error}), sending text instead")
-                await update.message.reply_text(f"📝 {response_text}")
+        Out of time, the intent is guessed from keywords instead.
 
-        except Exception as e:
-            logger.error(f"Error processing voice message: {e}")
-            await update.message.reply_text(
-                "❌ Произошла ошибка при обработке голосового сообщения. Попробуйте еще раз."
+        Args:
+            job: Voice job
+        """
+        job.progress.update("📅 Проверяю календарь...")
+        try:
+            job.command = await job.deadline.run(
+                "nlp", self.nlp_service.parse(job.text), self.STAGE_BUDGET_SHARES["nlp"]
             )
+        except DeadlineExceeded:
+            job.command = self._keyword_command(job.text)
+            self.deadline_stats.degraded += 1
+            logger.warning(f"NLP missed its deadline, guessed intent {job.command.intent.value}")
+        logger.info(f"Parsed command: intent={job.command.intent.value}, confidence={job.command.confidence}")
+
+    async def _calendar_stage(self, job: VoiceJob):
+        """
+        Execute command and choose voice, spoken summary or text reply
+
+        Out of time, the last answer to the same query today is repeated
+        with a note (without one the user is asked to retry), and the
+        reply is sent as text. Event creation is never cut short: a
+        cancelled CalDAV write may still create the event, so it runs to
+        completion and its result is reported.
+
+        Args:
+            job: Voice job
+        """
+        key = self._events_key(job.command)
+        user_id = job.update.effective_user.id
+        work = self._run_command(job.command, job.prefetch)
+        try:
+            if job.command.intent == Intent.CREATE_EVENT:
+                result = await work
+            else:
+                result = await job.deadline.run("calendar", work, self.STAGE_BUDGET_SHARES["calendar"])
+        except DeadlineExceeded:
+            self.deadline_stats.degraded += 1
+            logger.warning(f"Calendar missed its deadline for user {user_id}, replying with stale data")
+            job.notice, (job.response_text, job.events, job.events_context) = self._stale_events(key)
+            job.decision = ReplyDecision(ReplyMode.TEXT)
+            return
+
+        if key is not None:
+            self._remember_events(key, result)
+        job.response_text, job.events, job.events_context = result
+        job.decision = self.reply_policy.decide(user_id, job.response_text, job.events, job.events_context)
+        logger.info(f"Reply mode for user {user_id}: {job.decision.mode.value}")
+
+    async def _tts_stage(self, job: VoiceJob):
+        """
+        Synthesize spoken reply; on failure the reply falls back to text
+
+        Args:
+            job: Voice job
+        """
+        if job.decision.mode == ReplyMode.TEXT:
+            return
+
+        try:
+            job.progress.update("🔊 Генерирую ответ...")
+            async with self.reply_policy.synthesis():
+                job.reply_audio = await job.deadline.run(
+                    "tts", self.tts_service.synthesize(job.decision.spoken_text), self.STAGE_BUDGET_SHARES["tts"]
+                )
+        except DeadlineExceeded:
+            self.deadline_stats.degraded += 1
+            logger.warning("TTS missed its deadline, sending text instead")
+        except Exception as e:
+            logger.warning(f"Could not synthesize voice reply ({e}), sending text instead")
+
+    async def _send_stage(self, job: VoiceJob):
+        """
+        Send voice and/or text reply
+
+        Args:
+            job: Voice job
+        """
+        update = job.update
+        blocks = self._reply_blocks(
+            job.response_text, job.events, job.events_context, notice=job.notice, prefix="📝 "
+        )
+
+        if job.reply_audio is None:
+            await self._reply_text(update.message, blocks)
+            return
+
+        try:
+            await self._send_voice(update, job.reply_audio)
+            logger.info(f"Voice response sent to user {update.effective_user.id}")
+        except Exception as voice_error:
+            # Fallback to text if voice sending fails
+            logger.warning(f"Could not send voice message ({voice_error}), sending text instead")
+            await self._reply_text(update.message, blocks)
+            return
+
+        if job.decision.sends_text:
+            await self._reply_text(update.message, blocks)
+
+    def _reply_blocks(
+        self,
+        response_text: str,
+        events: List[Event],
+        events_context: str,
+        notice: str = "",
+        prefix: str = ""
+    ) -> Iterator[str]:
+        """
+        Text blocks of a reply: notice, then the event list or plain response
+
+        Args:
+            response_text: Reply text
+            events: Events behind the reply (rendered lazily instead of the text)
+            events_context: Context string of the events
+            notice: Line shown before the reply
+            prefix: Prepended to the first block
+
+        Returns:
+            Iterator over text blocks
+        """
+        blocks = event_blocks(events, events_context) if events else iter([response_text])
+        if notice:
+            blocks = chain([notice], blocks)
+        return chain([prefix + next(blocks)], blocks)
+
+    async def _reply_text(self, message: Message, blocks: Iterable[str]):
+        """
+        Send text reply page by page as pages are rendered
+
+        The first `eager_pages` pages go out one after another without
+        waiting for the rest to render; further pages wait behind a
+        "show more" button on the last page sent.
+
+        Args:
+            message: Message to reply to
+            blocks: Text blocks of the reply
+        """
+        pages = paginate(blocks)
+        page = next(pages, "")
+        for sent in range(1, self.eager_pages + 1):
+            following = next(pages, None)
+            if following is None:
+                await message.reply_text(page)
+                return
+            if sent == self.eager_pages:
+                token = self.page_store.add(following, pages)
+                await message.reply_text(page, reply_markup=self._show_more_markup(token))
+                return
+            await message.reply_text(page)
+            page = following
+
+    def _show_more_markup(self, token: str) -> InlineKeyboardMarkup:
+        """Inline "show more" button for the pages stored under token"""
+        return InlineKeyboardMarkup([[
+            InlineKeyboardButton("Показать ещё", callback_data=f"{self.SHOW_MORE_CALLBACK}{token}")
+        ]])
+
+    async def show_more_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """
+        Handle "show more" button: send the next page of a long reply
+
+        Pages come from the page store, so the calendar is not queried again.
+
+        Args:
+            update: Telegram update with callback query
+            context: Telegram context
+        """
+        query = update.callback_query
+        token = query.data[len(self.SHOW_MORE_CALLBACK):]
+        result = self.page_store.take(token)
+
+        # The button is used up either way; the next page gets its own
+        try:
+            await query.edit_message_reply_markup(reply_markup=None)
+        except BadRequest as e:
+            logger.debug(f"Could not remove show more button: {e}")
+
+        if result is None:
+            await query.answer("Список устарел, спросите еще раз.")
+            return
+
+        await query.answer()
+        page, has_more = result
+        if has_more:
+            await query.message.reply_text(page, reply_markup=self._show_more_markup(token))
+        else:
+            await query.message.reply_text(page)
+
+    def _keyword_command(self, text: str) -> Command:
+        """
+        Guess query intent from keywords when NLP is out of time
+
+        Args:
+            text: Transcribed text
+
+        Returns:
+            GET_TOMORROW, GET_TODAY or UNKNOWN command with zero confidence
+        """
+        lowered = text.lower()
+        if "завтра" in lowered:
+            intent = Intent.GET_TOMORROW
+        elif "сегодня" in lowered:
+            intent = Intent.GET_TODAY
+        else:
+            intent = Intent.UNKNOWN
+        return Command(intent=intent, parameters={}, original_text=text, confidence=0.0)
+
+    def _events_key(self, command: Command) -> Optional[tuple]:
+        """Key of a calendar query for stale answers (None for non-queries)"""
+        if command.intent not in (Intent.GET_TODAY, Intent.GET_TOMORROW, Intent.GET_UPCOMING, Intent.FIND_MEETING):
+            return None
+        # "Today" of the user, not of the server
+        today = datetime.now(self.datetime_parser.tz).date()
+        return command.intent, repr(sorted(command.parameters.items())), today
+
+    def _remember_events(self, key: tuple, result: Tuple[str, List[Event], str]):
+        """Keep calendar answer for replies when the calendar is late"""
+        self._recent_events[key] = (result, datetime.now())
+        self._recent_events.move_to_end(key)
+        while len(self._recent_events) > self.RECENT_EVENTS_SIZE:
+            self._recent_events.popitem(last=False)
+
+    def _stale_events(self, key: Optional[tuple]) -> Tuple[str, Tuple[str, List[Event], str]]:
+        """Notice and last answer to the same query today, or a retry request"""
+        cached = self._recent_events.get(key) if key is not None else None
+        if cached is None:
+            return "", ("⏱ Календарь не ответил вовремя. Попробуйте еще раз через минуту.", [], "")
+
+        result, fetched_at = cached
+        return f"⏱ Календарь не ответил вовремя, данные на {fetched_at.strftime('%H:%M')}.", result
+
+    async def _send_voice(self, update: Update, audio_data: bytes):
+        """
+        Send voice reply, reusing Telegram file_id for repeated audio
+
+        Args:
+            update: Telegram update
+            audio_data: Synthesized audio
+
+        Raises:
+            VoiceFormatError: If audio is not OGG/Opus (nothing is uploaded)
+        """
+        if not is_ogg_opus(audio_data):
+            raise VoiceFormatError("Synthesized audio is not OGG/Opus")
+
+        key = self.voice_file_cache.audio_key(audio_data)
+        file_id = self.voice_file_cache.get(key)
+
+        if file_id is not None:
+            try:
+                await update.message.reply_voice(voice=file_id)
+                self.voice_file_cache.stats.reused += 1
+                return
+            except BadRequest as e:
+                logger.warning(f"Cached voice file_id rejected ({e}), uploading audio")
+                self.voice_file_cache.invalidate(key)
+
+        message = await update.message.reply_voice(voice=audio_data)
+        self.voice_file_cache.stats.uploaded += 1
+
+        voice = getattr(message, "voice", None)
+        if voice is not None and voice.file_id:
+            self.voice_file_cache.set(key, voice.file_id)
 
     async def text_message_handler(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """
@@ -171,10 +657,10 @@ class BotHandlers:
             logger.info(f"Parsed command: intent={command.intent.value}")
 
             # Execute command
-            response_text = await self._execute_command(command)
+            response_text, events, events_context = await self._run_command(command)
 
             # Send text response
-            await update.message.reply_text(response_text)
+            await self._reply_text(update.message, self._reply_blocks(response_text, events, events_context))
 
         except Exception as e:
             logger.error(f"Error processing text message: {e}")
@@ -182,6 +668,41 @@ class BotHandlers:
                 "❌ Произошла ошибка при обработке сообщения. Попробуйте еще раз."
             )
 
+    async def reply_mode_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """
+        Handle /reply command (preferred reply format)
+
+        Args:
+            update: Telegram update
+            context: Telegram context
+        """
+        user_id = update.effective_user.id
+        modes = {
+            "voice": ReplyMode.VOICE,
+            "summary": ReplyMode.SUMMARY_VOICE,
+            "text": ReplyMode.TEXT,
+            "auto": None,
+        }
+        descriptions = {
+            ReplyMode.VOICE: "голосом целиком",
+            ReplyMode.SUMMARY_VOICE: "кратко голосом и списком текстом",
+            ReplyMode.TEXT: "только текстом",
+            None: "автоматически",
+        }
+
+        arg = context.args[0].lower() if context.args else ""
+        if arg not in modes:
+            current = descriptions[self.reply_policy.get_preference(user_id)]
+            await update.message.reply_text(
+                f"Сейчас я отвечаю {current}.\n"
+                "Использование: /reply voice | summary | text | auto"
+            )
+            return
+
+        self.reply_policy.set_preference(user_id, modes[arg])
+        await update.message.reply_text(f"✅ Буду отвечать {descriptions[modes[arg]]}.")
+        logger.info(f"User {user_id} set reply mode: {arg}")
+
     async def _execute_command(self, command) -> str:
         """
         Execute parsed command
@@ -192,82 +713,128 @@ class BotHandlers:
         Returns:
             Response text
 
+        Raises:
+            Exception: If command execution fails
+        """
+        response_text, _, _ = await self._run_command(command)
+        return response_text
+
+    async def _run_command(
+        self,
+        command,
+        prefetch: Optional[CalendarPrefetch] = None
+    ) -> Tuple[str, List[Event], str]:
+        """
+        Execute parsed command, keeping the events behind the reply
+
+        Args:
+            command: Parsed command object
+            prefetch: Calendar windows fetched speculatively during STT
+
+        Returns:
+            Response text, listed events and their context string
+
         Raises:
             Exception: If command execution fails
         """
         try:
             if command.intent == Intent.GET_TODAY:
-                events = await self.calendar_aggregator.get_today_events()
-                return self._format_events_response(events, "на сегодня")
+                events = await prefetch.today() if prefetch else None
+                if events is None:
+                    events = await self.calendar_aggregator.get_today_events()
+                return self._format_events_response(events, "на сегодня"), events, "на сегодня"
 
             elif command.intent == Intent.GET_TOMORROW:
-                events = await self.calendar_aggregator.get_tomorrow_events()
-                return self._format_events_response(events, "на завтра")
+                events = await prefetch.tomorrow() if prefetch else None
+                if events is None:
+                    events = await self.calendar_aggregator.get_tomorrow_events()
+                return self._format_events_response(events, "на завтра"), events, "на завтра"
 
             elif command.intent == Intent.GET_UPCOMING:
                 hours = command.parameters.get("hours", 24)
-                events = await self.calendar_aggregator.get_upcoming_events(hours=hours)
-                return self._format_events_response(events, f"в ближайшие {hours} часов")
+                events_context = f"в ближайшие {hours} часов"
+                events = await prefetch.upcoming(hours) if prefetch else None
+                if events is None:
+                    events = await self.calendar_aggregator.get_upcoming_events(hours=hours)
+                return self._format_events_response(events, events_context), events, events_context
 
             elif command.intent == Intent.FIND_MEETING:
                 person = command.parameters.get("person", "")
                 events = await self.calendar_aggregator.find_meetings_with_person(person=person)
                 if events:
-                    return self._format_events_response(events, f"встречи с {person}")
+                    events_context = f"встречи с {person}"
+                    return self._format_events_response(events, events_context), events, events_context
                 else:
-                    return f"Встреч с {person} не найдено."
+                    return f"Встреч с {person} не найдено.", [], ""
 
             elif command.intent == Intent.CREATE_EVENT:
-                title = command.parameters.get("title", "Новая встреча")
-                time_str = command.parameters.get("time", "")
-
-                logger.info(f"Creating event: title='{title}', time='{time_str}'")
-
-                # For now, return a message that we received the request
-                # TODO: Parse time and actually create the event
-                return f"Функция создания встреч находится в разработке.\n\nЯ получил запрос:\nНазвание: {title}\nВремя: {time_str}\n\nПока вы можете создать встречу вручную в календаре."
+                return await self._create_event(command), [], ""
 
             elif command.intent == Intent.UNKNOWN:
-                return "Извините, я не понял вашу команду. Попробуйте сказать: 'Что сегодня в календаре?'"
+                return "Извините, я не понял вашу команду. Попробуйте сказать: 'Что сегодня в календаре?'", [], ""
 
             else:
-                return "Эта команда пока не поддерживается."
+                return "Эта команда пока не поддерживается.", [], ""
 
         except Exception as e:
             logger.error(f"Error executing command: {e}")
             raise
 
-    def _format_events_response(self, events: List[Event], context: str = "") -> str:
+    async def _create_event(self, command) -> str:
         """
-        Format events into text response
+        Create calendar event from CREATE_EVENT command
+
+        Time is resolved locally from the 'time' parameter, falling back
+        to the original utterance, so no extra LLM call is needed.
 
         Args:
-            events: List of events
-            context: Context string (e.g., "на сегодня")
+            command: Parsed CREATE_EVENT command
 
         Returns:
-            Formatted response text
+            Response text
         """
-        if not events:
-            if context:
-                return f"У вас нет событий {context}. Вы свободны!"
-            else:
-                return "У вас нет событий. Вы свободны!"
+        title = command.parameters.get("title") or "Новая встреча"
+        time_str = command.parameters.get("time") or ""
+
+        logger.info(f"Creating event: title='{title}', time='{time_str}'")
 
-        response = f"У вас {len(events)} событий {context}:\n\n" if context else f"Найдено событий: {len(events)}\n\n"
+        time_range = self.datetime_parser.parse(time_str) if time_str else None
+        if time_range is None:
+            time_range = self.datetime_parser.parse(command.original_text)
 
-        for i, event in enumerate(events, 1):
-            start_time = event.start.strftime("%H:%M")
-            end_time = event.end.strftime("%H:%M")
-            response += f"{i}. {event.title}\n"
-            response += f"   Время: {start_time} - {end_time}\n"
+        if time_range is None:
+            return f"Не удалось распознать время для встречи «{title}». Скажите, например: 'Создай встречу завтра в три'."
 
-            if event.attendees:
-                response += f"   Участники: {len(event.attendees)}\n"
+        if time_range.past:
+            past_time = time_range.start.strftime("%d.%m.%Y, %H:%M")
+            return f"Время {past_time} уже прошло, встреча «{title}» не создана. Назовите время позже."
 
-            if event.location:
-                response += f"   Место: {event.location}\n"
+        event = Event(
+            id=str(uuid.uuid4()),
+            title=title,
+            start=time_range.start,
+            end=time_range.end,
+            attendees=[],
+            source="",
+            raw_data={}
+        )
 
-            response += "\n"
+        created = await self.calendar_aggregator.create_event(event)
 
-        return response.strip()
+        date_str = created.start.strftime("%d.%m.%Y")
+        start_time = created.start.strftime("%H:%M")
+        end_time = created.end.strftime("%H:%M")
+        return f"Встреча «{created.title}» создана на {date_str}, {start_time} - {end_time}."
+
+    def _format_events_response(self, events: List[Event], context: str = "") -> str:
+        """
+        Format events into text response
+
+        Args:
+            events: List of events
+            context: Context string (e.g., "на сегодня")
+
+        Returns:
+            Formatted response text
+        """
+        return render_events(events, context)
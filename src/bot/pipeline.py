@@ -0,0 +1,209 @@
+"""Staged pipeline with a worker pool and bounded queue per stage"""
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Optional
+import asyncio
+import time
+from loguru import logger
+
+
+@dataclass
+class StageStats:
+    """Counters for one pipeline stage"""
+    processed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    queue_wait_seconds: float = 0.0
+    backpressure_seconds: float = 0.0
+    peak_queue: int = 0
+
+    @property
+    def average_queue_wait_ms(self) -> float:
+        """Average time a job waited in the stage queue"""
+        jobs = self.processed + self.failed
+        return self.queue_wait_seconds / jobs * 1000 if jobs else 0.0
+
+
+class Stage:
+    """
+    One pipeline step: a handler run by a fixed number of workers
+
+    The handler receives the job object and updates it in place; raising
+    fails the job. Jobs wait for a worker in a bounded queue, and
+    backpressure_seconds counts how long the previous stage (or the
+    caller, for the first stage) waited for room in that queue.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[Any], Awaitable[None]],
+        workers: int = 1,
+        queue_size: int = 16
+    ):
+        """
+        Initialize stage
+
+        Args:
+            name: Stage name used in logs
+            handler: Coroutine function processing one job
+            workers: Jobs processed concurrently
+            queue_size: Jobs waiting before upstream blocks
+
+        Raises:
+            ValueError: If workers or queue_size is not positive
+        """
+        if workers < 1:
+            raise ValueError(f"Stage {name}: workers must be a positive integer")
+        if queue_size < 1:
+            raise ValueError(f"Stage {name}: queue_size must be a positive integer")
+
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.stats = StageStats()
+
+    def throughput(self, elapsed: float) -> float:
+        """Jobs completed per second"""
+        return self.stats.processed / elapsed if elapsed > 0 else 0.0
+
+    def utilization(self, elapsed: float) -> float:
+        """Fraction of worker time spent processing jobs"""
+        return self.stats.busy_seconds / (self.workers * elapsed) if elapsed > 0 else 0.0
+
+
+class StagedPipeline:
+    """
+    Runs jobs through stages, each with its own concurrency
+
+    A job passes the stages in order; a stage worker hands it to the next
+    stage's queue and blocks while that queue is full. A slow stage thus
+    fills its queue, stalls the workers before it and finally run(), so
+    intake slows down instead of jobs accumulating in memory. A failing
+    stage fails the job and run() raises its exception.
+    """
+
+    def __init__(self, stages: List[Stage]):
+        """
+        Initialize pipeline
+
+        Args:
+            stages: Stages in processing order
+
+        Raises:
+            ValueError: If no stages are given
+        """
+        if not stages:
+            raise ValueError("Pipeline needs at least one stage")
+        self.stages = stages
+
+        self._workers: List[asyncio.Task] = []
+        self._started: Optional[float] = None
+        self._stopped: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether workers are started"""
+        return bool(self._workers)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds the pipeline has been (or was) running"""
+        if self._started is None:
+            return 0.0
+        return (self._stopped or time.perf_counter()) - self._started
+
+    async def start(self):
+        """Start stage workers"""
+        if self.running:
+            return
+        self._started = time.perf_counter()
+        self._stopped = None
+        for index, stage in enumerate(self.stages):
+            for _ in range(stage.workers):
+                self._workers.append(asyncio.create_task(self._work(index)))
+        logger.info(
+            "Pipeline started: " + ", ".join(f"{stage.name}×{stage.workers}" for stage in self.stages)
+        )
+
+    async def stop(self):
+        """Stop workers; jobs in progress or queued are cancelled"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._stopped = time.perf_counter()
+
+        for stage in self.stages:
+            while not stage.queue.empty():
+                _, done, _ = stage.queue.get_nowait()
+                done.cancel()
+
+    async def run(self, job: Any) -> Any:
+        """
+        Process job through all stages
+
+        Waits while the first stage's queue is full.
+
+        Args:
+            job: Job object passed to every stage handler
+
+        Returns:
+            The processed job
+
+        Raises:
+            RuntimeError: If the pipeline is not started
+            Exception: Whatever the failing stage raised
+        """
+        if not self.running:
+            raise RuntimeError("Pipeline is not started")
+
+        done = asyncio.get_running_loop().create_future()
+        await self._put(self.stages[0], job, done)
+        return await done
+
+    async def _put(self, stage: Stage, job: Any, done: asyncio.Future):
+        """Queue job for stage, recording time spent waiting for room"""
+        waited = time.perf_counter()
+        await stage.queue.put((job, done, time.perf_counter()))
+        now = time.perf_counter()
+        stage.stats.backpressure_seconds += now - waited
+        stage.stats.peak_queue = max(stage.stats.peak_queue, stage.queue.qsize())
+
+    async def _work(self, index: int):
+        """Worker loop of one stage"""
+        stage = self.stages[index]
+        next_stage = self.stages[index + 1] if index + 1 < len(self.stages) else None
+
+        while True:
+            job, done, queued = await stage.queue.get()
+            try:
+                # The caller gave up (cancelled) or an earlier stage already failed the job
+                if done.done():
+                    continue
+
+                started = time.perf_counter()
+                stage.stats.queue_wait_seconds += started - queued
+                try:
+                    await stage.handler(job)
+                except Exception as e:
+                    stage.stats.failed += 1
+                    if not done.done():
+                        done.set_exception(e)
+                    continue
+                finally:
+                    stage.stats.busy_seconds += time.perf_counter() - started
+
+                stage.stats.processed += 1
+                if next_stage is None:
+                    if not done.done():
+                        done.set_result(job)
+                else:
+                    await self._put(next_stage, job, done)
+
+            except asyncio.CancelledError:
+                done.cancel()
+                raise
+
+            finally:
+                stage.queue.task_done()
@@ -0,0 +1,116 @@
+"""Single status message edited in place while a request is processed"""
+from dataclasses import dataclass
+from typing import Optional
+import asyncio
+from telegram import Message
+from loguru import logger
+
+
+@dataclass
+class ProgressStats:
+    """Counters for status message updates"""
+    sent: int = 0
+    edited: int = 0
+    deleted: int = 0
+    failed: int = 0
+
+
+class ProgressMessage:
+    """
+    Status message that never blocks the work it describes
+
+    The message is sent and edited in background tasks, so Telegram
+    round trips overlap with STT, NLP and TTS. Updates issued while an
+    earlier one is in flight are coalesced: only the latest text is
+    shown. finish() removes the status message once the answer is out;
+    if the answer was ready before the status was even sent, the status
+    is skipped.
+    """
+
+    def __init__(self, message: Message, stats: Optional[ProgressStats] = None):
+        """
+        Initialize progress message
+
+        Args:
+            message: User message to reply to
+            stats: Shared counters (default: own counters)
+        """
+        self.message = message
+        self.stats = stats or ProgressStats()
+
+        self._status: Optional[Message] = None
+        self._sending = False
+        self._shown: Optional[str] = None
+        self._pending: Optional[str] = None
+        self._send_task: Optional[asyncio.Task] = None
+        self._edit_task: Optional[asyncio.Task] = None
+
+    def start(self, text: str):
+        """
+        Send status message in the background
+
+        Args:
+            text: Initial status text
+        """
+        self._pending = text
+        self._send_task = asyncio.create_task(self._send(text))
+
+    def update(self, text: str):
+        """
+        Show new status text in the background
+
+        Args:
+            text: Status text
+        """
+        if self._send_task is None:
+            self.start(text)
+            return
+
+        self._pending = text
+        if self._edit_task is None or self._edit_task.done():
+            self._edit_task = asyncio.create_task(self._flush())
+
+    async def finish(self):
+        """Wait for pending updates and delete the status message"""
+        self._pending = None
+        if self._send_task is not None and not self._sending:
+            self._send_task.cancel()
+
+        tasks = [task for task in (self._send_task, self._edit_task) if task is not None]
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self._status is None:
+            return
+        try:
+            await self._status.delete()
+            self.stats.deleted += 1
+        except Exception as e:
+            self.stats.failed += 1
+            logger.debug(f"Could not delete status message: {e}")
+        self._status = None
+
+    async def _send(self, text: str):
+        """Send initial status message"""
+        self._sending = True
+        try:
+            self._status = await self.message.reply_text(text)
+            self._shown = text
+            self.stats.sent += 1
+        except Exception as e:
+            self.stats.failed += 1
+            logger.debug(f"Could not send status message: {e}")
+
+    async def _flush(self):
+        """Edit status message until it shows the latest text"""
+        await asyncio.wait([self._send_task])
+
+        while self._status is not None and self._pending is not None and self._pending != self._shown:
+            text = self._pending
+            try:
+                await self._status.edit_text(text)
+                self._shown = text
+                self.stats.edited += 1
+            except Exception as e:
+                self.stats.failed += 1
+                logger.debug(f"Could not edit status message: {e}")
+                return
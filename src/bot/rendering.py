@@ -0,0 +1,199 @@
+"""Event list rendering split into Telegram-sized pages"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Tuple
+import uuid
+
+from src.services.calendar.models import Event
+from src.services.voice.phrase_library import events_word
+
+# Telegram rejects longer text messages
+TELEGRAM_MESSAGE_LIMIT = 4096
+
+BLOCK_SEPARATOR = "\n\n"
+
+
+def format_event(index: int, event: Event) -> str:
+    """
+    Render one event as a block of lines
+
+    Args:
+        index: Position in the list (1-based)
+        event: Calendar event
+
+    Returns:
+        Event block without trailing newline
+    """
+    lines = [
+        f"{index}. {event.title}",
+        f"   Время: {event.start.strftime('%H:%M')} - {event.end.strftime('%H:%M')}",
+    ]
+    if event.attendees:
+        lines.append(f"   Участники: {len(event.attendees)}")
+    if event.location:
+        lines.append(f"   Место: {event.location}")
+    return "\n".join(lines)
+
+
+def event_blocks(events: List[Event], context: str = "") -> Iterator[str]:
+    """
+    Header and event blocks of a reply, rendered lazily
+
+    Args:
+        events: List of events
+        context: Context string (e.g., "на сегодня")
+
+    Yields:
+        Header, then one block per event
+    """
+    if not events:
+        yield f"У вас нет событий {context}. Вы свободны!" if context else "У вас нет событий. Вы свободны!"
+        return
+
+    count = len(events)
+    yield f"У вас {count} {events_word(count)} {context}:" if context else f"Найдено событий: {count}"
+    for index, event in enumerate(events, 1):
+        yield format_event(index, event)
+
+
+def render_events(events: List[Event], context: str = "") -> str:
+    """
+    Render the whole event list as one text
+
+    Args:
+        events: List of events
+        context: Context string (e.g., "на сегодня")
+
+    Returns:
+        Reply text
+    """
+    return BLOCK_SEPARATOR.join(event_blocks(events, context))
+
+
+def paginate(blocks: Iterable[str], limit: int = TELEGRAM_MESSAGE_LIMIT) -> Iterator[str]:
+    """
+    Join blocks into pages no longer than limit
+
+    Pages break only between blocks; a single block longer than the
+    limit is cut and ends with an ellipsis. Blocks are consumed only as
+    far as the pages taken, so unread pages cost nothing.
+
+    Args:
+        blocks: Text blocks in order
+        limit: Maximum page length in characters
+
+    Yields:
+        Pages of text
+    """
+    parts: List[str] = []
+    length = 0
+
+    for block in blocks:
+        if len(block) > limit:
+            block = block[:limit - 1] + "…"
+
+        added = len(block) + (len(BLOCK_SEPARATOR) if parts else 0)
+        if parts and length + added > limit:
+            yield BLOCK_SEPARATOR.join(parts)
+            parts, length = [], 0
+            added = len(block)
+
+        parts.append(block)
+        length += added
+
+    if parts:
+        yield BLOCK_SEPARATOR.join(parts)
+
+
+@dataclass
+class PageStoreStats:
+    """Counters for paged replies"""
+    paged_replies: int = 0
+    continuations: int = 0
+    expired: int = 0
+
+
+class PageStore:
+    """
+    Unsent pages of long replies, awaiting a "show more" press
+
+    The rest of a reply is kept as a lazy page iterator under a short
+    token that fits into callback_data, so showing more neither queries
+    the calendar again nor renders pages nobody asks for. The oldest
+    replies are dropped beyond max_entries.
+    """
+
+    def __init__(self, max_entries: int = 1000):
+        """
+        Initialize page store
+
+        Args:
+            max_entries: Replies with unsent pages kept
+        """
+        self.max_entries = max_entries
+        self.stats = PageStoreStats()
+        self._pages: "OrderedDict[str, Tuple[str, Iterator[str]]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def add(self, next_page: str, pages: Iterator[str]) -> str:
+        """
+        Keep remaining pages of a reply
+
+        Args:
+            next_page: Page shown on the next press
+            pages: Pages after that
+
+        Returns:
+            Token identifying the reply
+        """
+        token = uuid.uuid4().hex[:16]
+        self._pages[token] = (next_page, pages)
+        self.stats.paged_replies += 1
+        while len(self._pages) > self.max_entries:
+            self._pages.popitem(last=False)
+        return token
+
+    def take(self, token: str) -> Optional[Tuple[str, bool]]:
+        """
+        Take the next page of a reply
+
+        Args:
+            token: Token returned by add()
+
+        Returns:
+            Page and whether more pages follow, or None if unknown/expired
+        """
+        entry = self._pages.pop(token, None)
+        if entry is None:
+            self.stats.expired += 1
+            return None
+
+        page, pages = entry
+        following = next(pages, None)
+        if following is not None:
+            self._pages[token] = (following, pages)
+        self.stats.continuations += 1
+        return page, following is not None
+
+
+def first_page(blocks: Iterable[str], store: PageStore, limit: int = TELEGRAM_MESSAGE_LIMIT) -> Tuple[str, Optional[str]]:
+    """
+    Render the first page, keeping the rest in the store
+
+    Args:
+        blocks: Text blocks of the reply
+        store: Store for the remaining pages
+        limit: Maximum page length in characters
+
+    Returns:
+        First page and token of the remaining pages (None if it fits)
+    """
+    pages = paginate(blocks, limit)
+    page = next(pages, "")
+    following = next(pages, None)
+    if following is None:
+        return page, None
+    return page, store.add(following, pages)
+
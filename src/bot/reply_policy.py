@@ -0,0 +1,195 @@
+"""Choice between voice, spoken summary and text replies"""
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, List, Optional
+
+from src.services.calendar.models import Event
+from src.services.voice.phrase_library import events_word
+
+
+class ReplyMode(Enum):
+    """How a reply is delivered"""
+    VOICE = "voice"
+    SUMMARY_VOICE = "summary"
+    TEXT = "text"
+
+
+@dataclass
+class ReplyDecision:
+    """Chosen delivery of one reply"""
+    mode: ReplyMode
+    spoken_text: Optional[str] = None
+
+    @property
+    def sends_text(self) -> bool:
+        """Whether the full text is sent as a message"""
+        return self.mode != ReplyMode.VOICE
+
+
+@dataclass
+class ReplyPolicyStats:
+    """Counters of chosen reply modes"""
+    voice: int = 0
+    summary: int = 0
+    text: int = 0
+    load_downgrades: int = 0
+
+
+def summarize_events(events: List[Event], context: str = "") -> str:
+    """
+    Build short spoken summary of an event list
+
+    Deterministic and template-based, so no LLM call is needed.
+
+    Args:
+        events: Events in chronological order
+        context: Context string (e.g., "на сегодня")
+
+    Returns:
+        Summary text
+    """
+    count = len(events)
+    suffix = f" {context}" if context else ""
+    first = events[0]
+
+    if count == 1:
+        return f"У вас 1 событие{suffix}: «{first.title}» в {first.start.strftime('%H:%M')}."
+
+    last = events[-1]
+    return (
+        f"У вас {count} {events_word(count)}{suffix}. "
+        f"Первое — «{first.title}» в {first.start.strftime('%H:%M')}, "
+        f"последнее — «{last.title}» в {last.start.strftime('%H:%M')}. "
+        f"Полный список — в сообщении."
+    )
+
+
+class ReplyPolicy:
+    """
+    Decides how a command result is delivered
+
+    Short replies are spoken in full. Long agendas get a spoken summary
+    plus the full list as text, and under TTS load replies degrade to
+    summary and then to text only. A per-user preference overrides the
+    size rules.
+    """
+
+    def __init__(
+        self,
+        max_voice_events: int = 3,
+        max_voice_chars: int = 600,
+        summary_queue_depth: int = 4,
+        text_queue_depth: int = 8
+    ):
+        """
+        Initialize reply policy
+
+        Args:
+            max_voice_events: More events are summarized instead of read out
+            max_voice_chars: Longer replies are summarized or sent as text
+            summary_queue_depth: Active syntheses at which replies are summarized
+            text_queue_depth: Active syntheses at which replies are sent as text
+        """
+        self.max_voice_events = max_voice_events
+        self.max_voice_chars = max_voice_chars
+        self.summary_queue_depth = summary_queue_depth
+        self.text_queue_depth = text_queue_depth
+        self.stats = ReplyPolicyStats()
+
+        self._preferences: Dict[int, ReplyMode] = {}
+        self._active_syntheses = 0
+
+    @property
+    def active_syntheses(self) -> int:
+        """Replies being synthesized right now"""
+        return self._active_syntheses
+
+    @asynccontextmanager
+    async def synthesis(self):
+        """Track one running synthesis (TTS queue depth)"""
+        self._active_syntheses += 1
+        try:
+            yield
+        finally:
+            self._active_syntheses -= 1
+
+    def get_preference(self, user_id: int) -> Optional[ReplyMode]:
+        """Preferred mode of user (None means automatic)"""
+        return self._preferences.get(user_id)
+
+    def set_preference(self, user_id: int, mode: Optional[ReplyMode]):
+        """
+        Store preferred mode of user
+
+        Args:
+            user_id: Telegram user ID
+            mode: Preferred mode, or None for automatic choice
+        """
+        if mode is None:
+            self._preferences.pop(user_id, None)
+        else:
+            self._preferences[user_id] = mode
+
+    def decide(
+        self,
+        user_id: int,
+        text: str,
+        events: Optional[List[Event]] = None,
+        context: str = ""
+    ) -> ReplyDecision:
+        """
+        Choose reply mode
+
+        Args:
+            user_id: Telegram user ID
+            text: Full reply text
+            events: Events the reply lists (empty for other replies)
+            context: Context string of the event list
+
+        Returns:
+            Reply decision
+        """
+        decision = self._choose(self.get_preference(user_id), text, events or [], context)
+
+        if decision.mode == ReplyMode.VOICE:
+            self.stats.voice += 1
+        elif decision.mode == ReplyMode.SUMMARY_VOICE:
+            self.stats.summary += 1
+        else:
+            self.stats.text += 1
+        return decision
+
+    def _choose(
+        self,
+        preference: Optional[ReplyMode],
+        text: str,
+        events: List[Event],
+        context: str
+    ) -> ReplyDecision:
+        """Apply preference, load and size rules"""
+        def summary() -> ReplyDecision:
+            if events:
+                return ReplyDecision(ReplyMode.SUMMARY_VOICE, summarize_events(events, context))
+            return ReplyDecision(ReplyMode.TEXT)
+
+        if preference == ReplyMode.TEXT:
+            return ReplyDecision(ReplyMode.TEXT)
+        if preference == ReplyMode.VOICE:
+            return ReplyDecision(ReplyMode.VOICE, text)
+        if preference == ReplyMode.SUMMARY_VOICE:
+            return summary() if events else ReplyDecision(ReplyMode.VOICE, text)
+
+        if self._active_syntheses >= self.text_queue_depth:
+            self.stats.load_downgrades += 1
+            return ReplyDecision(ReplyMode.TEXT)
+
+        too_long = len(events) > self.max_voice_events or len(text) > self.max_voice_chars
+        if self._active_syntheses >= self.summary_queue_depth and events:
+            if not too_long:
+                self.stats.load_downgrades += 1
+            return summary()
+
+        if too_long:
+            return summary()
+        return ReplyDecision(ReplyMode.VOICE, text)
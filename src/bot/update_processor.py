@@ -0,0 +1,235 @@
+"""Concurrent update processing with per-user ordering"""
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Deque, Dict, Hashable, Optional
+import asyncio
+import itertools
+import time
+from telegram import Update
+from telegram.ext import BaseUpdateProcessor
+
+from src.services.stats import percentile
+
+
+@dataclass
+class UpdateProcessorStats:
+    """Counters for update scheduling"""
+    processed: int = 0
+    queued: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    peak_pending: int = 0
+
+    @property
+    def average_wait_ms(self) -> float:
+        """Average wait of updates that had to queue"""
+        return self.wait_seconds / self.queued * 1000 if self.queued else 0.0
+
+
+class FairUpdateProcessor(BaseUpdateProcessor):
+    """
+    Runs updates of different users concurrently, each user's in order
+
+    Every user has a FIFO queue and at most one update in progress, so a
+    second voice message waits for the reply to the first. Up to
+    `max_concurrent` users are served at once; users with waiting
+    updates take turns round-robin, so one user sending many messages
+    cannot starve others. Updates without a user run without ordering.
+
+    PTB's own semaphore (`max_pending`) only bounds how many updates may
+    be queued or running in total.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 8,
+        max_pending: int = 256,
+        wait_window_size: int = 200
+    ):
+        """
+        Initialize update processor
+
+        Args:
+            max_concurrent: Maximum updates processed at once
+            max_pending: Maximum updates queued or running
+            wait_window_size: Number of recent waits kept for percentiles
+
+        Raises:
+            ValueError: If a limit is not positive
+        """
+        super().__init__(max_pending)
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be a positive integer")
+        self.max_concurrent = max_concurrent
+        self.stats = UpdateProcessorStats()
+
+        self._queues: Dict[Hashable, Deque[asyncio.Future]] = {}
+        self._ready: Deque[Hashable] = deque()
+        self._running = set()
+        self._pending = 0
+        self._anonymous = itertools.count()
+        self._recent_waits = deque(maxlen=wait_window_size)
+        self._arrivals: Dict[int, float] = {}
+
+    @property
+    def active(self) -> int:
+        """Updates being processed"""
+        return len(self._running)
+
+    @property
+    def pending(self) -> int:
+        """Updates queued or being processed"""
+        return self._pending
+
+    def stamp_arrival(self, update: object):
+        """
+        Record when an update entered the bot
+
+        Called at ingress (see ArrivalStampingQueue). Updates that were not
+        stamped get their arrival time when processing is requested.
+
+        Args:
+            update: Incoming update
+        """
+        self._arrivals.setdefault(id(update), time.monotonic())
+
+    def arrival_time(self, update: object) -> Optional[float]:
+        """
+        When an update entered the bot, before waiting for its turn
+
+        Handlers start request deadlines from it, so time spent in the
+        update queue, behind PTB's `max_pending` semaphore and behind the
+        user's earlier messages counts against the budget.
+
+        Args:
+            update: Update being processed
+
+        Returns:
+            time.monotonic() of arrival, or None for unknown updates
+        """
+        return self._arrivals.get(id(update))
+
+    def wait_percentile_ms(self, q: float = 95.0) -> float:
+        """Queue wait percentile over recent updates"""
+        return percentile(list(self._recent_waits), q) * 1000
+
+    async def initialize(self) -> None:
+        """Nothing to allocate"""
+
+    async def shutdown(self) -> None:
+        """Cancel updates still waiting for their turn"""
+        for waiters in self._queues.values():
+            for waiter in waiters:
+                waiter.cancel()
+
+    async def do_process_update(self, update: object, coroutine: "Awaitable[Any]") -> None:
+        """
+        Wait for the user's turn and a free slot, then process the update
+
+        Args:
+            update: Telegram update
+            coroutine: Handler coroutine for the update
+        """
+        self.stamp_arrival(update)
+        key = self._user_key(update)
+        waiter = asyncio.get_running_loop().create_future()
+        queue = self._queues.setdefault(key, deque())
+        queue.append(waiter)
+        if len(queue) == 1 and key not in self._running:
+            self._ready.append(key)
+
+        self._pending += 1
+        self.stats.peak_pending = max(self.stats.peak_pending, self._pending)
+        enqueued = time.perf_counter()
+        self._dispatch()
+
+        queued = not waiter.done()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            self._pending -= 1
+            self._arrivals.pop(id(update), None)
+            if waiter.done() and not waiter.cancelled():
+                self._release(key)
+            else:
+                self._forget(key, waiter)
+            if asyncio.iscoroutine(coroutine):
+                coroutine.close()
+            raise
+
+        wait = time.perf_counter() - enqueued
+        self._recent_waits.append(wait)
+        if queued:
+            self.stats.queued += 1
+            self.stats.wait_seconds += wait
+            self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, wait)
+
+        try:
+            await coroutine
+        finally:
+            self._pending -= 1
+            self._arrivals.pop(id(update), None)
+            self.stats.processed += 1
+            self._release(key)
+
+    def _user_key(self, update: object) -> Hashable:
+        """Ordering key: user, else chat, else unique per update"""
+        if isinstance(update, Update):
+            if update.effective_user is not None:
+                return ("user", update.effective_user.id)
+            if update.effective_chat is not None:
+                return ("chat", update.effective_chat.id)
+        return ("update", next(self._anonymous))
+
+    def _dispatch(self):
+        """Start updates of ready users while slots are free"""
+        while len(self._running) < self.max_concurrent and self._ready:
+            key = self._ready.popleft()
+            waiter = self._queues[key].popleft()
+            self._running.add(key)
+            waiter.set_result(None)
+
+    def _release(self, key: Hashable):
+        """Finish user's update; user queues again behind other users"""
+        self._running.discard(key)
+        if self._queues.get(key):
+            self._ready.append(key)
+        else:
+            self._queues.pop(key, None)
+        self._dispatch()
+
+    def _forget(self, key: Hashable, waiter: asyncio.Future):
+        """Remove cancelled waiter from user's queue"""
+        queue = self._queues.get(key)
+        if queue is None or waiter not in queue:
+            return
+        queue.remove(waiter)
+        if not queue:
+            del self._queues[key]
+            if key in self._ready:
+                self._ready.remove(key)
+
+
+class ArrivalStampingQueue(asyncio.Queue):
+    """
+    Application update queue that stamps arrival times
+
+    Polling and the webhook server both put updates here, so the stamp
+    is taken before the update waits for the application or for PTB's
+    concurrency semaphore.
+    """
+
+    def __init__(self, processor: FairUpdateProcessor):
+        """
+        Initialize queue
+
+        Args:
+            processor: Processor that keeps the arrival times
+        """
+        super().__init__()
+        self.processor = processor
+
+    def put_nowait(self, item: Any) -> None:
+        """Stamp arrival and enqueue (put() delegates here)"""
+        self.processor.stamp_arrival(item)
+        super().put_nowait(item)
@@ -0,0 +1,73 @@
+"""Reuse of Telegram file_id values for uploaded voice replies"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+import hashlib
+
+
+@dataclass
+class VoiceFileCacheStats:
+    """Counters for voice file_id reuse"""
+    reused: int = 0
+    uploaded: int = 0
+    invalidated: int = 0
+
+
+class VoiceFileIdCache:
+    """
+    LRU mapping from audio content hash to Telegram file_id
+
+    After the first upload of a reply, Telegram returns a file_id that
+    can be sent instead of the audio. Ids rejected by Telegram are
+    invalidated and the audio is uploaded again.
+    """
+
+    def __init__(self, max_entries: int = 1000):
+        """
+        Initialize file_id cache
+
+        Args:
+            max_entries: Maximum number of remembered uploads
+        """
+        self.max_entries = max_entries
+        self.stats = VoiceFileCacheStats()
+
+        self._file_ids: "OrderedDict[str, str]" = OrderedDict()
+
+    @staticmethod
+    def audio_key(audio: bytes) -> str:
+        """Content hash of audio"""
+        return hashlib.sha256(audio).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up file_id for audio
+
+        Args:
+            key: Audio key from audio_key
+
+        Returns:
+            Telegram file_id or None
+        """
+        file_id = self._file_ids.get(key)
+        if file_id is not None:
+            self._file_ids.move_to_end(key)
+        return file_id
+
+    def set(self, key: str, file_id: str):
+        """
+        Remember file_id returned after upload
+
+        Args:
+            key: Audio key from audio_key
+            file_id: Telegram file_id of the uploaded voice
+        """
+        self._file_ids[key] = file_id
+        self._file_ids.move_to_end(key)
+        while len(self._file_ids) > self.max_entries:
+            self._file_ids.popitem(last=False)
+
+    def invalidate(self, key: str):
+        """Forget file_id rejected by Telegram"""
+        if self._file_ids.pop(key, None) is not None:
+            self.stats.invalidated += 1
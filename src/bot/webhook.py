@@ -0,0 +1,160 @@
+"""aiohttp server receiving Telegram updates by webhook"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+import hmac
+from aiohttp import web
+from telegram import Update
+from telegram.ext import Application
+from loguru import logger
+
+SECRET_TOKEN_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+
+
+@dataclass
+class WebhookStats:
+    """Counters for webhook requests"""
+    received: int = 0
+    duplicates: int = 0
+    rejected: int = 0
+    overloaded: int = 0
+    accepted: int = 0
+
+
+class WebhookServer:
+    """
+    Receives updates over HTTPS POST and hands them to the application
+
+    Requests without the configured secret token are rejected. Updates
+    are put on the application's update queue, exactly like polled ones,
+    so concurrency and per-user ordering come from its update processor;
+    Telegram is acknowledged without waiting for STT/TTS. update_ids seen
+    recently are dropped, since Telegram redelivers updates whose
+    acknowledgement was lost. When the update processor already holds
+    `max_pending` updates, the request fails with 503 and Telegram
+    retries later. De-duplication is per process: behind a load balancer
+    each replica only sees the redeliveries routed to it.
+    """
+
+    def __init__(
+        self,
+        application: Application,
+        secret_token: str,
+        path: str = "/telegram",
+        host: str = "0.0.0.0",
+        port: int = 8080,
+        max_pending: int = 100,
+        dedup_size: int = 10000
+    ):
+        """
+        Initialize webhook server
+
+        Args:
+            application: Initialized Telegram application with handlers
+            secret_token: Expected X-Telegram-Bot-Api-Secret-Token value
+            path: URL path of the webhook endpoint
+            host: Interface to listen on
+            port: Port to listen on
+            max_pending: Updates queued or running before requests are refused
+            dedup_size: Recent update_ids remembered for de-duplication
+        """
+        self.application = application
+        self.secret_token = secret_token
+        self.path = path
+        self.host = host
+        self.port = port
+        self.max_pending = max_pending
+        self.dedup_size = dedup_size
+        self.stats = WebhookStats()
+
+        self._seen: "OrderedDict[int, None]" = OrderedDict()
+        self._runner: Optional[web.AppRunner] = None
+
+    def create_app(self) -> web.Application:
+        """
+        Create aiohttp application with webhook and health routes
+
+        Returns:
+            aiohttp Application
+        """
+        app = web.Application()
+        app.router.add_post(self.path, self.handle_update)
+        app.router.add_get("/healthz", self.handle_health)
+        return app
+
+    async def start(self):
+        """Listen for webhook requests"""
+        self._runner = web.AppRunner(self.create_app())
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info(f"Webhook server listening on {self.host}:{self.port}{self.path}")
+
+    async def stop(self):
+        """Stop accepting requests (queued updates are finished by the application)"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def handle_update(self, request: web.Request) -> web.Response:
+        """
+        Verify, de-duplicate and queue one update
+
+        Args:
+            request: Webhook request from Telegram
+
+        Returns:
+            200 when accepted or duplicate, 403 on bad secret, 400 on bad
+            payload, 503 when too many updates are pending
+        """
+        token = request.headers.get(SECRET_TOKEN_HEADER, "")
+        if not hmac.compare_digest(token.encode(), self.secret_token.encode()):
+            self.stats.rejected += 1
+            logger.warning(f"Webhook request with invalid secret token from {request.remote}")
+            return web.Response(status=403)
+
+        try:
+            update = Update.de_json(await request.json(), self.application.bot)
+        except Exception as e:
+            self.stats.rejected += 1
+            logger.warning(f"Invalid webhook payload: {e}")
+            return web.Response(status=400)
+
+        if update is None:
+            self.stats.rejected += 1
+            return web.Response(status=400)
+
+        self.stats.received += 1
+        if update.update_id in self._seen:
+            self.stats.duplicates += 1
+            logger.debug(f"Duplicate update {update.update_id} dropped")
+            return web.Response()
+
+        if self.pending >= self.max_pending:
+            self.stats.overloaded += 1
+            logger.warning(f"Too many pending updates, update {update.update_id} will be redelivered")
+            return web.Response(status=503)
+
+        await self.application.update_queue.put(update)
+        self._remember(update.update_id)
+        self.stats.accepted += 1
+        return web.Response()
+
+    async def handle_health(self, request: web.Request) -> web.Response:
+        """Health check for load balancers"""
+        return web.json_response({
+            "status": "ok",
+            "pending": self.pending,
+            "accepted": self.stats.accepted,
+        })
+
+    @property
+    def pending(self) -> int:
+        """Updates queued in the application or in its update processor"""
+        processor_pending = getattr(self.application.update_processor, "pending", 0)
+        return self.application.update_queue.qsize() + processor_pending
+
+    def _remember(self, update_id: int):
+        """Add update_id to the de-duplication window"""
+        self._seen[update_id] = None
+        while len(self._seen) > self.dedup_size:
+            self._seen.popitem(last=False)
@@ -1,7 +1,7 @@
 """Configuration management using Pydantic Settings"""
 from pydantic_settings import BaseSettings
 from pydantic import Field
-from typing import Optional
+from typing import Literal, Optional
 
 
 class Config(BaseSettings):
@@ -10,9 +10,86 @@ class Config(BaseSettings):
     # Telegram Bot
     telegram_bot_token: str = Field(..., description="Telegram Bot Token")
     log_level: str = Field(default="INFO", description="Logging level")
+    timezone: str = Field(default="Europe/Moscow", description="User timezone for date/time parsing")
+    update_max_concurrent: int = Field(default=64, description="Updates processed concurrently (one at a time per user)")
+    update_max_pending: int = Field(default=256, description="Updates queued or running before new ones wait (webhook answers 503)")
+    bot_mode: Literal["polling", "webhook"] = Field(default="polling", description="How updates are received")
+    webhook_url: Optional[str] = Field(default=None, description="Public HTTPS URL registered with Telegram (webhook mode)")
+    webhook_secret_token: Optional[str] = Field(default=None, description="Secret token Telegram sends with every webhook request")
+    webhook_path: str = Field(default="/telegram", description="Webhook endpoint path")
+    webhook_host: str = Field(default="0.0.0.0", description="Webhook server interface")
+    webhook_port: int = Field(default=8080, description="Webhook server port")
+    webhook_max_connections: int = Field(default=40, description="Concurrent connections Telegram may open to the webhook")
+    webhook_drop_pending_updates: bool = Field(default=False, description="Drop updates queued at Telegram when registering the webhook (done by every replica on start)")
 
     # OpenAI
     openai_api_key: str = Field(..., description="OpenAI API Key")
+    openai_max_connections: int = Field(default=20, description="OpenAI connection pool size")
+    openai_max_keepalive_connections: int = Field(default=10, description="OpenAI idle connections kept open")
+    openai_http2: bool = Field(default=False, description="Use HTTP/2 for OpenAI requests (requires h2)")
+    openai_connect_timeout: float = Field(default=5.0, description="OpenAI connect timeout (seconds)")
+    openai_read_timeout: float = Field(default=60.0, description="OpenAI read timeout (seconds)")
+    openai_keepalive_ping_interval: float = Field(default=30.0, description="OpenAI keep-alive ping interval (seconds, 0 disables)")
+    openai_hedging_enabled: bool = Field(default=False, description="Hedge slow Whisper/GPT requests")
+    openai_hedge_percentile: float = Field(default=90.0, description="Latency percentile used as hedge delay")
+    openai_hedge_max_ratio: float = Field(default=0.1, description="Maximum fraction of requests that may be hedged")
+
+    # Voice processing
+    reply_max_voice_events: int = Field(default=3, description="Longer agendas get a spoken summary plus text list")
+    reply_max_voice_chars: int = Field(default=600, description="Longer replies are not read out in full")
+    reply_summary_queue_depth: int = Field(default=4, description="Active syntheses at which replies are summarized")
+    reply_text_queue_depth: int = Field(default=8, description="Active syntheses at which replies are sent as text only")
+    reply_eager_pages: int = Field(default=3, description="Pages of a long text reply sent at once; the rest wait behind a show more button")
+    pipeline_download_workers: int = Field(default=8, description="Concurrent voice downloads")
+    pipeline_stt_workers: int = Field(default=8, description="Concurrent speech recognitions")
+    pipeline_nlp_workers: int = Field(default=8, description="Concurrent command parses")
+    pipeline_calendar_workers: int = Field(default=8, description="Concurrent calendar queries")
+    pipeline_tts_workers: int = Field(default=4, description="Concurrent reply syntheses")
+    pipeline_send_workers: int = Field(default=8, description="Concurrent reply uploads")
+    voice_deadline_seconds: float = Field(default=20.0, description="Time budget of one voice message; late stages degrade (0 disables)")
+    voice_deadline_per_audio_second: float = Field(default=0.25, description="Budget added per second of voice, so long messages get time to transcribe")
+    pipeline_queue_size: int = Field(default=16, description="Voice messages waiting per stage before earlier stages block")
+    voice_file_id_cache_size: int = Field(default=1000, description="Uploaded voice replies remembered for file_id reuse")
+    voice_max_in_memory_bytes: int = Field(default=10 * 1024 * 1024, description="Voice files above this size are buffered on disk")
+    audio_workers: int = Field(default=2, description="Worker processes shared by audio decoding and encoding (ffmpeg)")
+    stt_preprocess_enabled: bool = Field(default=False, description="Trim silence and re-encode audio before Whisper (requires ffmpeg)")
+    stt_preprocess_format: str = Field(default="opus", description="Preprocessed audio format: opus or flac")
+    stt_backend: str = Field(default="whisper_api", description="STT backend: whisper_api, local or stub")
+    stt_local_routing_enabled: bool = Field(default=False, description="Route short audio to local STT when the API is backed up (requires faster-whisper)")
+    stt_local_model: str = Field(default="base", description="Local Whisper model size")
+    stt_local_workers: int = Field(default=1, description="Worker processes for local STT")
+    stt_local_max_duration: float = Field(default=10.0, description="Longest audio routed to local STT (seconds)")
+    stt_local_queue_depth: int = Field(default=4, description="In-flight API requests that trigger local routing (0 = always for short audio)")
+    stt_max_concurrent: int = Field(default=8, description="Maximum concurrent transcriptions")
+    stt_max_queue_size: int = Field(default=50, description="Voice messages waiting for transcription before rejecting new ones")
+    stt_max_queue_wait: float = Field(default=30.0, description="Maximum wait for a transcription slot (seconds)")
+    stt_chunking_enabled: bool = Field(default=False, description="Split long voice messages and transcribe chunks in parallel (requires ffmpeg)")
+    stt_chunk_seconds: float = Field(default=20.0, description="Maximum chunk length for parallel transcription (seconds)")
+    stt_chunk_concurrency: int = Field(default=4, description="Concurrent Whisper requests per chunked message")
+    tts_parallel_enabled: bool = Field(default=False, description="Synthesize long replies as parallel segments (loudness normalization requires ffmpeg)")
+    tts_max_concurrency: int = Field(default=3, description="Concurrent ElevenLabs requests per reply")
+    tts_segment_max_chars: int = Field(default=250, description="Preferred maximum TTS segment length")
+    tts_parallel_min_chars: int = Field(default=300, description="Shorter replies are synthesized in one request")
+    tts_phrase_library_enabled: bool = Field(default=False, description="Assemble agenda replies from pre-rendered phrase fragments")
+    tts_output_format: str = Field(default="opus_48000_32", description="ElevenLabs output format (opus_* is sent as voice without transcoding)")
+    tts_opus_enabled: bool = Field(default=True, description="Encode voice replies as OGG/Opus (ffmpeg is needed for non-Opus output formats)")
+    tts_opus_bitrate: str = Field(default="32k", description="Opus bitrate for voice replies")
+    tts_max_connections: int = Field(default=10, description="Pooled HTTP connections to ElevenLabs")
+    tts_cache_enabled: bool = Field(default=True, description="Cache synthesized replies")
+    tts_cache_memory_bytes: int = Field(default=20 * 1024 * 1024, description="TTS cache memory tier size (bytes)")
+    tts_cache_dir: Optional[str] = Field(default="/app/data/tts_cache", description="TTS cache disk tier directory (empty disables)")
+    tts_cache_disk_bytes: int = Field(default=200 * 1024 * 1024, description="TTS cache disk tier size (bytes)")
+    stt_cache_enabled: bool = Field(default=True, description="Cache transcriptions of repeated voice messages")
+    stt_cache_max_entries: int = Field(default=1000, description="Transcriptions kept in memory")
+    stt_cache_ttl_seconds: int = Field(default=7 * 24 * 3600, description="Transcription cache entry lifetime (seconds)")
+    stt_cache_max_disk_entries: int = Field(default=50000, description="Transcriptions kept on disk (least recently used are removed)")
+    stt_cache_dir: Optional[str] = Field(default=None, description="Directory for on-disk transcription cache (e.g., /app/data/stt_cache)")
+
+    # NLP batching
+    nlp_batching_enabled: bool = Field(default=False, description="Batch concurrent NLP parse requests")
+    nlp_batch_max_size: int = Field(default=8, description="Maximum utterances per NLP batch request")
+    nlp_batch_max_wait_ms: float = Field(default=10.0, description="Maximum wait before flushing an NLP batch (ms)")
+    nlp_batch_min_queue_depth: int = Field(default=2, description="In-flight NLP requests before batching starts")
 
     # ElevenLabs
     elevenlabs_api_key: str = Field(..., description="ElevenLabs API Key")
@@ -28,6 +105,11 @@ class Config(BaseSettings):
     google_calendar_token_path: str = Field(default="token.json", description="Google Calendar Token Path")
     google_calendar_ics_url: Optional[str] = Field(default=None, description="Google Calendar ICS URL")
 
+    # Calendar prefetch
+    calendar_prefetch_enabled: bool = Field(default=True, description="Fetch today and tomorrow while a voice message is recognized")
+    calendar_prefetch_interval: float = Field(default=30.0, description="Minimum time between prefetches of one user (seconds)")
+    calendar_prefetch_max_in_flight: int = Field(default=20, description="Maximum concurrent prefetch requests")
+
     # Yandex Tracker
     yandex_tracker_token: Optional[str] = Field(default=None, description="Yandex Tracker OAuth Token")
     yandex_tracker_org_id: Optional[str] = Field(default=None, description="Yandex Tracker Organization ID")
@@ -1,16 +1,37 @@
 """Main Bot Application"""
 import asyncio
-from telegram.ext import Application, CommandHandler, MessageHandler, filters
+from typing import Optional
+from telegram.ext import Application, CallbackQueryHandler, CommandHandler, MessageHandler, filters
 from loguru import logger
 
 from src.config import Config
+from src.services.openai_transport import OpenAITransport
+from src.services.hedging import RequestHedger
 from src.services.voice.stt_service import STTService
 from src.services.voice.tts_service import TTSService
+from src.services.voice.elevenlabs_client import ElevenLabsStreamingClient
+from src.services.voice.admission import AdmissionController
+from src.services.voice.audio_stitching import AudioStitcher
+from src.services.voice.audio_processor import AudioPreprocessor
+from src.services.voice.chunking import AudioChunker
+from src.services.voice.stt_backends import STTBackend, STTRouter, create_backend
+from src.services.voice.tts_cache import TTSCache
+from src.services.voice.voice_format import VoiceEncoder, audio_format_of
+from src.services.voice.phrase_library import PhraseLibrary
+from src.services.voice.process_pool import ProcessPool
+from src.services.voice.transcription_cache import TranscriptionCache
 from src.services.nlp.nlp_service import NLPService
+from src.services.nlp.datetime_parser import RussianDateTimeParser
+from src.services.nlp.batcher import NLPBatcher
 from src.services.calendar.yandex_calendar import YandexCalendarProvider
 from src.services.calendar.google_calendar import GoogleCalendarProvider
 from src.services.calendar.aggregator import CalendarAggregator
+from src.services.calendar.prefetch import CalendarPrefetcher
 from src.bot.handlers import BotHandlers
+from src.bot.reply_policy import ReplyPolicy
+from src.bot.voice_file_cache import VoiceFileIdCache
+from src.bot.update_processor import ArrivalStampingQueue, FairUpdateProcessor
+from src.bot.webhook import WebhookServer
 
 
 class BotApplication:
@@ -26,15 +47,151 @@ class BotApplication:
         self.config = config
         logger.info("Initializing Voice Calendar Bot...")
 
+        # Shared OpenAI transport for STT and NLP
+        logger.info("Initializing shared OpenAI transport...")
+        self.openai_transport = OpenAITransport(
+            api_key=config.openai_api_key,
+            max_connections=config.openai_max_connections,
+            max_keepalive_connections=config.openai_max_keepalive_connections,
+            http2=config.openai_http2,
+            connect_timeout=config.openai_connect_timeout,
+            read_timeout=config.openai_read_timeout,
+            keepalive_ping_interval=config.openai_keepalive_ping_interval
+        )
+
+        # Optional hedging of slow OpenAI requests (separate latency windows)
+        self.stt_hedger = self._create_hedger("whisper")
+        self.nlp_hedger = self._create_hedger("gpt")
+
+        # One worker pool bounds ffmpeg processes of all audio components
+        self.audio_pool = ProcessPool(max_workers=config.audio_workers)
+
+        # Optional audio preprocessing before Whisper upload
+        self.audio_preprocessor = None
+        if config.stt_preprocess_enabled:
+            logger.info("Enabling audio preprocessing...")
+            self.audio_preprocessor = AudioPreprocessor(
+                output_format=config.stt_preprocess_format,
+                pool=self.audio_pool
+            )
+
+        # Optional parallel transcription of long voice messages
+        self.audio_chunker = None
+        if config.stt_chunking_enabled:
+            logger.info("Enabling chunked transcription...")
+            self.audio_chunker = AudioChunker(
+                max_chunk_seconds=config.stt_chunk_seconds,
+                pool=self.audio_pool
+            )
+
+        # Cache for repeated (e.g., forwarded) voice messages
+        self.transcription_cache = None
+        if config.stt_cache_enabled:
+            self.transcription_cache = TranscriptionCache(
+                max_entries=config.stt_cache_max_entries,
+                ttl_seconds=config.stt_cache_ttl_seconds,
+                disk_dir=config.stt_cache_dir,
+                max_disk_entries=config.stt_cache_max_disk_entries
+            )
+
         # Initialize services
-        logger.info("Initializing STT service (Whisper)...")
-        self.stt_service = STTService(api_key=config.openai_api_key)
+        logger.info(f"Initializing STT service ({config.stt_backend})...")
+        self.stt_backend = self._create_stt_backend(config.stt_backend)
+        if config.stt_local_routing_enabled and config.stt_backend != "local":
+            try:
+                local_backend = self._create_stt_backend("local")
+            except RuntimeError as e:
+                logger.warning(f"Local STT routing disabled: {e}")
+            else:
+                self.stt_backend = STTRouter(
+                    default=self.stt_backend,
+                    local=local_backend,
+                    local_max_duration=config.stt_local_max_duration,
+                    queue_depth_threshold=config.stt_local_queue_depth
+                )
+
+        # Limit concurrent transcriptions, short voice messages first
+        self.stt_admission = AdmissionController(
+            max_concurrent=config.stt_max_concurrent,
+            max_queue_size=config.stt_max_queue_size,
+            max_wait_seconds=config.stt_max_queue_wait
+        )
+
+        self.stt_service = STTService(
+            api_key=config.openai_api_key,
+            backend=self.stt_backend,
+            admission=self.stt_admission,
+            preprocessor=self.audio_preprocessor,
+            cache=self.transcription_cache,
+            chunker=self.audio_chunker,
+            chunk_concurrency=config.stt_chunk_concurrency
+        )
 
         logger.info("Initializing TTS service (ElevenLabs)...")
-        self.tts_service = TTSService(api_key=config.elevenlabs_api_key)
+        self.tts_cache = None
+        if config.tts_cache_enabled:
+            self.tts_cache = TTSCache(
+                max_memory_bytes=config.tts_cache_memory_bytes,
+                disk_dir=config.tts_cache_dir or None,
+                max_disk_bytes=config.tts_cache_disk_bytes
+            )
+        tts_audio_format = audio_format_of(config.tts_output_format)
+        self.audio_stitcher = None
+        if config.tts_parallel_enabled:
+            logger.info("Enabling parallel TTS synthesis...")
+            self.audio_stitcher = AudioStitcher(audio_format=tts_audio_format, pool=self.audio_pool)
+        # Telegram voice messages must be OGG/Opus: Opus output of ElevenLabs
+        # passes through, other formats are transcoded with ffmpeg
+        self.voice_encoder = None
+        if config.tts_opus_enabled:
+            self.voice_encoder = VoiceEncoder(
+                input_format=tts_audio_format,
+                bitrate=config.tts_opus_bitrate,
+                pool=self.audio_pool
+            )
+        self.elevenlabs_client = ElevenLabsStreamingClient(
+            api_key=config.elevenlabs_api_key,
+            max_connections=config.tts_max_connections
+        )
+        self.tts_service = TTSService(
+            api_key=config.elevenlabs_api_key,
+            cache=self.tts_cache,
+            output_format=config.tts_output_format,
+            stitcher=self.audio_stitcher,
+            max_concurrency=config.tts_max_concurrency,
+            segment_max_chars=config.tts_segment_max_chars,
+            parallel_min_chars=config.tts_parallel_min_chars,
+            voice_encoder=self.voice_encoder,
+            http_client=self.elevenlabs_client
+        )
+
+        # Formulaic replies from pre-rendered fragments, titles via ElevenLabs
+        self.phrase_library = None
+        self._phrase_warmup: Optional[asyncio.Task] = None
+        if config.tts_phrase_library_enabled:
+            logger.info("Enabling phrase fragment library...")
+            self.phrase_library = PhraseLibrary(
+                self.tts_service,
+                stitcher=AudioStitcher(audio_format=tts_audio_format, gap_ms=60, pool=self.audio_pool),
+                max_concurrency=config.tts_max_concurrency
+            )
+            self.tts_service = self.phrase_library
 
         logger.info("Initializing NLP service (GPT-4)...")
-        self.nlp_service = NLPService(api_key=config.openai_api_key)
+        self.nlp_service = NLPService(
+            api_key=config.openai_api_key,
+            client=self.openai_transport.client,
+            hedger=self.nlp_hedger
+        )
+
+        if config.nlp_batching_enabled:
+            logger.info("Enabling NLP micro-batching...")
+            self.nlp_service = NLPBatcher(
+                self.nlp_service,
+                max_batch_size=config.nlp_batch_max_size,
+                max_wait_ms=config.nlp_batch_max_wait_ms,
+                min_queue_depth=config.nlp_batch_min_queue_depth
+            )
 
         # Initialize calendar providers
         logger.info("Initializing Yandex Calendar provider...")
@@ -59,17 +216,92 @@ class BotApplication:
         else:
             logger.info("Google Calendar ICS URL not configured, skipping...")
 
+        self.calendar_prefetcher = None
+        if config.calendar_prefetch_enabled:
+            self.calendar_prefetcher = CalendarPrefetcher(
+                self.calendar_aggregator,
+                min_interval_seconds=config.calendar_prefetch_interval,
+                max_in_flight=config.calendar_prefetch_max_in_flight
+            )
+
         # Initialize bot handlers
         logger.info("Initializing Bot Handlers...")
         self.handlers = BotHandlers(
             stt_service=self.stt_service,
             tts_service=self.tts_service,
             nlp_service=self.nlp_service,
-            calendar_aggregator=self.calendar_aggregator
+            calendar_aggregator=self.calendar_aggregator,
+            datetime_parser=RussianDateTimeParser(timezone=config.timezone),
+            max_in_memory_voice_bytes=config.voice_max_in_memory_bytes,
+            voice_file_cache=VoiceFileIdCache(max_entries=config.voice_file_id_cache_size),
+            reply_policy=ReplyPolicy(
+                max_voice_events=config.reply_max_voice_events,
+                max_voice_chars=config.reply_max_voice_chars,
+                summary_queue_depth=config.reply_summary_queue_depth,
+                text_queue_depth=config.reply_text_queue_depth
+            ),
+            calendar_prefetcher=self.calendar_prefetcher,
+            stage_workers={
+                "download": config.pipeline_download_workers,
+                "stt": config.pipeline_stt_workers,
+                "nlp": config.pipeline_nlp_workers,
+                "calendar": config.pipeline_calendar_workers,
+                "tts": config.pipeline_tts_workers,
+                "send": config.pipeline_send_workers,
+            },
+            stage_queue_size=config.pipeline_queue_size,
+            deadline_seconds=config.voice_deadline_seconds or None,
+            deadline_per_audio_second=config.voice_deadline_per_audio_second,
+            eager_pages=config.reply_eager_pages
         )
 
+        # Created with the Telegram application
+        self.update_processor: Optional[FairUpdateProcessor] = None
+
         logger.info("✅ All services initialized successfully!")
 
+    def _create_stt_backend(self, name: str) -> STTBackend:
+        """
+        Create registered STT backend with options from config
+
+        Args:
+            name: Backend name ('whisper_api', 'local', 'stub', ...)
+
+        Returns:
+            STT backend
+
+        Raises:
+            RuntimeError: If backend dependencies are missing
+        """
+        if name == "whisper_api":
+            return create_backend(name, client=self.openai_transport.client, hedger=self.stt_hedger)
+        if name == "local":
+            return create_backend(
+                name,
+                model_size=self.config.stt_local_model,
+                max_workers=self.config.stt_local_workers
+            )
+        return create_backend(name)
+
+    def _create_hedger(self, name: str) -> Optional[RequestHedger]:
+        """
+        Create request hedger if hedging is enabled
+
+        Args:
+            name: Hedger name for logs
+
+        Returns:
+            RequestHedger or None
+        """
+        if not self.config.openai_hedging_enabled:
+            return None
+
+        return RequestHedger(
+            name=name,
+            percentile=self.config.openai_hedge_percentile,
+            max_hedge_ratio=self.config.openai_hedge_max_ratio
+        )
+
     def create_telegram_app(self) -> Application:
         """
         Create Telegram application
@@ -79,10 +311,18 @@ class BotApplication:
         """
         logger.info("Creating Telegram application...")
 
+        # Different users concurrently, each user's messages in order
+        self.update_processor = FairUpdateProcessor(
+            max_concurrent=self.config.update_max_concurrent,
+            max_pending=self.config.update_max_pending
+        )
+
         # Build application
         application = (
             Application.builder()
             .token(self.config.telegram_bot_token)
+            .concurrent_updates(self.update_processor)
+            .update_queue(ArrivalStampingQueue(self.update_processor))
             .build()
         )
 
@@ -105,6 +345,9 @@ class BotApplication:
         application.add_handler(
             CommandHandler("help", self.handlers.help_command)
         )
+        application.add_handler(
+            CommandHandler("reply", self.handlers.reply_mode_command)
+        )
 
         # Voice message handler
         application.add_handler(
@@ -122,8 +365,23 @@ class BotApplication:
             )
         )
 
+        # "Show more" button under long replies
+        application.add_handler(
+            CallbackQueryHandler(
+                self.handlers.show_more_callback,
+                pattern=f"^{self.handlers.SHOW_MORE_CALLBACK}"
+            )
+        )
+
         logger.info("✅ Bot handlers registered")
 
+    async def run(self):
+        """Run bot in the mode selected by config (polling or webhook)"""
+        if self.config.bot_mode == "webhook":
+            await self.run_webhook()
+        else:
+            await self.run_polling()
+
     async def run_polling(self):
         """Run bot in polling mode"""
         logger.info("Starting bot in polling mode...")
@@ -137,10 +395,9 @@ class BotApplication:
 
             # Start polling
             logger.info("🤖 Bot is running! Press Ctrl+C to stop.")
-            await application.initialize()
-            await application.start()
+            await self._start_application(application)
             await application.updater.start_polling(
-                allowed_updates=["message"],
+                allowed_updates=["message", "callback_query"],
                 drop_pending_updates=True
             )
 
@@ -158,18 +415,193 @@ class BotApplication:
             await application.updater.stop()
             await application.stop()
             await application.shutdown()
+            await self._close_services()
+
+    async def run_webhook(self):
+        """
+        Run bot in webhook mode
+
+        Raises:
+            ValueError: If webhook URL or secret token is not configured
+        """
+        logger.info("Starting bot in webhook mode...")
+
+        if not self.config.webhook_url or not self.config.webhook_secret_token:
+            raise ValueError("WEBHOOK_URL and WEBHOOK_SECRET_TOKEN are required in webhook mode")
+
+        application = self.create_telegram_app()
+        self.setup_handlers(application)
+        server = WebhookServer(
+            application,
+            secret_token=self.config.webhook_secret_token,
+            path=self.config.webhook_path,
+            host=self.config.webhook_host,
+            port=self.config.webhook_port,
+            max_pending=self.config.update_max_pending
+        )
+
+        try:
+            await self._start_application(application)
+            await server.start()
+            await application.bot.set_webhook(
+                url=self.config.webhook_url,
+                secret_token=self.config.webhook_secret_token,
+                allowed_updates=["message", "callback_query"],
+                drop_pending_updates=self.config.webhook_drop_pending_updates,
+                max_connections=self.config.webhook_max_connections
+            )
+
+            # Run until stopped
+            logger.info("🤖 Bot is running! Press Ctrl+C to stop.")
+            await asyncio.Event().wait()
+
+        except KeyboardInterrupt:
+            logger.info("Received stop signal, shutting down...")
+        except Exception as e:
+            logger.error(f"Error running bot: {e}")
+            raise
+        finally:
+            # Cleanup (the webhook stays registered for other replicas)
+            logger.info("Cleaning up...")
+            await server.stop()
+            await application.stop()
+            await application.shutdown()
+            stats = server.stats
+            logger.info(
+                f"Webhook: {stats.accepted} updates accepted, {stats.duplicates} duplicates, "
+                f"{stats.rejected} rejected, {stats.overloaded} overloaded"
+            )
+            await self._close_services()
+
+    async def _start_application(self, application: Application):
+        """
+        Start Telegram application and background services
 
-            # Close service connections
-            if hasattr(self.stt_service, 'close'):
-                await self.stt_service.close()
-            if hasattr(self.tts_service, 'close'):
-                await self.tts_service.close()
-            if hasattr(self.nlp_service, 'close'):
-                await self.nlp_service.close()
-            if hasattr(self.yandex_calendar, 'close'):
-                await self.yandex_calendar.close()
+        Args:
+            application: Telegram Application with handlers
+        """
+        await self.handlers.voice_pipeline.start()
+        await application.initialize()
+        await application.start()
+        self.openai_transport.start()
+        if self.phrase_library:
+            self._phrase_warmup = asyncio.create_task(self.phrase_library.warm_up())
+
+    async def _stop_phrase_warmup(self):
+        """Cancel fragment rendering still running at shutdown"""
+        if self._phrase_warmup is None or self._phrase_warmup.done():
+            return
+        self._phrase_warmup.cancel()
+        try:
+            await self._phrase_warmup
+        except asyncio.CancelledError:
+            pass
+
+    async def _close_services(self):
+        """Close service connections and log service statistics"""
+        pipeline = self.handlers.voice_pipeline
+        await pipeline.stop()
+        for stage in pipeline.stages:
+            stats = stage.stats
+            logger.info(
+                f"Stage {stage.name}: {stats.processed} processed, {stats.failed} failed, "
+                f"{stage.throughput(pipeline.elapsed):.2f}/s, "
+                f"utilization {stage.utilization(pipeline.elapsed):.0%}, "
+                f"queue wait avg {stats.average_queue_wait_ms:.0f}ms, "
+                f"backpressure {stats.backpressure_seconds:.1f}s"
+            )
+        stats = self.handlers.deadline_stats
+        if stats.total_misses:
+            misses = ", ".join(f"{stage} {count}" for stage, count in stats.misses.items())
+            logger.info(
+                f"Deadlines: {stats.total_misses} misses of {stats.requests} voice messages "
+                f"({misses}), {stats.degraded} degraded replies"
+            )
+        stats = self.stt_admission.stats
+        logger.info(
+            f"STT admission: {stats.admitted} admitted, {stats.queued} queued "
+            f"(peak depth {stats.peak_queue_depth}), {stats.rejected} rejected, "
+            f"{stats.timed_out} timed out, wait avg {stats.average_wait_ms:.0f}ms, "
+            f"p95 {self.stt_admission.wait_percentile_ms(95):.0f}ms"
+        )
+        stats = self.audio_preprocessor.stats if self.audio_preprocessor else None
+        if stats and (stats.processed or stats.failed):
+            logger.info(
+                f"Audio preprocessing: {stats.processed} processed, {stats.failed} failed, "
+                f"saved {stats.bytes_saved / 1024:.0f} KiB of {stats.bytes_in / 1024:.0f} KiB uploads, "
+                f"trimmed {stats.trimmed_seconds:.1f}s of silence, "
+                f"latency avg {stats.average_latency_ms:.0f}ms"
+            )
+        if self.transcription_cache:
+            stats = self.transcription_cache.stats
+            logger.info(
+                f"Transcription cache: hit ratio {stats.hit_ratio:.0%}, "
+                f"{stats.hits} hits ({stats.disk_hits} from disk), {stats.misses} misses"
+            )
+        if isinstance(self.stt_backend, STTRouter):
+            routed = ", ".join(f"{name} {count}" for name, count in self.stt_backend.stats.routed.items())
+            logger.info(f"STT routing: {routed or 'no requests'}")
+        for hedger in (self.stt_hedger, self.nlp_hedger):
+            if hedger and hedger.stats.requests:
+                stats = hedger.stats
+                delay = hedger.hedge_delay()
+                logger.info(
+                    f"Hedging {hedger.name}: {stats.hedges} hedges of {stats.requests} requests, "
+                    f"{stats.hedge_wins} won, {stats.budget_denied} denied by budget, "
+                    f"delay {'n/a' if delay is None else f'{delay * 1000:.0f}ms'}"
+                )
+        if self.update_processor:
+            stats = self.update_processor.stats
+            logger.info(
+                f"Updates: {stats.processed} processed, {stats.queued} queued, "
+                f"wait avg {stats.average_wait_ms:.0f}ms, "
+                f"p95 {self.update_processor.wait_percentile_ms(95):.0f}ms"
+            )
+        await self._stop_phrase_warmup()
+        if hasattr(self.stt_service, 'close'):
+            await self.stt_service.close()
+        if hasattr(self.tts_service, 'close'):
+            await self.tts_service.close()
+        if hasattr(self.nlp_service, 'close'):
+            await self.nlp_service.close()
+        if hasattr(self.yandex_calendar, 'close'):
+            await self.yandex_calendar.close()
+        await self.openai_transport.close()
+        await self.elevenlabs_client.close()
+        await self.audio_pool.close()
+        stream_stats = self.elevenlabs_client.stats
+        if stream_stats.requests:
+            logger.info(
+                f"ElevenLabs: {stream_stats.requests} requests, "
+                f"first byte {stream_stats.average_first_byte_ms:.0f}ms, "
+                f"total {stream_stats.average_total_ms:.0f}ms on average"
+            )
+        if self.calendar_prefetcher:
+            stats = self.calendar_prefetcher.stats
+            logger.info(
+                f"Calendar prefetch: hit ratio {stats.hit_ratio:.0%}, "
+                f"{stats.wasted} wasted fetches, {stats.rate_limited} rate limited"
+            )
+        stats = self.handlers.page_store.stats
+        if stats.paged_replies:
+            logger.info(
+                f"Paged replies: {stats.paged_replies}, {stats.continuations} pages shown on request, "
+                f"{stats.expired} expired presses"
+            )
+        if self.tts_cache:
+            stats = self.tts_cache.stats
+            logger.info(
+                f"TTS cache: hit ratio {stats.hit_ratio:.0%}, "
+                f"saved {stats.saved_seconds:.1f}s of synthesis"
+            )
+        stats = self.handlers.voice_file_cache.stats
+        if stats.reused or stats.uploaded:
+            logger.info(
+                f"Voice file ids: {stats.reused} replies reused, {stats.uploaded} uploaded, "
+                f"{stats.invalidated} invalidated"
+            )
 
-            logger.info("✅ Shutdown complete")
+        logger.info("✅ Shutdown complete")
 
 
 def create_bot_application() -> BotApplication:
@@ -208,7 +640,7 @@ async def main():
 
         # Create and run bot
         bot_app = create_bot_application()
-        await bot_app.run_polling()
+        await bot_app.run()
 
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
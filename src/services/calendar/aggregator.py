@@ -85,6 +85,34 @@ class CalendarAggregator:
 
         return all_events
 
+    async def create_event(self, event: Event, provider_name: Optional[str] = None) -> Event:
+        """
+        Create event in a writable calendar provider
+
+        Args:
+            event: Event to create
+            provider_name: Provider to use (default: first provider
+                that supports event creation)
+
+        Returns:
+            Created Event object
+
+        Raises:
+            ValueError: If no provider supports event creation
+            Exception: If provider fails to create the event
+        """
+        if provider_name is not None:
+            candidates = [(provider_name, self.providers.get(provider_name))]
+        else:
+            candidates = list(self.providers.items())
+
+        for name, provider in candidates:
+            if provider is not None and hasattr(provider, "create_event"):
+                logger.info(f"Creating event '{event.title}' in {name}")
+                return await provider.create_event(event)
+
+        raise ValueError("No calendar provider supports event creation")
+
     def _deduplicate_events(self, events: List[Event]) -> List[Event]:
         """
         Deduplicate events based on title, time, and attendees
@@ -0,0 +1,210 @@
+"""Speculative calendar prefetch while a voice message is recognized"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+import asyncio
+import time
+from loguru import logger
+
+from .aggregator import CalendarAggregator
+from .models import Event
+
+TODAY = "today"
+TOMORROW = "tomorrow"
+
+
+@dataclass
+class PrefetchStats:
+    """Counters for speculative calendar fetches"""
+    started: int = 0
+    rate_limited: int = 0
+    hits: int = 0
+    misses: int = 0
+    wasted: int = 0
+    failed: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of calendar queries answered from a prefetch"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def _local_naive(dt: datetime) -> datetime:
+    """Convert aware datetime to naive local time (naive stays as is)"""
+    return dt.astimezone().replace(tzinfo=None) if dt.tzinfo else dt
+
+
+class CalendarPrefetch:
+    """Prefetched today/tomorrow windows for one voice message"""
+
+    def __init__(self, tasks: Dict[str, asyncio.Task], stats: PrefetchStats):
+        """
+        Initialize prefetch handle
+
+        Args:
+            tasks: Running fetches by window (empty when rate limited)
+            stats: Shared prefetch counters
+        """
+        self.stats = stats
+        self._tasks = tasks
+        self._used = set()
+
+    async def today(self) -> Optional[List[Event]]:
+        """Today's events, or None if not prefetched"""
+        return await self._result(TODAY)
+
+    async def tomorrow(self) -> Optional[List[Event]]:
+        """Tomorrow's events, or None if not prefetched"""
+        return await self._result(TOMORROW)
+
+    async def upcoming(self, hours: int) -> Optional[List[Event]]:
+        """
+        Events in the next N hours, cut from today and tomorrow windows
+
+        Args:
+            hours: Number of hours to look ahead
+
+        Returns:
+            Events sorted by start time, or None if the prefetched windows
+            do not cover the range
+        """
+        now = datetime.now()
+        end = now + timedelta(hours=hours)
+        windows_end = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=2)
+
+        if end > windows_end or TODAY not in self._tasks or TOMORROW not in self._tasks:
+            self.stats.misses += 1
+            return None
+
+        today = await self._result(TODAY, count=False)
+        tomorrow = await self._result(TOMORROW, count=False)
+        if today is None or tomorrow is None:
+            self.stats.misses += 1
+            return None
+
+        # Events crossing midnight are returned for both windows
+        seen = set()
+        events = []
+        for event in today + tomorrow:
+            if (event.id, event.start) in seen:
+                continue
+            seen.add((event.id, event.start))
+            if _local_naive(event.end) > now and _local_naive(event.start) < end:
+                events.append(event)
+
+        self.stats.hits += 1
+        return events
+
+    async def _result(self, window: str, count: bool = True) -> Optional[List[Event]]:
+        """Await prefetched window; None on miss or failure"""
+        task = self._tasks.get(window)
+        if task is None:
+            if count:
+                self.stats.misses += 1
+            return None
+
+        self._used.add(window)
+        try:
+            events = await task
+        except Exception as e:
+            logger.warning(f"Calendar prefetch of {window} failed: {e}")
+            self.stats.failed += 1
+            if count:
+                self.stats.misses += 1
+            return None
+
+        if count:
+            self.stats.hits += 1
+        return events
+
+    def close(self):
+        """Cancel or discard fetches that were not used"""
+        for window, task in self._tasks.items():
+            if window in self._used:
+                continue
+            self.stats.wasted += 1
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled() and task.exception() is not None:
+                self.stats.failed += 1
+
+
+class CalendarPrefetcher:
+    """
+    Starts today/tomorrow calendar fetches when a voice message arrives
+
+    Most voice commands ask about today, tomorrow or the next hours, so
+    fetching these windows alongside STT and NLP takes the calendar round
+    trip off the reply path when the guess is right. Prefetches are rate
+    limited per user; unused ones are cancelled and counted as wasted.
+    """
+
+    def __init__(
+        self,
+        aggregator: CalendarAggregator,
+        min_interval_seconds: float = 30.0,
+        max_in_flight: int = 20
+    ):
+        """
+        Initialize calendar prefetcher
+
+        Args:
+            aggregator: Calendar aggregator to fetch from
+            min_interval_seconds: Minimum time between prefetches of one user
+            max_in_flight: Maximum concurrently running window fetches
+        """
+        self.aggregator = aggregator
+        self.min_interval_seconds = min_interval_seconds
+        self.max_in_flight = max_in_flight
+        self.stats = PrefetchStats()
+
+        self._last_started: Dict[int, float] = {}
+        self._in_flight = 0
+
+    def start(self, user_id: int) -> CalendarPrefetch:
+        """
+        Start prefetching today and tomorrow for user
+
+        Args:
+            user_id: Telegram user ID
+
+        Returns:
+            Prefetch handle (without fetches if rate limited)
+        """
+        now = time.monotonic()
+        last = self._last_started.get(user_id)
+
+        if (last is not None and now - last < self.min_interval_seconds) or self._in_flight >= self.max_in_flight:
+            self.stats.rate_limited += 1
+            return CalendarPrefetch({}, self.stats)
+
+        self._last_started[user_id] = now
+        self._prune(now)
+        self.stats.started += 1
+
+        tasks = {
+            TODAY: self._spawn(self.aggregator.get_today_events()),
+            TOMORROW: self._spawn(self.aggregator.get_tomorrow_events()),
+        }
+        return CalendarPrefetch(tasks, self.stats)
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run fetch as a task counted against max_in_flight"""
+        self._in_flight += 1
+        task = asyncio.create_task(coro)
+        task.add_done_callback(self._fetch_done)
+        return task
+
+    def _fetch_done(self, task: asyncio.Task):
+        """Release in-flight slot"""
+        self._in_flight -= 1
+
+    def _prune(self, now: float):
+        """Forget users whose rate limit has expired"""
+        if len(self._last_started) < 1000:
+            return
+        self._last_started = {
+            user_id: started for user_id, started in self._last_started.items()
+            if now - started < self.min_interval_seconds
+        }
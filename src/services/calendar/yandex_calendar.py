@@ -1,8 +1,9 @@
 """Yandex Calendar Provider using CalDAV protocol"""
 from typing import List, Optional
 from datetime import datetime
+import uuid
 import caldav
-from icalendar import Calendar
+from icalendar import Calendar, Event as ICalEvent
 from loguru import logger
 import asyncio
 
@@ -109,6 +110,101 @@ class YandexCalendarProvider:
             logger.error(f"Failed to get events: {e}")
             raise
 
+    async def create_event(self, event: Event) -> Event:
+        """
+        Create event in Yandex Calendar
+
+        Args:
+            event: Event to create (id is generated if empty)
+
+        Returns:
+            Created Event object
+
+        Raises:
+            Exception: If API call fails or no calendar is available
+        """
+        try:
+            if not self.client:
+                await self.connect()
+
+            logger.info(f"Creating event '{event.title}' at {event.start}")
+
+            loop = asyncio.get_event_loop()
+
+            principal = await loop.run_in_executor(
+                None,
+                lambda: self.client.principal()
+            )
+
+            calendars = await loop.run_in_executor(
+                None,
+                lambda: principal.calendars()
+            )
+
+            if not calendars:
+                raise Exception("No calendars found")
+
+            calendar = calendars[0]
+
+            uid = event.id or str(uuid.uuid4())
+            ical_data = self._build_ical(event, uid)
+
+            await loop.run_in_executor(
+                None,
+                lambda: calendar.save_event(ical_data)
+            )
+
+            created = Event(
+                id=uid,
+                title=event.title,
+                start=event.start,
+                end=event.end,
+                attendees=list(event.attendees),
+                source="yandex",
+                raw_data={"icalendar": ical_data},
+                description=event.description,
+                location=event.location
+            )
+
+            logger.info(f"Created event {uid}")
+            return created
+
+        except Exception as e:
+            logger.error(f"Failed to create event: {e}")
+            raise
+
+    def _build_ical(self, event: Event, uid: str) -> str:
+        """
+        Build iCalendar representation of event
+
+        Args:
+            event: Event to serialize
+            uid: Event UID
+
+        Returns:
+            iCalendar string
+        """
+        cal = Calendar()
+        cal.add('prodid', '-//Voice Calendar Bot//RU')
+        cal.add('version', '2.0')
+
+        vevent = ICalEvent()
+        vevent.add('uid', uid)
+        vevent.add('summary', event.title)
+        vevent.add('dtstart', event.start)
+        vevent.add('dtend', event.end)
+        vevent.add('dtstamp', datetime.now(tz=event.start.tzinfo))
+
+        if event.description:
+            vevent.add('description', event.description)
+        if event.location:
+            vevent.add('location', event.location)
+        for attendee in event.attendees:
+            vevent.add('attendee', f"mailto:{attendee}")
+
+        cal.add_component(vevent)
+        return cal.to_ical().decode("utf-8")
+
     async def _parse_caldav_event(self, caldav_event) -> Optional[Event]:
         """
         Parse CalDAV event to Event model
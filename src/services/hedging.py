@@ -0,0 +1,131 @@
+"""Hedged requests for latency-critical API calls"""
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, TypeVar
+import asyncio
+from loguru import logger
+
+from src.services.stats import percentile
+
+T = TypeVar("T")
+
+
+@dataclass
+class HedgeStats:
+    """Counters for hedged requests"""
+    requests: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    budget_denied: int = 0
+
+
+class RequestHedger:
+    """
+    Issues a duplicate request when the first one is slower than usual
+
+    The hedge delay is an adaptive percentile (p90 by default) of recent
+    latencies. No hedging happens until `min_samples` latencies have been
+    observed. A token bucket caps hedges to `max_hedge_ratio` of requests.
+    Whichever attempt finishes first wins; the other is cancelled.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        percentile: float = 90.0,
+        window_size: int = 200,
+        min_samples: int = 20,
+        max_hedge_ratio: float = 0.1,
+        max_burst: float = 5.0
+    ):
+        """
+        Initialize request hedger
+
+        Args:
+            name: Name used in logs (e.g., 'whisper', 'gpt')
+            percentile: Latency percentile used as hedge delay
+            window_size: Number of recent latencies to keep
+            min_samples: Latencies required before hedging starts
+            max_hedge_ratio: Maximum fraction of requests that may be hedged
+            max_burst: Maximum accumulated hedge budget
+        """
+        self.name = name
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self.max_burst = max_burst
+        self.stats = HedgeStats()
+
+        self._latencies = deque(maxlen=window_size)
+        self._budget = 0.0
+
+    def hedge_delay(self) -> Optional[float]:
+        """
+        Current hedge delay in seconds
+
+        Returns:
+            Delay, or None while there are not enough samples
+        """
+        if len(self._latencies) < self.min_samples:
+            return None
+        return percentile(list(self._latencies), self.percentile)
+
+    def record_latency(self, seconds: float):
+        """Add latency sample to the rolling window"""
+        self._latencies.append(seconds)
+
+    def _take_budget(self) -> bool:
+        """Consume one hedge from the budget if available"""
+        if self._budget >= 1.0:
+            self._budget -= 1.0
+            return True
+        return False
+
+    async def run(self, request: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run request with hedging
+
+        Args:
+            request: Factory creating a fresh request coroutine per attempt
+
+        Returns:
+            Result of the first successful attempt
+
+        Raises:
+            Exception: If every attempt fails
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        self.stats.requests += 1
+        self._budget = min(self.max_burst, self._budget + self.max_hedge_ratio)
+
+        primary = asyncio.ensure_future(request())
+        delay = self.hedge_delay()
+        pending = {primary}
+
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                if not done:
+                    if self._take_budget():
+                        self.stats.hedges += 1
+                        logger.debug(f"Hedging {self.name} request after {delay:.2f}s")
+                        pending.add(asyncio.ensure_future(request()))
+                    else:
+                        self.stats.budget_denied += 1
+
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self.stats.hedge_wins += 1
+                        self.record_latency(loop.time() - started)
+                        return task.result()
+                    error = task.exception()
+
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
@@ -1,4 +1,6 @@
 """NLP service for command parsing"""
 from .nlp_service import NLPService
+from .datetime_parser import RussianDateTimeParser, TimeRange
+from .batcher import NLPBatcher
 
-__all__ = ["NLPService"]
+__all__ = ["NLPService", "RussianDateTimeParser", "TimeRange", "NLPBatcher"]
@@ -0,0 +1,161 @@
+"""Micro-batching layer for NLP command parsing"""
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+import asyncio
+from loguru import logger
+
+from src.services.calendar.models import Command
+from .nlp_service import NLPService
+
+
+@dataclass
+class BatcherStats:
+    """Counters for NLP batching"""
+    direct_requests: int = 0
+    batches_sent: int = 0
+    batched_items: int = 0
+    fallback_items: int = 0
+
+
+class NLPBatcher:
+    """
+    Collects concurrent parse calls into multi-item classification requests
+
+    While fewer than `min_queue_depth` parses are in flight, requests go
+    straight to NLPService.parse with no added latency. Under load,
+    utterances are buffered for up to `max_wait_ms` (or until
+    `max_batch_size` is reached) and sent as one request via
+    NLPService.parse_batch; results are fanned out to waiting callers.
+    """
+
+    def __init__(
+        self,
+        nlp_service: NLPService,
+        max_batch_size: int = 8,
+        max_wait_ms: float = 10.0,
+        min_queue_depth: int = 2
+    ):
+        """
+        Initialize NLP batcher
+
+        Args:
+            nlp_service: Underlying NLP service
+            max_batch_size: Maximum utterances per batch request
+            max_wait_ms: Maximum time to hold an utterance before flushing
+            min_queue_depth: In-flight parses required before batching starts
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self.nlp_service = nlp_service
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.min_queue_depth = min_queue_depth
+        self.stats = BatcherStats()
+
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._in_flight = 0
+        self._tasks = set()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of parse calls currently awaiting a result"""
+        return self._in_flight
+
+    async def parse(self, text: str) -> Command:
+        """
+        Parse text command, batching with concurrent calls when under load
+
+        Args:
+            text: Text to parse
+
+        Returns:
+            Command object with intent and params
+
+        Raises:
+            ValueError: If text is empty
+            Exception: If API call fails
+        """
+        if not text or not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        self._in_flight += 1
+        try:
+            # Shallow queue: no batching, no extra latency
+            if self._in_flight <= self.min_queue_depth and not self._pending:
+                self.stats.direct_requests += 1
+                return await self.nlp_service.parse(text)
+
+            future = asyncio.get_running_loop().create_future()
+            self._pending.append((text, future))
+
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_timer is None:
+                self._flush_timer = asyncio.get_running_loop().call_later(self.max_wait, self._flush)
+
+            return await future
+        finally:
+            self._in_flight -= 1
+
+    def _flush(self):
+        """Send pending utterances as one batch"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        batch = self._pending[:self.max_batch_size]
+        self._pending = self._pending[self.max_batch_size:]
+
+        if self._pending:
+            self._flush_timer = asyncio.get_running_loop().call_later(self.max_wait, self._flush)
+
+        if batch:
+            task = asyncio.create_task(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        """
+        Execute batch request and resolve caller futures
+
+        Args:
+            batch: List of (text, future) pairs
+        """
+        texts = [text for text, _ in batch]
+
+        try:
+            if len(batch) == 1:
+                commands = [await self.nlp_service.parse(texts[0])]
+            else:
+                self.stats.batches_sent += 1
+                self.stats.batched_items += len(batch)
+                try:
+                    commands = await self.nlp_service.parse_batch(texts)
+                except ValueError as e:
+                    # Malformed batch response: parse items individually
+                    logger.warning(f"Batch parse failed ({e}), falling back to single requests")
+                    self.stats.fallback_items += len(batch)
+                    commands = await asyncio.gather(
+                        *(self.nlp_service.parse(text) for text in texts),
+                        return_exceptions=True
+                    )
+        except Exception as e:
+            commands = [e] * len(batch)
+
+        for (_, future), result in zip(batch, commands):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def close(self):
+        """Flush pending requests and close underlying service"""
+        if self._pending:
+            self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.nlp_service.close()
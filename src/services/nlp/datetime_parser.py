@@ -0,0 +1,351 @@
+"""Deterministic parser for Russian date/time expressions"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta, date
+from typing import Optional, Tuple
+import re
+import pytz
+
+
+@dataclass
+class TimeRange:
+    """Concrete time range resolved from a temporal expression"""
+    start: datetime
+    end: datetime
+    # Explicit day and time already passed ("сегодня в 10" said at noon)
+    past: bool = False
+
+
+# Number words (after "ё" -> "е" normalization) mapped to their values.
+# All grammatical cases used in time expressions are listed explicitly.
+_UNIT_WORDS = {
+    "ноль": 0, "нуля": 0,
+    "один": 1, "одна": 1, "одну": 1, "одного": 1, "одной": 1, "одним": 1,
+    "два": 2, "две": 2, "двух": 2, "двум": 2,
+    "три": 3, "трех": 3, "трем": 3,
+    "четыре": 4, "четырех": 4, "четырем": 4,
+    "пять": 5, "пяти": 5,
+    "шесть": 6, "шести": 6,
+    "семь": 7, "семи": 7,
+    "восемь": 8, "восьми": 8,
+    "девять": 9, "девяти": 9,
+}
+
+_TEEN_WORDS = {
+    "десять": 10, "десяти": 10,
+    "одиннадцать": 11, "одиннадцати": 11,
+    "двенадцать": 12, "двенадцати": 12,
+    "тринадцать": 13, "тринадцати": 13,
+    "четырнадцать": 14, "четырнадцати": 14,
+    "пятнадцать": 15, "пятнадцати": 15,
+    "шестнадцать": 16, "шестнадцати": 16,
+    "семнадцать": 17, "семнадцати": 17,
+    "восемнадцать": 18, "восемнадцати": 18,
+    "девятнадцать": 19, "девятнадцати": 19,
+}
+
+_TENS_WORDS = {
+    "двадцать": 20, "двадцати": 20,
+    "тридцать": 30, "тридцати": 30,
+    "сорок": 40, "сорока": 40,
+    "пятьдесят": 50, "пятидесяти": 50,
+}
+
+
+def _alternation(words) -> str:
+    """Build regex alternation with longest words first"""
+    return "|".join(sorted(words, key=len, reverse=True))
+
+
+_NUMBER_WORD_RE = re.compile(
+    rf"\b(?:(?P<tens>{_alternation(_TENS_WORDS)})(?:\s+(?P<tens_unit>{_alternation(_UNIT_WORDS)}))?"
+    rf"|(?P<teen>{_alternation(_TEEN_WORDS)})"
+    rf"|(?P<unit>{_alternation(_UNIT_WORDS)}))\b"
+)
+
+_WEEKDAYS = {
+    "понедельник": 0,
+    "вторник": 1,
+    "среду": 2, "среда": 2,
+    "четверг": 3,
+    "пятницу": 4, "пятница": 4,
+    "субботу": 5, "суббота": 5,
+    "воскресенье": 6,
+}
+
+_MONTHS = {
+    "января": 1, "февраля": 2, "марта": 3, "апреля": 4,
+    "мая": 5, "июня": 6, "июля": 7, "августа": 8,
+    "сентября": 9, "октября": 10, "ноября": 11, "декабря": 12,
+}
+
+_RELATIVE_DAYS = {"сегодня": 0, "завтра": 1, "послезавтра": 2}
+
+# Hour adjustment for day-part qualifiers ("в 3 часа дня" -> 15:00)
+_DAY_PARTS = ("утра", "дня", "вечера", "ночи")
+
+# Default hour when only a part of the day is mentioned ("завтра вечером")
+_DAY_PART_HOURS = {"утром": 9, "днем": 13, "вечером": 19, "ночью": 23}
+
+# Minutes follow the hour as "11:30", "11 30" (spoken "одиннадцать тридцать")
+# or "11 часов 30 минут"
+_TIME = (
+    rf"(\d{{1,2}})(?!\d)(?!\s+(?:{_alternation(_MONTHS)}))"
+    rf"(?:[:.](\d{{2}})|\s+(\d{{2}})(?!\d)(?!\s+(?:{_alternation(_MONTHS)}|минут|час)))?"
+    rf"(?:\s+час(?:а|ов)?)?(?:\s+(\d{{1,2}})\s+минут\w*)?"
+)
+_DAY_PART = rf"(?:\s+({'|'.join(_DAY_PARTS)}))?"
+
+_RELATIVE_DAY_RE = re.compile(rf"\b({_alternation(_RELATIVE_DAYS)})\b")
+_WEEKDAY_RE = re.compile(
+    rf"\bво?\s+(?:следующ\w+\s+)?({_alternation(_WEEKDAYS)})\b"
+)
+_DATE_RE = re.compile(
+    rf"\b(\d{{1,2}})\s+({_alternation(_MONTHS)})\b"
+    r"|(?<!в\s)\b(\d{1,2})\.(\d{1,2})(?:\.(\d{2,4}))?\b(?!\s*(?:утра|дня|вечера|ночи))"
+)
+_RANGE_RE = re.compile(
+    rf"\bс\s+{_TIME}{_DAY_PART}\s+до\s+{_TIME}{_DAY_PART}"
+)
+_TIME_RE = re.compile(rf"\bв\s+{_TIME}{_DAY_PART}")
+_ONE_OCLOCK_RE = re.compile(r"\bв\s+час(?:\s+(дня|ночи))?\b")
+_NOON_RE = re.compile(r"\bв\s+(полдень|полночь)\b")
+_DAY_PART_RE = re.compile(rf"\b({_alternation(_DAY_PART_HOURS)})\b")
+_RELATIVE_RE = re.compile(
+    r"\bчерез\s+(?:(полчаса)|(полтора)\s+час\w*|(?:(\d+)\s+)?"
+    r"(минут\w*|час\w*|дн(?:я|ей)|день|сутки|недел\w*))\b"
+)
+
+
+class RussianDateTimeParser:
+    """
+    Rule-based parser for Russian temporal expressions
+
+    Supports relative days ("завтра"), weekdays ("в пятницу"),
+    dates ("15 марта"), relative offsets ("через 2 часа"), clock times
+    ("в три часа дня", "в 15:30") and ranges ("с десяти до двенадцати").
+    Numerals written as words are normalized to digits before matching.
+    All grammars are compiled once at import time.
+    """
+
+    def __init__(
+        self,
+        timezone: str = "Europe/Moscow",
+        default_duration: timedelta = timedelta(hours=1),
+        default_hour: int = 9
+    ):
+        """
+        Initialize parser
+
+        Args:
+            timezone: User timezone name (e.g., 'Europe/Moscow')
+            default_duration: Event duration when no end time is given
+            default_hour: Start hour when only a day is given
+        """
+        self.tz = pytz.timezone(timezone)
+        self.default_duration = default_duration
+        self.default_hour = default_hour
+
+    def parse(self, text: str, now: Optional[datetime] = None) -> Optional[TimeRange]:
+        """
+        Parse temporal expression into a concrete time range
+
+        Args:
+            text: Text containing a Russian date/time expression
+            now: Reference time (default: current time in user timezone)
+
+        Returns:
+            TimeRange with timezone-aware datetimes, or None if no
+            temporal expression was found. A bare time that passed
+            refers to tomorrow; an explicit day and time that passed
+            ("сегодня в 10" at noon) is kept and marked past
+        """
+        if not text or not text.strip():
+            return None
+
+        now = self._localize_now(now)
+        normalized = self.normalize(text)
+
+        clock = self._parse_clock(normalized)
+
+        # "через N часов" is anchored to the current moment; "через N дней
+        # в 10" only picks the day and the clock sets the time
+        relative = _RELATIVE_RE.search(normalized)
+        if relative:
+            delta = self._relative_delta(relative)
+            if clock is None or delta < timedelta(days=1):
+                start = self.tz.normalize(now + delta)
+                return TimeRange(start=start, end=self.tz.normalize(start + self.default_duration))
+            day = (now + delta).date()
+        else:
+            day = self._parse_day(normalized, now.date())
+
+        if day is None and clock is None:
+            return None
+
+        if clock is None:
+            start_time, end_time = (self.default_hour, 0), None
+        else:
+            start_time, end_time = clock
+
+        start_day = day or now.date()
+        start = self._combine(start_day, start_time)
+
+        # A bare time that has already passed refers to tomorrow
+        if day is None and start <= now:
+            start_day = start_day + timedelta(days=1)
+            start = self._combine(start_day, start_time)
+
+        if end_time is not None:
+            end = self._combine(start_day, end_time)
+            if end <= start:
+                end = self._combine(start_day + timedelta(days=1), end_time)
+        else:
+            end = self.tz.normalize(start + self.default_duration)
+
+        return TimeRange(start=start, end=end, past=start <= now)
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+        Lowercase text and replace number words with digits
+
+        Args:
+            text: Raw text
+
+        Returns:
+            Normalized text (e.g., "в двадцать три" -> "в 23")
+        """
+        text = text.lower().replace("ё", "е")
+        return _NUMBER_WORD_RE.sub(_number_word_to_digits, text)
+
+    def _localize_now(self, now: Optional[datetime]) -> datetime:
+        """Return reference time as an aware datetime in user timezone"""
+        if now is None:
+            return datetime.now(self.tz)
+        if now.tzinfo is None:
+            return self.tz.localize(now)
+        return now.astimezone(self.tz)
+
+    def _combine(self, day: date, clock: Tuple[int, int]) -> datetime:
+        """Combine date and (hour, minute) into aware datetime"""
+        hour, minute = clock
+        return self.tz.localize(datetime(day.year, day.month, day.day, hour, minute))
+
+    def _relative_delta(self, match: re.Match) -> timedelta:
+        """Convert 'через ...' match to timedelta"""
+        half_hour, one_and_half, amount, unit = match.groups()
+        if half_hour:
+            return timedelta(minutes=30)
+        if one_and_half:
+            return timedelta(minutes=90)
+
+        value = int(amount) if amount else 1
+        if unit.startswith("минут"):
+            return timedelta(minutes=value)
+        if unit.startswith("час"):
+            return timedelta(hours=value)
+        if unit.startswith("недел"):
+            return timedelta(weeks=value)
+        return timedelta(days=value)
+
+    def _parse_day(self, text: str, today: date) -> Optional[date]:
+        """Resolve day reference (relative day, weekday or date)"""
+        match = _RELATIVE_DAY_RE.search(text)
+        if match:
+            return today + timedelta(days=_RELATIVE_DAYS[match.group(1)])
+
+        match = _WEEKDAY_RE.search(text)
+        if match:
+            days_ahead = (_WEEKDAYS[match.group(1)] - today.weekday()) % 7
+            return today + timedelta(days=days_ahead or 7)
+
+        match = _DATE_RE.search(text)
+        if match:
+            day_str, month_name, num_day, num_month, num_year = match.groups()
+            if month_name:
+                day, month = int(day_str), _MONTHS[month_name]
+            else:
+                day, month = int(num_day), int(num_month)
+
+            if num_year:
+                year = int(num_year)
+                return _valid_date(year + 2000 if year < 100 else year, month, day)
+
+            # Without a year: the first such date from today on ("29 февраля"
+            # said in March is the next leap year's)
+            for year in range(today.year, today.year + 9):
+                result = _valid_date(year, month, day)
+                if result is not None and result >= today:
+                    return result
+
+        return None
+
+    def _parse_clock(self, text: str) -> Optional[Tuple[Tuple[int, int], Optional[Tuple[int, int]]]]:
+        """Resolve clock time or time range as ((h, m), (h, m) | None)"""
+        match = _RANGE_RE.search(text)
+        if match:
+            g = match.groups()
+            start_part, end_part = g[4], g[9]
+            start = self._to_clock(g[0], g[1] or g[2] or g[3], start_part or end_part)
+            end = self._to_clock(g[5], g[6] or g[7] or g[8], end_part)
+            if start and end:
+                return start, end
+
+        match = _TIME_RE.search(text)
+        if match:
+            hour, minute, spoken_minute, minute_words, day_part = match.groups()
+            clock = self._to_clock(hour, minute or spoken_minute or minute_words, day_part)
+            if clock:
+                return clock, None
+
+        match = _ONE_OCLOCK_RE.search(text)
+        if match:
+            return (1 if match.group(1) == "ночи" else 13, 0), None
+
+        match = _NOON_RE.search(text)
+        if match:
+            return (12 if match.group(1) == "полдень" else 0, 0), None
+
+        match = _DAY_PART_RE.search(text)
+        if match:
+            return (_DAY_PART_HOURS[match.group(1)], 0), None
+
+        return None
+
+    @staticmethod
+    def _to_clock(hour_str: str, minute_str: Optional[str], day_part: Optional[str]) -> Optional[Tuple[int, int]]:
+        """Convert hour/minute strings and day part to 24h clock"""
+        hour = int(hour_str)
+        minute = int(minute_str) if minute_str else 0
+        if hour > 23 or minute > 59:
+            return None
+
+        if day_part in ("дня", "вечера") and hour < 12:
+            hour += 12
+        elif day_part == "ночи" and hour == 12:
+            hour = 0
+        elif day_part is None and 1 <= hour <= 7:
+            # Without a qualifier small hours mean afternoon ("в три" -> 15:00)
+            hour += 12
+
+        return hour, minute
+
+
+def _valid_date(year: int, month: int, day: int) -> Optional[date]:
+    """Date from its parts, or None if no such day exists"""
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def _number_word_to_digits(match: re.Match) -> str:
+    """Regex substitution callback for number words"""
+    if match.group("tens"):
+        value = _TENS_WORDS[match.group("tens")]
+        if match.group("tens_unit"):
+            value += _UNIT_WORDS[match.group("tens_unit")]
+        return str(value)
+    if match.group("teen"):
+        return str(_TEEN_WORDS[match.group("teen")])
+    return str(_UNIT_WORDS[match.group("unit")])
@@ -0,0 +1,288 @@
+"""Offline accuracy and latency evaluation for NLPService"""
+from dataclasses import dataclass, field, asdict
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+import asyncio
+import json
+import time
+from loguru import logger
+
+from src.services.calendar.models import Intent
+from src.services.stats import percentile
+
+
+@dataclass
+class EvaluationCase:
+    """Labelled utterance from the evaluation corpus"""
+    text: str
+    intent: Intent
+    parameters: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class EvaluationReport:
+    """Aggregated evaluation results"""
+    total: int
+    intent_accuracy: float
+    slot_accuracy: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    tokens_per_request: float
+    failures: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert report to dictionary (without failure details)"""
+        data = asdict(self)
+        data.pop("failures")
+        return data
+
+    def compare(
+        self,
+        baseline: Dict[str, Any],
+        accuracy_tolerance: float = 0.0,
+        latency_tolerance: float = 0.2,
+        tokens_tolerance: float = 0.1
+    ) -> List[str]:
+        """
+        Compare report with stored baseline
+
+        Args:
+            baseline: Baseline metrics (as produced by to_dict)
+            accuracy_tolerance: Allowed absolute accuracy drop
+            latency_tolerance: Allowed relative p95 latency increase
+            tokens_tolerance: Allowed relative tokens-per-request increase
+
+        Returns:
+            List of regression descriptions (empty if none)
+        """
+        regressions = []
+
+        for metric in ("intent_accuracy", "slot_accuracy"):
+            current, expected = getattr(self, metric), baseline.get(metric)
+            if expected is not None and current < expected - accuracy_tolerance:
+                regressions.append(f"{metric}: {current:.3f} < baseline {expected:.3f}")
+
+        for metric, tolerance in (("latency_p95_ms", latency_tolerance), ("tokens_per_request", tokens_tolerance)):
+            current, expected = getattr(self, metric), baseline.get(metric)
+            if expected and current > expected * (1 + tolerance):
+                regressions.append(f"{metric}: {current:.1f} > baseline {expected:.1f}")
+
+        return regressions
+
+
+class _UsageCounter:
+    """Mixin counting requests and token usage"""
+
+    def _reset_usage(self):
+        self.requests = 0
+        self.total_tokens = 0
+
+    def _record_usage(self, usage: Any):
+        self.requests += 1
+        self.total_tokens += getattr(usage, "total_tokens", 0) or 0
+
+
+class ReplayChatClient(_UsageCounter):
+    """
+    Stub OpenAI client replaying recorded chat completions
+
+    Recordings map the user message content to
+    {"content": str, "usage": {...}, "latency_ms": float}. Unknown
+    utterances get an 'unknown' intent response.
+    """
+
+    def __init__(self, recordings: Dict[str, Dict[str, Any]], latency_scale: float = 1.0):
+        """
+        Initialize replay client
+
+        Args:
+            recordings: Recorded responses keyed by user message
+            latency_scale: Multiplier for recorded latency (0 disables sleeping)
+        """
+        self.recordings = recordings
+        self.latency_scale = latency_scale
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        self._reset_usage()
+
+    @classmethod
+    def from_file(cls, path: str, latency_scale: float = 1.0) -> "ReplayChatClient":
+        """Load recordings from JSON file"""
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f), latency_scale=latency_scale)
+
+    async def _create(self, **kwargs) -> Any:
+        """Replay chat.completions.create"""
+        user_message = kwargs["messages"][-1]["content"]
+        record = self.recordings.get(user_message) or {
+            "content": '{"intent": "unknown", "params": {}}',
+            "usage": {},
+            "latency_ms": 0
+        }
+
+        delay = record.get("latency_ms", 0) * self.latency_scale / 1000
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        usage = SimpleNamespace(**{
+            "prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0,
+            **record.get("usage", {})
+        })
+        self._record_usage(usage)
+
+        message = SimpleNamespace(content=record["content"])
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+    async def close(self):
+        """No-op close for client compatibility"""
+
+
+class RecordingChatClient(_UsageCounter):
+    """Proxy around a real OpenAI client that records chat completions"""
+
+    def __init__(self, client: Any):
+        """
+        Initialize recording client
+
+        Args:
+            client: Real AsyncOpenAI client
+        """
+        self.client = client
+        self.recordings: Dict[str, Dict[str, Any]] = {}
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        self._reset_usage()
+
+    async def _create(self, **kwargs) -> Any:
+        """Forward chat.completions.create and store response"""
+        started = time.perf_counter()
+        response = await self.client.chat.completions.create(**kwargs)
+        latency_ms = (time.perf_counter() - started) * 1000
+
+        usage = response.usage
+        self._record_usage(usage)
+        self.recordings[kwargs["messages"][-1]["content"]] = {
+            "content": response.choices[0].message.content,
+            "usage": {
+                "prompt_tokens": usage.prompt_tokens,
+                "completion_tokens": usage.completion_tokens,
+                "total_tokens": usage.total_tokens
+            },
+            "latency_ms": round(latency_ms, 1)
+        }
+        return response
+
+    def save(self, path: str):
+        """Save recordings to JSON file"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.recordings, f, ensure_ascii=False, indent=2)
+
+    async def close(self):
+        """Close underlying client"""
+        await self.client.close()
+
+
+def load_corpus(path: str) -> List[EvaluationCase]:
+    """
+    Load labelled corpus from JSON file
+
+    Args:
+        path: Path to JSON list of {"text", "intent", "params"}
+
+    Returns:
+        List of EvaluationCase objects
+    """
+    with open(path, encoding="utf-8") as f:
+        items = json.load(f)
+
+    return [
+        EvaluationCase(
+            text=item["text"],
+            intent=Intent(item["intent"]),
+            parameters=item.get("params", {})
+        )
+        for item in items
+    ]
+
+
+def _slot_matches(expected: Any, actual: Any) -> bool:
+    """Compare slot values ignoring case and int/str differences"""
+    if actual is None:
+        return False
+    return str(expected).strip().lower() == str(actual).strip().lower()
+
+
+async def evaluate(
+    parser: Any,
+    cases: List[EvaluationCase],
+    client: Optional[_UsageCounter] = None,
+    concurrency: int = 1
+) -> EvaluationReport:
+    """
+    Replay corpus through parser and compute metrics
+
+    Args:
+        parser: Object with async parse(text) -> Command (e.g., NLPService)
+        cases: Labelled corpus
+        client: Usage-counting client used by parser (for token stats)
+        concurrency: Number of utterances parsed concurrently
+
+    Returns:
+        EvaluationReport
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_case(case: EvaluationCase):
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                command = await parser.parse(case.text)
+                error = None
+            except Exception as e:
+                command, error = None, str(e)
+            return command, error, (time.perf_counter() - started) * 1000
+
+    results = await asyncio.gather(*(run_case(case) for case in cases))
+
+    latencies = []
+    intent_correct = 0
+    slots_total = 0
+    slots_correct = 0
+    failures = []
+
+    for case, (command, error, latency_ms) in zip(cases, results):
+        latencies.append(latency_ms)
+        slots_total += len(case.parameters)
+
+        if command is None:
+            failures.append({"text": case.text, "error": error})
+            continue
+
+        intent_ok = command.intent == case.intent
+        matched_slots = sum(
+            1 for key, value in case.parameters.items()
+            if _slot_matches(value, command.parameters.get(key))
+        )
+        intent_correct += intent_ok
+        slots_correct += matched_slots
+
+        if not intent_ok or matched_slots < len(case.parameters):
+            failures.append({
+                "text": case.text,
+                "expected": {"intent": case.intent.value, "params": case.parameters},
+                "actual": {"intent": command.intent.value, "params": command.parameters}
+            })
+
+    total = len(cases)
+    requests = client.requests if client else 0
+
+    report = EvaluationReport(
+        total=total,
+        intent_accuracy=round(intent_correct / total, 4) if total else 0.0,
+        slot_accuracy=round(slots_correct / slots_total, 4) if slots_total else 1.0,
+        latency_p50_ms=round(percentile(latencies, 50), 1),
+        latency_p95_ms=round(percentile(latencies, 95), 1),
+        tokens_per_request=round(client.total_tokens / requests, 1) if requests else 0.0,
+        failures=failures
+    )
+
+    logger.info(f"Evaluation finished: {report.to_dict()}")
+    return report
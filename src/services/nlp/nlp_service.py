@@ -1,10 +1,11 @@
 """NLP Command Parser using GPT-4"""
-from typing import Optional
+from typing import Optional, List, Dict, Any
 import json
 from openai import AsyncOpenAI
 from loguru import logger
 
 from src.services.calendar.models import Command, Intent
+from src.services.hedging import RequestHedger
 
 
 class NLPService:
@@ -36,19 +37,38 @@ class NLPService:
 
 Пользователь: "когда встреча с Сергеем"
 Ответ: {"intent": "find_meeting", "params": {"person": "Сергей"}}
+
+Пользователь: "создай встречу с командой завтра в три"
+Ответ: {"intent": "create_event", "params": {"title": "Встреча с командой", "time": "завтра в три"}}
+"""
+
+    BATCH_INSTRUCTION = """
+Пакетный режим: пользователь присылает JSON-массив объектов {"id": N, "text": "команда"}.
+Разбери каждую команду независимо и ответь ТОЛЬКО JSON-массивом в том же порядке:
+[{"id": N, "intent": "название_интента", "params": {}}]
 """
 
-    def __init__(self, api_key: str, model: str = "gpt-4"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4",
+        client: Optional[AsyncOpenAI] = None,
+        hedger: Optional[RequestHedger] = None
+    ):
         """
         Initialize NLP service
 
         Args:
             api_key: OpenAI API key
             model: GPT model to use (default: gpt-4)
+            client: Shared OpenAI client (default: create own client)
+            hedger: Optional hedger for tail-latency protection
         """
         self.api_key = api_key
         self.model = model
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = client or AsyncOpenAI(api_key=api_key)
+        self._owns_client = client is None
+        self.hedger = hedger
 
     async def parse(self, text: str) -> Command:
         """
@@ -71,13 +91,11 @@ class NLPService:
             logger.info(f"Parsing command: {text}")
 
             # Call GPT-4 for intent classification
-            response = await self.client.chat.completions.create(
-                model=self.model,
+            response = await self._complete(
                 messages=[
                     {"role": "system", "content": self.SYSTEM_PROMPT},
                     {"role": "user", "content": text}
                 ],
-                temperature=0.0,  # Deterministic for classification
                 max_tokens=150
             )
 
@@ -88,26 +106,6 @@ class NLPService:
             # Parse JSON response
             try:
                 parsed = json.loads(gpt_response)
-                intent_str = parsed.get("intent", "unknown")
-                params = parsed.get("params", {})
-
-                # Convert string intent to Intent enum
-                try:
-                    intent = Intent[intent_str.upper()]
-                except KeyError:
-                    logger.warning(f"Unknown intent: {intent_str}, using UNKNOWN")
-                    intent = Intent.UNKNOWN
-
-                command = Command(
-                    intent=intent,
-                    original_text=text,
-                    parameters=params,
-                    confidence=0.9  # High confidence for successful parse
-                )
-
-                logger.info(f"Parsed command: intent={intent.value}, params={params}")
-                return command
-
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse GPT response as JSON: {e}")
                 # Fallback to UNKNOWN intent
@@ -118,10 +116,113 @@ class NLPService:
                     confidence=0.0  # Low confidence for failed parse
                 )
 
+            command = self._build_command(text, parsed)
+            logger.info(f"Parsed command: intent={command.intent.value}, params={command.parameters}")
+            return command
+
         except Exception as e:
             logger.error(f"NLP parsing failed: {e}")
             raise
 
+    async def parse_batch(self, texts: List[str]) -> List[Command]:
+        """
+        Parse several text commands with a single API request
+
+        Args:
+            texts: Texts to parse (non-empty)
+
+        Returns:
+            Commands in the same order as texts
+
+        Raises:
+            ValueError: If texts are empty or the response does not
+                contain a result for every item
+            Exception: If API call fails
+        """
+        if not texts or any(not text or not text.strip() for text in texts):
+            raise ValueError("Text cannot be empty")
+
+        try:
+            logger.info(f"Parsing batch of {len(texts)} commands")
+
+            items = [{"id": i, "text": text} for i, text in enumerate(texts)]
+            response = await self._complete(
+                messages=[
+                    {"role": "system", "content": self.SYSTEM_PROMPT + self.BATCH_INSTRUCTION},
+                    {"role": "user", "content": json.dumps(items, ensure_ascii=False)}
+                ],
+                max_tokens=150 * len(texts)
+            )
+
+            gpt_response = response.choices[0].message.content.strip()
+            logger.debug(f"GPT batch response: {gpt_response}")
+
+            try:
+                results = json.loads(gpt_response)
+                by_id = {int(result["id"]): result for result in results}
+                commands = [self._build_command(text, by_id[i]) for i, text in enumerate(texts)]
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"Malformed batch response: {e}") from e
+
+            logger.info(f"Parsed batch: {[c.intent.value for c in commands]}")
+            return commands
+
+        except Exception as e:
+            logger.error(f"NLP batch parsing failed: {e}")
+            raise
+
+    async def _complete(self, messages: List[Dict[str, str]], max_tokens: int) -> Any:
+        """
+        Call chat completion API, hedging the request if a hedger is configured
+
+        Args:
+            messages: Chat messages
+            max_tokens: Maximum tokens in response
+
+        Returns:
+            Chat completion response
+        """
+        async def attempt():
+            return await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=0.0,  # Deterministic for classification
+                max_tokens=max_tokens
+            )
+
+        if self.hedger:
+            return await self.hedger.run(attempt)
+        return await attempt()
+
+    def _build_command(self, text: str, parsed: Dict[str, Any]) -> Command:
+        """
+        Build Command from parsed GPT JSON object
+
+        Args:
+            text: Original text
+            parsed: Parsed JSON object with intent and params
+
+        Returns:
+            Command object
+        """
+        intent_str = parsed.get("intent", "unknown")
+        params = parsed.get("params", {})
+
+        # Convert string intent to Intent enum
+        try:
+            intent = Intent[intent_str.upper()]
+        except KeyError:
+            logger.warning(f"Unknown intent: {intent_str}, using UNKNOWN")
+            intent = Intent.UNKNOWN
+
+        return Command(
+            intent=intent,
+            original_text=text,
+            parameters=params,
+            confidence=0.9  # High confidence for successful parse
+        )
+
     async def close(self):
-        """Close OpenAI client"""
-        await self.client.close()
+        """Close OpenAI client (shared clients are closed by their owner)"""
+        if self._owns_client:
+            await self.client.close()
@@ -0,0 +1,99 @@
+"""Shared pooled HTTP transport for OpenAI-backed services"""
+from typing import Optional
+import asyncio
+import httpx
+from openai import AsyncOpenAI
+from loguru import logger
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class OpenAITransport:
+    """
+    Single AsyncOpenAI client with a tuned connection pool
+
+    STT and NLP share this client so voice messages reuse the same
+    TLS connections to api.openai.com. An optional keep-alive ping
+    keeps pooled connections warm between messages.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 60.0,
+        http2: bool = False,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 60.0,
+        keepalive_ping_interval: float = 30.0
+    ):
+        """
+        Initialize OpenAI transport
+
+        Args:
+            api_key: OpenAI API key
+            max_connections: Maximum concurrent connections in the pool
+            max_keepalive_connections: Idle connections kept open
+            keepalive_expiry: Seconds an idle connection stays open
+            http2: Enable HTTP/2 multiplexing (requires the 'h2' package)
+            connect_timeout: Connection timeout in seconds
+            read_timeout: Read/write timeout in seconds
+            keepalive_ping_interval: Seconds between keep-alive pings (0 disables)
+        """
+        if http2 and not HTTP2_AVAILABLE:
+            logger.warning("HTTP/2 requested but 'h2' package is not installed, using HTTP/1.1")
+            http2 = False
+
+        self.http2 = http2
+        self.keepalive_ping_interval = keepalive_ping_interval
+
+        self.http_client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            ),
+            timeout=httpx.Timeout(
+                connect=connect_timeout,
+                read=read_timeout,
+                write=read_timeout,
+                pool=connect_timeout
+            )
+        )
+        self.client = AsyncOpenAI(api_key=api_key, http_client=self.http_client)
+
+        self._ping_task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start keep-alive ping task (requires running event loop)"""
+        if self.keepalive_ping_interval > 0 and self._ping_task is None:
+            self._ping_task = asyncio.create_task(self._ping_loop())
+            logger.info(f"OpenAI keep-alive ping every {self.keepalive_ping_interval}s")
+
+    async def _ping_loop(self):
+        """Periodically touch the API host to keep connections warm"""
+        while True:
+            await asyncio.sleep(self.keepalive_ping_interval)
+            try:
+                await self.http_client.head(str(self.client.base_url))
+            except httpx.HTTPError as e:
+                logger.debug(f"OpenAI keep-alive ping failed: {e}")
+
+    async def close(self):
+        """Stop ping task and close pooled connections"""
+        if self._ping_task is not None:
+            self._ping_task.cancel()
+            try:
+                await self._ping_task
+            except asyncio.CancelledError:
+                pass
+            self._ping_task = None
+
+        await self.client.close()
+        logger.info("OpenAI transport closed")
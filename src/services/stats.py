@@ -0,0 +1,21 @@
+"""Statistics helpers shared by services"""
+from typing import List
+import math
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    Nearest-rank percentile
+
+    Args:
+        values: Sample values
+        q: Percentile in range 0-100
+
+    Returns:
+        Percentile value (0.0 for empty input)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
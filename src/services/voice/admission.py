@@ -0,0 +1,155 @@
+"""Admission control for speech-to-text requests"""
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, List, Optional, Tuple
+import asyncio
+import heapq
+import itertools
+from loguru import logger
+
+from src.services.stats import percentile
+
+
+class STTOverloadedError(Exception):
+    """Raised when a transcription request cannot be admitted"""
+
+
+@dataclass
+class AdmissionStats:
+    """Counters for STT admission"""
+    admitted: int = 0
+    queued: int = 0
+    rejected: int = 0
+    timed_out: int = 0
+    peak_queue_depth: int = 0
+    wait_seconds: float = 0.0
+
+    @property
+    def average_wait_ms(self) -> float:
+        """Average queue wait of queued requests"""
+        return self.wait_seconds / self.queued * 1000 if self.queued else 0.0
+
+
+class AdmissionController:
+    """
+    Concurrency limit with a duration-ordered waiting queue
+
+    Up to `max_concurrent` requests run at once. Others wait in a priority
+    queue keyed by arrival time plus audio duration, so short commands
+    overtake long voice notes, while a long note is never overtaken by
+    audio that arrives more than its duration later. When the queue is
+    full or a request waits longer than `max_wait_seconds`,
+    STTOverloadedError is raised.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 8,
+        max_queue_size: int = 50,
+        max_wait_seconds: Optional[float] = 30.0,
+        unknown_duration: float = 60.0,
+        wait_window_size: int = 200
+    ):
+        """
+        Initialize admission controller
+
+        Args:
+            max_concurrent: Maximum requests running at once
+            max_queue_size: Maximum waiting requests before rejecting
+            max_wait_seconds: Maximum queue wait (None: wait indefinitely)
+            unknown_duration: Duration assumed when audio length is unknown
+            wait_window_size: Number of recent waits kept for percentiles
+        """
+        self.max_concurrent = max_concurrent
+        self.max_queue_size = max_queue_size
+        self.max_wait_seconds = max_wait_seconds
+        self.unknown_duration = unknown_duration
+        self.stats = AdmissionStats()
+
+        self._in_flight = 0
+        self._waiters: List[Tuple[float, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._recent_waits = deque(maxlen=wait_window_size)
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently running"""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests currently waiting"""
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    def wait_percentile_ms(self, q: float = 95.0) -> float:
+        """Queue wait percentile over recent queued requests"""
+        return percentile(list(self._recent_waits), q) * 1000
+
+    @asynccontextmanager
+    async def admit(self, duration: Optional[float] = None) -> AsyncIterator[None]:
+        """
+        Hold a transcription slot for the duration of the block
+
+        Args:
+            duration: Audio duration in seconds (None: unknown)
+
+        Raises:
+            STTOverloadedError: If the queue is full or the wait times out
+        """
+        await self._acquire(duration)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, duration: Optional[float]):
+        """Take a slot, waiting in the priority queue if necessary"""
+        depth = self.queue_depth
+        if self._in_flight < self.max_concurrent and depth == 0:
+            self._in_flight += 1
+            self.stats.admitted += 1
+            return
+
+        if depth >= self.max_queue_size:
+            self.stats.rejected += 1
+            logger.warning(f"STT queue full ({depth} waiting), rejecting request")
+            raise STTOverloadedError(f"STT queue is full ({depth} requests waiting)")
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        priority = started + (duration if duration is not None else self.unknown_duration)
+        future = loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        self.stats.peak_queue_depth = max(self.stats.peak_queue_depth, depth + 1)
+
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout=self.max_wait_seconds)
+        except asyncio.TimeoutError:
+            if future.done():
+                # Slot was handed over just as the timeout fired
+                self._release()
+            future.cancel()
+            self.stats.timed_out += 1
+            raise STTOverloadedError(f"STT queue wait exceeded {self.max_wait_seconds}s")
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release()
+            future.cancel()
+            raise
+
+        waited = loop.time() - started
+        self.stats.admitted += 1
+        self.stats.queued += 1
+        self.stats.wait_seconds += waited
+        self._recent_waits.append(waited)
+
+    def _release(self):
+        """Free a slot, handing it to the highest-priority waiter"""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                # Slot passes directly to the waiter; in_flight is unchanged
+                future.set_result(None)
+                return
+        self._in_flight -= 1
@@ -0,0 +1,200 @@
+"""Audio preprocessing before speech recognition"""
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple, Union
+import io
+import time
+from pydub import AudioSegment
+from pydub.silence import detect_leading_silence
+from loguru import logger
+
+from .process_pool import ProcessPool
+
+
+# Export settings per output format: (file extension, pydub export kwargs)
+OUTPUT_FORMATS = {
+    "opus": ("ogg", {"format": "ogg", "codec": "libopus", "bitrate": "24k"}),
+    "flac": ("flac", {"format": "flac"}),
+    "wav": ("wav", {"format": "wav"}),
+}
+
+
+@dataclass
+class PreprocessResult:
+    """Result of audio preprocessing"""
+    data: bytes
+    filename: str
+    original_bytes: int
+    processed_bytes: int
+    duration_seconds: float
+    trimmed_seconds: float
+    elapsed_seconds: float
+
+
+@dataclass
+class PreprocessStats:
+    """Counters for audio preprocessing"""
+    processed: int = 0
+    failed: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    trimmed_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def bytes_saved(self) -> int:
+        """Total upload bytes saved"""
+        return self.bytes_in - self.bytes_out
+
+    @property
+    def average_latency_ms(self) -> float:
+        """Average latency added by preprocessing"""
+        return self.elapsed_seconds / self.processed * 1000 if self.processed else 0.0
+
+
+def preprocess_audio(
+    data: bytes,
+    input_format: Optional[str],
+    output_format: str = "opus",
+    sample_rate: int = 16000,
+    silence_threshold_db: float = -40.0,
+    keep_silence_ms: int = 150
+) -> Tuple[bytes, float, float]:
+    """
+    Trim silence, downmix to mono, resample and re-encode audio
+
+    Args:
+        data: Encoded audio
+        input_format: Input container format (e.g., 'ogg'); None to autodetect
+        output_format: One of OUTPUT_FORMATS
+        sample_rate: Target sample rate in Hz
+        silence_threshold_db: Level below which audio counts as silence
+        keep_silence_ms: Silence kept at each end to avoid clipping words
+
+    Returns:
+        Tuple of (encoded audio, duration seconds, trimmed seconds)
+    """
+    segment = AudioSegment.from_file(io.BytesIO(data), format=input_format)
+    original_ms = len(segment)
+
+    lead = detect_leading_silence(segment, silence_threshold=silence_threshold_db)
+    trail = detect_leading_silence(segment.reverse(), silence_threshold=silence_threshold_db)
+    start = max(0, lead - keep_silence_ms)
+    end = min(original_ms, original_ms - trail + keep_silence_ms)
+    if end > start:
+        segment = segment[start:end]
+
+    segment = segment.set_channels(1).set_frame_rate(sample_rate)
+
+    out = io.BytesIO()
+    segment.export(out, **OUTPUT_FORMATS[output_format][1])
+    return out.getvalue(), len(segment) / 1000, (original_ms - len(segment)) / 1000
+
+
+class AudioPreprocessor:
+    """
+    Shrinks voice notes before Whisper upload
+
+    Work runs in a process pool so decoding and encoding never block the
+    event loop. If preprocessing fails (e.g., ffmpeg missing) or does not
+    make the audio smaller, the original audio is used unchanged.
+    """
+
+    def __init__(
+        self,
+        output_format: str = "opus",
+        sample_rate: int = 16000,
+        silence_threshold_db: float = -40.0,
+        pool: Optional[ProcessPool] = None
+    ):
+        """
+        Initialize audio preprocessor
+
+        Args:
+            output_format: Output format: 'opus', 'flac' or 'wav'
+            sample_rate: Target sample rate in Hz
+            silence_threshold_db: Silence threshold in dBFS
+            pool: Shared worker pool (default: own pool)
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+
+        self.output_format = output_format
+        self.sample_rate = sample_rate
+        self.silence_threshold_db = silence_threshold_db
+        self.stats = PreprocessStats()
+
+        self.pool = pool or ProcessPool()
+        self._owns_pool = pool is None
+
+    async def process(
+        self,
+        audio: Union[bytes, bytearray, memoryview],
+        filename: str = "audio.ogg"
+    ) -> PreprocessResult:
+        """
+        Preprocess audio in the worker pool
+
+        Args:
+            audio: Encoded audio
+            filename: Original filename (extension used as input format)
+
+        Returns:
+            PreprocessResult with the audio to upload
+        """
+        data = audio if isinstance(audio, bytes) else bytes(audio)
+        input_format = Path(filename).suffix.lstrip(".") or None
+        started = time.perf_counter()
+
+        try:
+            processed, duration, trimmed = await self.pool.run(
+                preprocess_audio,
+                data,
+                input_format,
+                self.output_format,
+                self.sample_rate,
+                self.silence_threshold_db
+            )
+        except Exception as e:
+            logger.warning(f"Audio preprocessing failed, using original audio: {e}")
+            self.stats.failed += 1
+            return PreprocessResult(
+                data=data, filename=filename,
+                original_bytes=len(data), processed_bytes=len(data),
+                duration_seconds=0.0, trimmed_seconds=0.0,
+                elapsed_seconds=time.perf_counter() - started
+            )
+
+        elapsed = time.perf_counter() - started
+
+        if len(processed) < len(data):
+            extension = OUTPUT_FORMATS[self.output_format][0]
+            result_data, result_name = processed, f"{Path(filename).stem}.{extension}"
+        else:
+            result_data, result_name = data, filename
+
+        self.stats.processed += 1
+        self.stats.bytes_in += len(data)
+        self.stats.bytes_out += len(result_data)
+        self.stats.trimmed_seconds += trimmed
+        self.stats.elapsed_seconds += elapsed
+
+        logger.info(
+            f"Audio preprocessed: {len(data)} -> {len(result_data)} bytes, "
+            f"trimmed {trimmed:.1f}s in {elapsed * 1000:.0f}ms"
+        )
+
+        return PreprocessResult(
+            data=result_data,
+            filename=result_name,
+            original_bytes=len(data),
+            processed_bytes=len(result_data),
+            duration_seconds=duration,
+            trimmed_seconds=trimmed,
+            elapsed_seconds=elapsed
+        )
+
+    async def close(self):
+        """Shut down own worker pool"""
+        if self._owns_pool:
+            await self.pool.close()
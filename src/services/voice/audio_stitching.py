@@ -0,0 +1,152 @@
+"""Joining synthesized speech segments into one voice message"""
+from dataclasses import dataclass
+from typing import List, Optional
+import io
+import time
+from pydub import AudioSegment
+from loguru import logger
+
+from .process_pool import ProcessPool
+from .voice_format import VoiceEncoder, VoiceFormatError, export_opus, is_ogg_opus
+
+
+@dataclass
+class StitchStats:
+    """Counters for audio stitching"""
+    stitched: int = 0
+    fallbacks: int = 0
+    failed: int = 0
+    segments: int = 0
+    elapsed_seconds: float = 0.0
+
+
+def concatenate_audio(
+    segments: List[bytes],
+    audio_format: str = "mp3",
+    target_dbfs: float = -20.0,
+    gap_ms: int = 150,
+    bitrate: str = "128k",
+    opus_bitrate: Optional[str] = None
+) -> bytes:
+    """
+    Concatenate audio segments with consistent loudness
+
+    Each segment is gain-adjusted to the same average loudness, and
+    segments are separated by a short pause.
+
+    Args:
+        segments: Encoded audio segments in playback order
+        audio_format: Format of the segments and of the result
+        target_dbfs: Average loudness of every segment
+        gap_ms: Silence inserted between segments
+        bitrate: Output bitrate for lossy formats
+        opus_bitrate: Export mono OGG/Opus at this bitrate instead of audio_format
+
+    Returns:
+        Encoded audio
+    """
+    combined = AudioSegment.empty()
+    gap = AudioSegment.silent(duration=gap_ms)
+
+    for i, data in enumerate(segments):
+        segment = AudioSegment.from_file(io.BytesIO(data), format=audio_format)
+        if segment.dBFS != float("-inf"):
+            segment = segment.apply_gain(target_dbfs - segment.dBFS)
+        if i:
+            combined += gap.set_frame_rate(segment.frame_rate).set_channels(segment.channels)
+        combined += segment
+
+    if opus_bitrate:
+        return export_opus(combined, opus_bitrate)
+
+    out = io.BytesIO()
+    combined.export(out, format=audio_format, bitrate=bitrate)
+    return out.getvalue()
+
+
+class AudioStitcher:
+    """
+    Concatenates speech segments in a worker process pool
+
+    If decoding fails (e.g., ffmpeg missing), MP3 segments are joined
+    byte-wise: MP3 is a sequence of independent frames, so the result
+    still plays, only without loudness normalization. Other formats
+    cannot be joined that way and the error is raised.
+    """
+
+    def __init__(
+        self,
+        audio_format: str = "mp3",
+        target_dbfs: float = -20.0,
+        gap_ms: int = 150,
+        pool: Optional[ProcessPool] = None
+    ):
+        """
+        Initialize audio stitcher
+
+        Args:
+            audio_format: Format of synthesized segments
+            target_dbfs: Average loudness of every segment
+            gap_ms: Silence inserted between segments
+            pool: Shared worker pool (default: own pool)
+        """
+        self.audio_format = audio_format
+        self.target_dbfs = target_dbfs
+        self.gap_ms = gap_ms
+        self.stats = StitchStats()
+
+        self.pool = pool or ProcessPool()
+        self._owns_pool = pool is None
+
+    async def concatenate(self, segments: List[bytes], encoder: Optional[VoiceEncoder] = None) -> bytes:
+        """
+        Concatenate segments in the worker pool
+
+        With an encoder the joined audio is exported as OGG/Opus in the
+        same pass, instead of being encoded in the segment format and
+        transcoded once more.
+
+        Args:
+            segments: Encoded audio segments in playback order
+            encoder: Voice encoder the result is produced for
+
+        Returns:
+            Encoded audio (OGG/Opus with an encoder)
+
+        Raises:
+            VoiceFormatError: If the result cannot be encoded as OGG/Opus,
+                or non-MP3 segments cannot be decoded
+        """
+        if len(segments) == 1:
+            return await encoder.encode(segments[0]) if encoder else segments[0]
+
+        started = time.perf_counter()
+        try:
+            audio = await self.pool.run(
+                concatenate_audio,
+                segments,
+                self.audio_format,
+                self.target_dbfs,
+                self.gap_ms,
+                opus_bitrate=encoder.bitrate if encoder else None
+            )
+            if encoder and not is_ogg_opus(audio):
+                raise VoiceFormatError("Stitched output is not OGG/Opus")
+        except Exception as e:
+            if self.audio_format != "mp3":
+                self.stats.failed += 1
+                raise VoiceFormatError(f"Audio stitching failed: {e}") from e
+            logger.warning(f"Audio stitching failed, joining segments as is: {e}")
+            self.stats.fallbacks += 1
+            joined = b"".join(segments)
+            return await encoder.encode(joined) if encoder else joined
+
+        self.stats.stitched += 1
+        self.stats.segments += len(segments)
+        self.stats.elapsed_seconds += time.perf_counter() - started
+        return audio
+
+    async def close(self):
+        """Shut down own worker pool"""
+        if self._owns_pool:
+            await self.pool.close()
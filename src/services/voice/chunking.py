@@ -0,0 +1,221 @@
+"""Splitting long voice messages for parallel transcription"""
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+import io
+import re
+from pydub import AudioSegment
+from pydub.silence import detect_silence
+from loguru import logger
+
+from .audio_processor import OUTPUT_FORMATS
+from .process_pool import ProcessPool
+
+_WORD_RE = re.compile(r"[\w-]+")
+
+
+@dataclass
+class ChunkStats:
+    """Counters for audio chunking"""
+    split: int = 0
+    chunks: int = 0
+    failed: int = 0
+    silence_cuts: int = 0
+    hard_cuts: int = 0
+
+
+def split_audio(
+    data: bytes,
+    input_format: Optional[str],
+    max_chunk_seconds: float = 20.0,
+    output_format: str = "opus",
+    sample_rate: int = 16000,
+    overlap_ms: int = 500,
+    min_silence_ms: int = 300,
+    silence_threshold_db: float = -40.0
+) -> Tuple[List[bytes], int]:
+    """
+    Split audio into chunks at silence boundaries
+
+    Each chunk is cut at the last pause in the second half of its window.
+    Without a pause the chunk is cut at the maximum length and the next
+    chunk starts `overlap_ms` earlier, so the word on the cut is heard in
+    both chunks and later removed by stitch_transcripts.
+
+    Args:
+        data: Encoded audio
+        input_format: Input container format; None to autodetect
+        max_chunk_seconds: Maximum chunk length
+        output_format: One of OUTPUT_FORMATS
+        sample_rate: Target sample rate in Hz
+        overlap_ms: Overlap used when cutting without a pause
+        min_silence_ms: Minimum pause length used as a cut point
+        silence_threshold_db: Level below which audio counts as silence
+
+    Returns:
+        Tuple of (encoded chunks, number of hard cuts)
+    """
+    segment = AudioSegment.from_file(io.BytesIO(data), format=input_format)
+    segment = segment.set_channels(1).set_frame_rate(sample_rate)
+
+    total_ms = len(segment)
+    max_ms = int(max_chunk_seconds * 1000)
+
+    pauses = [
+        (start + end) // 2
+        for start, end in detect_silence(
+            segment,
+            min_silence_len=min_silence_ms,
+            silence_thresh=silence_threshold_db,
+            seek_step=10
+        )
+    ]
+
+    bounds = []
+    start = 0
+    hard_cuts = 0
+    while total_ms - start > max_ms:
+        limit = start + max_ms
+        candidates = [p for p in pauses if start + max_ms // 2 <= p <= limit]
+        if candidates:
+            cut = next_start = candidates[-1]
+        else:
+            cut, next_start = limit, limit - overlap_ms
+            hard_cuts += 1
+        bounds.append((start, cut))
+        start = next_start
+    bounds.append((start, total_ms))
+
+    export_kwargs = OUTPUT_FORMATS[output_format][1]
+    chunks = []
+    for chunk_start, chunk_end in bounds:
+        out = io.BytesIO()
+        segment[chunk_start:chunk_end].export(out, **export_kwargs)
+        chunks.append(out.getvalue())
+
+    return chunks, hard_cuts
+
+
+def _normalize_word(word: str) -> str:
+    """Lowercase word without punctuation for overlap matching"""
+    match = _WORD_RE.search(word.lower())
+    return match.group(0) if match else ""
+
+
+def stitch_transcripts(texts: List[str], max_overlap_words: int = 8) -> str:
+    """
+    Join chunk transcripts in order, removing duplicated overlap
+
+    If the first words of a chunk repeat the last words of the text so
+    far (ignoring case and punctuation), the repeated words are dropped.
+
+    Args:
+        texts: Transcripts in chunk order
+        max_overlap_words: Longest overlap searched for
+
+    Returns:
+        Stitched text
+    """
+    words: List[str] = []
+
+    for text in texts:
+        new_words = text.split()
+        if not new_words:
+            continue
+
+        tail = [_normalize_word(w) for w in words[-max_overlap_words:]]
+        head = [_normalize_word(w) for w in new_words[:max_overlap_words]]
+
+        overlap = 0
+        for size in range(min(len(tail), len(head)), 0, -1):
+            if tail[-size:] == head[:size]:
+                overlap = size
+                break
+
+        words.extend(new_words[overlap:])
+
+    return " ".join(words)
+
+
+class AudioChunker:
+    """
+    Splits long voice messages into chunks in a worker process pool
+
+    Splitting fails soft: if audio cannot be decoded (e.g., ffmpeg missing)
+    an empty list is returned and the caller transcribes the whole file.
+    """
+
+    def __init__(
+        self,
+        max_chunk_seconds: float = 20.0,
+        output_format: str = "opus",
+        overlap_ms: int = 500,
+        pool: Optional[ProcessPool] = None
+    ):
+        """
+        Initialize audio chunker
+
+        Args:
+            max_chunk_seconds: Maximum chunk length in seconds
+            output_format: Chunk format: 'opus', 'flac' or 'wav'
+            overlap_ms: Overlap used when no pause is found
+            pool: Shared worker pool (default: own pool)
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+
+        self.max_chunk_seconds = max_chunk_seconds
+        self.output_format = output_format
+        self.overlap_ms = overlap_ms
+        self.stats = ChunkStats()
+
+        self.pool = pool or ProcessPool()
+        self._owns_pool = pool is None
+
+    async def split(
+        self,
+        audio: Union[bytes, bytearray, memoryview],
+        filename: str = "audio.ogg"
+    ) -> List[Tuple[bytes, str]]:
+        """
+        Split audio in the worker pool
+
+        Args:
+            audio: Encoded audio
+            filename: Original filename (extension used as input format)
+
+        Returns:
+            List of (chunk audio, chunk filename); empty if splitting failed
+        """
+        data = audio if isinstance(audio, bytes) else bytes(audio)
+        input_format = Path(filename).suffix.lstrip(".") or None
+
+        try:
+            chunks, hard_cuts = await self.pool.run(
+                split_audio,
+                data,
+                input_format,
+                self.max_chunk_seconds,
+                self.output_format,
+                16000,
+                self.overlap_ms
+            )
+        except Exception as e:
+            logger.warning(f"Audio chunking failed, transcribing as a whole: {e}")
+            self.stats.failed += 1
+            return []
+
+        self.stats.split += 1
+        self.stats.chunks += len(chunks)
+        self.stats.hard_cuts += hard_cuts
+        self.stats.silence_cuts += len(chunks) - 1 - hard_cuts
+
+        extension = OUTPUT_FORMATS[self.output_format][0]
+        stem = Path(filename).stem
+        logger.info(f"Audio split into {len(chunks)} chunks ({hard_cuts} without a pause)")
+        return [(chunk, f"{stem}_{i}.{extension}") for i, chunk in enumerate(chunks)]
+
+    async def close(self):
+        """Shut down own worker pool"""
+        if self._owns_pool:
+            await self.pool.close()
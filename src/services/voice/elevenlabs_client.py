@@ -0,0 +1,170 @@
+"""Async streaming client for the ElevenLabs text-to-speech API"""
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+import time
+import aiohttp
+from loguru import logger
+
+
+class ElevenLabsError(Exception):
+    """Raised when the ElevenLabs API returns an error"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"ElevenLabs API error {status}: {message}")
+        self.status = status
+
+
+@dataclass
+class StreamingStats:
+    """Latency counters for streamed synthesis"""
+    requests: int = 0
+    bytes_received: int = 0
+    first_byte_seconds: float = 0.0
+    total_seconds: float = 0.0
+
+    @property
+    def average_first_byte_ms(self) -> float:
+        """Average time to first audio byte"""
+        return self.first_byte_seconds / self.requests * 1000 if self.requests else 0.0
+
+    @property
+    def average_total_ms(self) -> float:
+        """Average time to complete audio"""
+        return self.total_seconds / self.requests * 1000 if self.requests else 0.0
+
+
+class ElevenLabsStreamingClient:
+    """
+    Native async client for /v1/text-to-speech/{voice_id}/stream
+
+    Uses one pooled aiohttp session so TLS connections are reused across
+    replies, and reads audio chunks as they arrive instead of tying up an
+    executor thread for the whole synthesis.
+    """
+
+    BASE_URL = "https://api.elevenlabs.io"
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = BASE_URL,
+        max_connections: int = 10,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 60.0,
+        chunk_size: int = 16 * 1024
+    ):
+        """
+        Initialize streaming client
+
+        Args:
+            api_key: ElevenLabs API key
+            base_url: API base URL
+            max_connections: Connection pool size
+            connect_timeout: Connection timeout in seconds
+            read_timeout: Timeout between received chunks in seconds
+            chunk_size: Read size for streamed audio
+        """
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.max_connections = max_connections
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.chunk_size = chunk_size
+        self.stats = StreamingStats()
+
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Create pooled session lazily (requires running event loop)"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(sock_connect=self.connect_timeout, sock_read=self.read_timeout),
+                headers={"xi-api-key": self.api_key}
+            )
+        return self._session
+
+    async def stream(
+        self,
+        text: str,
+        voice_id: str,
+        model_id: str = "eleven_multilingual_v2",
+        output_format: str = "mp3_44100_128"
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream synthesized audio chunks
+
+        Args:
+            text: Text to convert to speech
+            voice_id: Voice ID
+            model_id: TTS model
+            output_format: ElevenLabs output format
+
+        Yields:
+            Audio chunks as they arrive
+
+        Raises:
+            ElevenLabsError: If the API returns an error status
+        """
+        url = f"{self.base_url}/v1/text-to-speech/{voice_id}/stream"
+        started = time.perf_counter()
+        first_byte: Optional[float] = None
+        received = 0
+
+        async with self._get_session().post(
+            url,
+            params={"output_format": output_format},
+            json={"text": text, "model_id": model_id}
+        ) as response:
+            if response.status != 200:
+                raise ElevenLabsError(response.status, await response.text())
+
+            async for chunk in response.content.iter_chunked(self.chunk_size):
+                if first_byte is None:
+                    first_byte = time.perf_counter() - started
+                received += len(chunk)
+                yield chunk
+
+        total = time.perf_counter() - started
+        self.stats.requests += 1
+        self.stats.bytes_received += received
+        self.stats.first_byte_seconds += first_byte or total
+        self.stats.total_seconds += total
+        logger.info(
+            f"ElevenLabs stream: {received} bytes, first byte {(first_byte or total) * 1000:.0f}ms, "
+            f"total {total * 1000:.0f}ms"
+        )
+
+    async def synthesize(
+        self,
+        text: str,
+        voice_id: str,
+        model_id: str = "eleven_multilingual_v2",
+        output_format: str = "mp3_44100_128"
+    ) -> bytes:
+        """
+        Synthesize complete audio
+
+        Telegram uploads need the whole file, so the streamed chunks are
+        joined once at the end, copying each byte a single time.
+
+        Args:
+            text: Text to convert to speech
+            voice_id: Voice ID
+            model_id: TTS model
+            output_format: ElevenLabs output format
+
+        Returns:
+            Audio data
+
+        Raises:
+            ElevenLabsError: If the API returns an error status
+        """
+        chunks = [chunk async for chunk in self.stream(text, voice_id, model_id, output_format)]
+        return b"".join(chunks)
+
+    async def close(self):
+        """Close pooled session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -0,0 +1,317 @@
+"""Reply audio assembled from pre-rendered phrase fragments"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import re
+import time
+from loguru import logger
+
+from .audio_stitching import AudioStitcher
+from .tts_cache import TTSCache
+from .tts_service import TTSService
+
+_ONES = [
+    "ноль", "один", "два", "три", "четыре", "пять", "шесть", "семь", "восемь", "девять",
+    "десять", "одиннадцать", "двенадцать", "тринадцать", "четырнадцать", "пятнадцать",
+    "шестнадцать", "семнадцать", "восемнадцать", "девятнадцать",
+]
+_TENS = ["", "", "двадцать", "тридцать", "сорок", "пятьдесят", "шестьдесят", "семьдесят", "восемьдесят", "девяносто"]
+
+# Whole replies and phrases rendered once
+FIXED_PHRASES = [
+    "У вас нет событий на сегодня. Вы свободны!",
+    "У вас нет событий на завтра. Вы свободны!",
+    "У вас нет событий. Вы свободны!",
+    "Извините, я не понял вашу команду. Попробуйте сказать: 'Что сегодня в календаре?'",
+    "Эта команда пока не поддерживается.",
+    "У вас",
+    "событие",
+    "события",
+    "событий",
+    "на сегодня",
+    "на завтра",
+    "Найдено событий:",
+    "с",
+    "до",
+    "ноль-ноль",
+    "Участников:",
+    "Место:",
+    "в",
+    "Первое —",
+    "последнее —",
+    "Полный список — в сообщении.",
+]
+
+# Model tag of assembled replies in the TTS cache
+PHRASE_MODEL = "phrase_library"
+
+_EVENTS = r"(\d+) (?:событие|события|событий)"
+_AT = r"«(.+?)» в (\d{1,2}):(\d{2})"
+_HEADER_RE = re.compile(rf"^У вас {_EVENTS} (.+):$")
+_SUMMARY_ONE_RE = re.compile(rf"^У вас {_EVENTS}(?: (.+?))?: {_AT}\.$")
+_SUMMARY_RE = re.compile(
+    rf"^У вас {_EVENTS}(?: (.+?))?\. Первое — {_AT}, последнее — {_AT}\. Полный список — в сообщении\.$"
+)
+_FOUND_RE = re.compile(r"^Найдено событий: (\d+)$")
+_ITEM_RE = re.compile(r"^(\d+)\. (.+)$")
+_TIME_RE = re.compile(r"^Время: (\d{1,2}):(\d{2}) - (\d{1,2}):(\d{2})$")
+_ATTENDEES_RE = re.compile(r"^Участники: (\d+)$")
+_PLACE_RE = re.compile(r"^Место: (.+)$")
+
+FRAGMENT = "fragment"
+TEXT = "text"
+
+
+def number_words(n: int) -> str:
+    """Russian cardinal number for 0..99"""
+    if n < 20:
+        return _ONES[n]
+    tens, ones = divmod(n, 10)
+    return _TENS[tens] if ones == 0 else f"{_TENS[tens]} {_ONES[ones]}"
+
+
+def events_word(n: int) -> str:
+    """Plural form of 'событие' agreeing with n"""
+    if n % 10 == 1 and n % 100 != 11:
+        return "событие"
+    if 2 <= n % 10 <= 4 and not 12 <= n % 100 <= 14:
+        return "события"
+    return "событий"
+
+
+def fragment_texts() -> List[str]:
+    """All fragments of the library"""
+    return FIXED_PHRASES + [number_words(n) for n in range(100)]
+
+
+@dataclass
+class PhraseStats:
+    """Counters for fragment-based replies"""
+    replies: int = 0
+    fragments_used: int = 0
+    text_segments: int = 0
+    fragment_misses: int = 0
+
+
+class PhraseLibrary:
+    """
+    Assembles reply audio from pre-rendered fragments and dynamic slots
+
+    Replies produced by BotHandlers are matched line by line against
+    known templates (headers, 'Время: HH:MM - HH:MM', counts, spoken
+    summaries, fixed replies). Template words, numbers and times come
+    from the fragment library; only free text such as event titles is
+    sent to ElevenLabs. Assembled replies are kept in the TTS service's
+    cache. Exposes the same synthesize() interface as TTSService.
+    """
+
+    def __init__(
+        self,
+        tts_service: TTSService,
+        stitcher: AudioStitcher,
+        max_concurrency: int = 3
+    ):
+        """
+        Initialize phrase library
+
+        Args:
+            tts_service: Service used to render fragments and free text
+            stitcher: Joins fragments into one message
+            max_concurrency: Maximum concurrent synthesis requests
+        """
+        self.tts_service = tts_service
+        self.stitcher = stitcher
+        self.max_concurrency = max_concurrency
+        self.stats = PhraseStats()
+
+        self._fragments: Dict[str, bytes] = {}
+
+    @property
+    def fragment_count(self) -> int:
+        """Fragments rendered so far"""
+        return len(self._fragments)
+
+    async def warm_up(self):
+        """Render every fragment that is not loaded yet"""
+        missing = [text for text in fragment_texts() if text not in self._fragments]
+        if not missing:
+            return
+
+        logger.info(f"Rendering {len(missing)} phrase fragments...")
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def render(text: str):
+            async with semaphore:
+                try:
+                    self._fragments[text] = await self.tts_service.synthesize(text, raw=True)
+                except Exception as e:
+                    logger.warning(f"Failed to render phrase fragment '{text}': {e}")
+
+        await asyncio.gather(*(render(text) for text in missing))
+        logger.info(f"Phrase library ready ({len(self._fragments)} fragments)")
+
+    def plan(self, text: str) -> List[Tuple[str, str]]:
+        """
+        Split reply into fragment and free-text parts
+
+        Args:
+            text: Reply text
+
+        Returns:
+            List of (FRAGMENT or TEXT, text) in playback order
+        """
+        parts: List[Tuple[str, str]] = []
+
+        def fragment(value: str):
+            parts.append((FRAGMENT, value))
+
+        def free_text(value: str):
+            # Adjacent free text goes out as one request
+            if parts and parts[-1][0] == TEXT:
+                parts[-1] = (TEXT, f"{parts[-1][1]} {value}")
+            else:
+                parts.append((TEXT, value))
+
+        def number(n: int):
+            if n < 100:
+                fragment(number_words(n))
+            else:
+                free_text(str(n))
+
+        def clock(hours: int, minutes: int):
+            number(hours)
+            if minutes == 0:
+                fragment("ноль-ноль")
+            elif minutes < 10:
+                fragment(number_words(0))
+                number(minutes)
+            else:
+                number(minutes)
+
+        def events(count: int, context: Optional[str]):
+            fragment("У вас")
+            number(count)
+            fragment(events_word(count))
+            if context in FIXED_PHRASES:
+                fragment(context)
+            elif context:
+                free_text(context)
+
+        def title_at(title: str, hours: str, minutes: str):
+            free_text(title)
+            fragment("в")
+            clock(int(hours), int(minutes))
+
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+
+            if line in FIXED_PHRASES:
+                fragment(line)
+            elif match := _HEADER_RE.match(line):
+                events(int(match.group(1)), match.group(2))
+            elif match := _SUMMARY_ONE_RE.match(line):
+                events(int(match.group(1)), match.group(2))
+                title_at(*match.group(3, 4, 5))
+            elif match := _SUMMARY_RE.match(line):
+                events(int(match.group(1)), match.group(2))
+                fragment("Первое —")
+                title_at(*match.group(3, 4, 5))
+                fragment("последнее —")
+                title_at(*match.group(6, 7, 8))
+                fragment("Полный список — в сообщении.")
+            elif match := _FOUND_RE.match(line):
+                fragment("Найдено событий:")
+                number(int(match.group(1)))
+            elif match := _ITEM_RE.match(line):
+                number(int(match.group(1)))
+                free_text(match.group(2))
+            elif match := _TIME_RE.match(line):
+                h1, m1, h2, m2 = (int(g) for g in match.groups())
+                fragment("с")
+                clock(h1, m1)
+                fragment("до")
+                clock(h2, m2)
+            elif match := _ATTENDEES_RE.match(line):
+                fragment("Участников:")
+                number(int(match.group(1)))
+            elif match := _PLACE_RE.match(line):
+                fragment("Место:")
+                free_text(match.group(1))
+            else:
+                free_text(line)
+
+        return parts
+
+    async def synthesize(self, text: str, voice_id: Optional[str] = None, **kwargs) -> bytes:
+        """
+        Synthesize reply from fragments and free-text segments
+
+        Custom voices bypass the library, since fragments use the default voice.
+        The assembled reply is encoded for Telegram voice like TTSService output
+        and cached by text, voice and format.
+
+        Args:
+            text: Reply text
+            voice_id: Optional voice ID
+            **kwargs: Passed to TTSService.synthesize
+
+        Returns:
+            Audio data as bytes
+
+        Raises:
+            ValueError: If text is empty
+        """
+        if not text or not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        if voice_id is not None or kwargs:
+            return await self.tts_service.synthesize(text, voice_id=voice_id, **kwargs)
+
+        encoder = self.tts_service.voice_encoder
+        cache = self.tts_service.cache
+        cache_key = None
+        if cache:
+            output_format = encoder.format_id if encoder else self.tts_service.output_format
+            cache_key = TTSCache.make_key(text, self.tts_service.voice_id, PHRASE_MODEL, output_format)
+            cached = await cache.get(cache_key)
+            if cached is not None:
+                self.stats.replies += 1
+                return cached
+
+        started = time.perf_counter()
+        parts = self.plan(text)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def render(kind: str, value: str) -> bytes:
+            if kind == FRAGMENT and value in self._fragments:
+                self.stats.fragments_used += 1
+                return self._fragments[value]
+
+            async with semaphore:
+                audio = await self.tts_service.synthesize(value, raw=True)
+
+            if kind == FRAGMENT:
+                self.stats.fragment_misses += 1
+                self._fragments[value] = audio
+            else:
+                self.stats.text_segments += 1
+            return audio
+
+        audio_parts = await asyncio.gather(*(render(kind, value) for kind, value in parts))
+        if len(audio_parts) == 1:
+            # Nothing to stitch: the fragment only needs the voice format
+            audio = await encoder.encode(audio_parts[0]) if encoder else audio_parts[0]
+        else:
+            audio = await self.stitcher.concatenate(list(audio_parts), encoder)
+
+        self.stats.replies += 1
+        if cache_key:
+            await cache.set(cache_key, audio, time.perf_counter() - started)
+        return audio
+
+    async def close(self):
+        """Close wrapped TTS service"""
+        if hasattr(self.tts_service, "close"):
+            await self.tts_service.close()
@@ -0,0 +1,72 @@
+"""Worker process pool for CPU-bound audio work"""
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional, Set, TypeVar
+import asyncio
+
+T = TypeVar("T")
+
+
+class ProcessPool:
+    """
+    Lazily started process pool shared by audio components
+
+    Decoding and encoding (preprocessing, chunking, stitching, Opus
+    encoding) go through one pool, so the number of ffmpeg workers stays
+    bounded however many components are enabled. Functions passed to
+    run() execute in a worker process: they must be module-level and
+    only take and return picklable values.
+    """
+
+    def __init__(self, max_workers: int = 2, executor: Optional[Executor] = None):
+        """
+        Initialize process pool
+
+        Args:
+            max_workers: Worker processes (when executor is not given)
+            executor: Custom executor (default: process pool)
+        """
+        self.max_workers = max_workers
+
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._jobs: Set[Future] = set()
+
+    @property
+    def busy(self) -> int:
+        """
+        Jobs submitted and not finished yet
+
+        A job whose caller was cancelled keeps running in its worker, so it
+        is counted until the worker is actually free.
+        """
+        self._jobs = {job for job in self._jobs if not job.done()}
+        return len(self._jobs)
+
+    def _get_executor(self) -> Executor:
+        """Create process pool lazily"""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a function in a worker
+
+        Args:
+            func: Module-level function
+            *args: Picklable arguments
+            **kwargs: Picklable keyword arguments
+
+        Returns:
+            Result of the function
+        """
+        job = self._get_executor().submit(partial(func, *args, **kwargs))
+        self._jobs.add(job)
+        return await asyncio.wrap_future(job)
+
+    async def close(self):
+        """Shut down worker processes (a custom executor is left to its owner)"""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,401 @@
+"""Speech-to-text backends: Whisper API, local CPU engine and test stub"""
+from abc import ABC, abstractmethod
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Type, Union
+import asyncio
+import hashlib
+import io
+from openai import AsyncOpenAI
+from loguru import logger
+
+from src.services.hedging import RequestHedger
+from .process_pool import ProcessPool
+
+try:
+    import faster_whisper  # noqa: F401
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+AudioData = Union[bytes, bytearray, memoryview]
+
+_BACKENDS: Dict[str, Type["STTBackend"]] = {}
+
+
+def register_backend(name: str) -> Callable[[Type["STTBackend"]], Type["STTBackend"]]:
+    """
+    Class decorator registering an STT backend under a name
+
+    Args:
+        name: Backend name used in configuration (e.g., 'whisper_api')
+
+    Returns:
+        Decorator returning the class unchanged
+    """
+    def decorator(cls: Type["STTBackend"]) -> Type["STTBackend"]:
+        cls.name = name
+        _BACKENDS[name] = cls
+        return cls
+    return decorator
+
+
+def create_backend(name: str, **options) -> "STTBackend":
+    """
+    Create registered STT backend
+
+    Args:
+        name: Registered backend name
+        **options: Backend constructor arguments
+
+    Returns:
+        Backend instance
+
+    Raises:
+        ValueError: If backend name is unknown
+    """
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown STT backend: {name} (available: {', '.join(available_backends())})")
+    return _BACKENDS[name](**options)
+
+
+def available_backends() -> List[str]:
+    """Names of registered STT backends"""
+    return sorted(_BACKENDS)
+
+
+class STTBackend(ABC):
+    """Engine that turns encoded audio into text"""
+
+    name: str = "backend"
+
+    # Concurrent requests the backend serves without queueing (None: unbounded)
+    capacity: Optional[int] = None
+
+    @property
+    def busy(self) -> int:
+        """Jobs still occupying the backend, including abandoned ones (0: not tracked)"""
+        return 0
+
+    @abstractmethod
+    async def transcribe(
+        self,
+        audio: AudioData,
+        filename: str = "audio.ogg",
+        language: Optional[str] = None,
+        duration: Optional[float] = None
+    ) -> str:
+        """
+        Transcribe audio
+
+        Args:
+            audio: Encoded audio
+            filename: Filename for format detection
+            language: Optional language code
+            duration: Audio duration in seconds, if known
+
+        Returns:
+            Transcribed text
+        """
+
+    async def close(self):
+        """Release backend resources"""
+
+
+@register_backend("whisper_api")
+class WhisperAPIBackend(STTBackend):
+    """Remote OpenAI Whisper API"""
+
+    def __init__(
+        self,
+        client: Optional[AsyncOpenAI] = None,
+        model: str = "whisper-1",
+        hedger: Optional[RequestHedger] = None,
+        api_key: Optional[str] = None
+    ):
+        """
+        Initialize Whisper API backend
+
+        Args:
+            client: Shared OpenAI client (default: create own client)
+            model: Whisper model to use
+            hedger: Optional hedger for tail-latency protection
+            api_key: OpenAI API key (used when client is not given)
+        """
+        self.client = client or AsyncOpenAI(api_key=api_key)
+        self._owns_client = client is None
+        self.model = model
+        self.hedger = hedger
+
+    async def transcribe(
+        self,
+        audio: AudioData,
+        filename: str = "audio.ogg",
+        language: Optional[str] = None,
+        duration: Optional[float] = None
+    ) -> str:
+        """Call Whisper API, hedging the request if a hedger is configured"""
+        # The HTTP upload needs bytes: convert buffer views exactly once,
+        # BytesIO over bytes shares the buffer instead of copying it
+        data = audio if isinstance(audio, bytes) else bytes(audio)
+
+        async def attempt() -> str:
+            # Each attempt needs its own file object
+            audio_file = io.BytesIO(data)
+            audio_file.name = filename
+
+            transcription_params = {
+                "model": self.model,
+                "file": audio_file
+            }
+
+            if language:
+                transcription_params["language"] = language
+
+            response = await self.client.audio.transcriptions.create(
+                **transcription_params
+            )
+            return response.text
+
+        if self.hedger:
+            return await self.hedger.run(attempt)
+        return await attempt()
+
+    async def close(self):
+        """Close OpenAI client (shared clients are closed by their owner)"""
+        if self._owns_client:
+            await self.client.close()
+
+
+# Models loaded in worker processes, keyed by (model size, compute type)
+_local_models: Dict[tuple, object] = {}
+
+
+def transcribe_locally(
+    data: bytes,
+    language: Optional[str],
+    model_size: str = "base",
+    compute_type: str = "int8"
+) -> str:
+    """
+    Transcribe audio with faster-whisper on CPU
+
+    Runs in a worker process; the model is loaded once per process.
+
+    Args:
+        data: Encoded audio
+        language: Optional language code
+        model_size: Whisper model size (e.g., 'tiny', 'base', 'small')
+        compute_type: CTranslate2 compute type
+
+    Returns:
+        Transcribed text
+    """
+    from faster_whisper import WhisperModel
+
+    key = (model_size, compute_type)
+    if key not in _local_models:
+        _local_models[key] = WhisperModel(model_size, device="cpu", compute_type=compute_type)
+
+    segments, _ = _local_models[key].transcribe(io.BytesIO(data), language=language, beam_size=1)
+    return " ".join(segment.text.strip() for segment in segments)
+
+
+@register_backend("local")
+class LocalWhisperBackend(STTBackend):
+    """
+    Local Whisper engine on CPU (faster-whisper) in a process pool
+
+    Capacity equals the number of workers, so the router only sends work
+    here while a worker is free and latency stays bounded.
+    """
+
+    def __init__(
+        self,
+        model_size: str = "base",
+        compute_type: str = "int8",
+        max_workers: int = 1,
+        pool: Optional[ProcessPool] = None
+    ):
+        """
+        Initialize local Whisper backend
+
+        Args:
+            model_size: Whisper model size
+            compute_type: CTranslate2 compute type
+            max_workers: Worker processes (when pool is not given)
+            pool: Worker pool with the model loaded per process (default: own pool)
+
+        Raises:
+            RuntimeError: If faster-whisper is not installed
+        """
+        if not FASTER_WHISPER_AVAILABLE and pool is None:
+            raise RuntimeError("Local STT requires the 'faster-whisper' package")
+
+        self.model_size = model_size
+        self.compute_type = compute_type
+        self.pool = pool or ProcessPool(max_workers=max_workers)
+        self._owns_pool = pool is None
+        self.capacity = self.pool.max_workers
+
+    @property
+    def busy(self) -> int:
+        """Workers still transcribing, counting jobs of cancelled requests"""
+        return self.pool.busy
+
+    async def transcribe(
+        self,
+        audio: AudioData,
+        filename: str = "audio.ogg",
+        language: Optional[str] = None,
+        duration: Optional[float] = None
+    ) -> str:
+        """Transcribe audio in the worker pool"""
+        data = audio if isinstance(audio, bytes) else bytes(audio)
+        return await self.pool.run(
+            transcribe_locally,
+            data,
+            language,
+            self.model_size,
+            self.compute_type
+        )
+
+    async def close(self):
+        """Shut down own worker pool"""
+        if self._owns_pool:
+            await self.pool.close()
+
+
+@register_backend("stub")
+class StubSTTBackend(STTBackend):
+    """
+    Deterministic backend for tests and load tests (no network)
+
+    Returns the text registered for the audio's SHA-256 hash, or the
+    default text, after an optional fixed latency.
+    """
+
+    def __init__(
+        self,
+        text: str = "что сегодня в календаре",
+        responses: Optional[Dict[str, str]] = None,
+        latency_ms: float = 0.0
+    ):
+        """
+        Initialize stub backend
+
+        Args:
+            text: Default transcription
+            responses: Transcriptions keyed by SHA-256 hex digest of audio
+            latency_ms: Simulated latency per request
+        """
+        self.text = text
+        self.responses = responses or {}
+        self.latency_ms = latency_ms
+        self.calls = 0
+
+    async def transcribe(
+        self,
+        audio: AudioData,
+        filename: str = "audio.ogg",
+        language: Optional[str] = None,
+        duration: Optional[float] = None
+    ) -> str:
+        """Return canned transcription"""
+        self.calls += 1
+        if self.latency_ms > 0:
+            await asyncio.sleep(self.latency_ms / 1000)
+        return self.responses.get(hashlib.sha256(audio).hexdigest(), self.text)
+
+
+@dataclass
+class RouterStats:
+    """Requests served per backend"""
+    routed: Counter = field(default_factory=Counter)
+
+
+class STTRouter(STTBackend):
+    """
+    Chooses between a default and a local backend per request
+
+    Short audio (up to `local_max_duration` seconds) goes to the local
+    backend while the default backend has at least `queue_depth_threshold`
+    requests in flight and the local backend has spare capacity. With a
+    threshold of 0 all short audio is transcribed locally.
+    """
+
+    name = "router"
+
+    def __init__(
+        self,
+        default: STTBackend,
+        local: STTBackend,
+        local_max_duration: float = 10.0,
+        queue_depth_threshold: int = 4
+    ):
+        """
+        Initialize STT router
+
+        Args:
+            default: Backend used unless routing rules pick the local one
+            local: Backend for short audio under load
+            local_max_duration: Longest audio (seconds) sent to local backend
+            queue_depth_threshold: Default backend depth that triggers local routing
+        """
+        self.default = default
+        self.local = local
+        self.local_max_duration = local_max_duration
+        self.queue_depth_threshold = queue_depth_threshold
+        self.stats = RouterStats()
+
+        self._in_flight: Counter = Counter()
+
+    def queue_depth(self, backend: STTBackend) -> int:
+        """
+        Requests currently in flight on backend
+
+        A cancelled request leaves the router at once, but its job may keep
+        a worker busy, so the backend's own count wins when it is higher.
+        """
+        return max(self._in_flight[backend.name], backend.busy)
+
+    def select(self, duration: Optional[float]) -> STTBackend:
+        """
+        Pick backend for audio of given duration
+
+        Args:
+            duration: Audio duration in seconds (None: unknown)
+
+        Returns:
+            Selected backend
+        """
+        if duration is None or duration > self.local_max_duration:
+            return self.default
+        if self.queue_depth(self.default) < self.queue_depth_threshold:
+            return self.default
+        if self.local.capacity is not None and self.queue_depth(self.local) >= self.local.capacity:
+            return self.default
+        return self.local
+
+    async def transcribe(
+        self,
+        audio: AudioData,
+        filename: str = "audio.ogg",
+        language: Optional[str] = None,
+        duration: Optional[float] = None
+    ) -> str:
+        """Transcribe with the selected backend"""
+        backend = self.select(duration)
+        self.stats.routed[backend.name] += 1
+        self._in_flight[backend.name] += 1
+        try:
+            if backend is self.local:
+                logger.debug(f"Routing {duration}s audio to {backend.name} STT backend")
+            return await backend.transcribe(audio, filename, language, duration)
+        finally:
+            self._in_flight[backend.name] -= 1
+
+    async def close(self):
+        """Close both backends"""
+        await self.default.close()
+        await self.local.close()
@@ -1,39 +1,105 @@
-"""Speech-to-Text service using OpenAI Whisper"""
+"""Speech-to-Text service using OpenAI Whisper or a pluggable backend"""
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Optional
-import io
+from typing import AsyncContextManager, List, Optional, Union
+import asyncio
 from openai import AsyncOpenAI
 from loguru import logger
 
+from src.services.hedging import RequestHedger
+from .admission import AdmissionController
+from .audio_processor import AudioPreprocessor
+from .chunking import AudioChunker, stitch_transcripts
+from .stt_backends import STTBackend, WhisperAPIBackend
+from .transcription_cache import TranscriptionCache
+
+
+def _read_file(path: Path) -> bytes:
+    """Read whole file (called in a worker thread)"""
+    with open(path, "rb") as audio_file:
+        return audio_file.read()
+
 
 class STTService:
-    """Speech-to-Text service using OpenAI Whisper API"""
+    """Speech-to-Text service using OpenAI Whisper API by default"""
 
-    def __init__(self, api_key: str, model: str = "whisper-1"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "whisper-1",
+        client: Optional[AsyncOpenAI] = None,
+        hedger: Optional[RequestHedger] = None,
+        preprocessor: Optional[AudioPreprocessor] = None,
+        cache: Optional[TranscriptionCache] = None,
+        chunker: Optional[AudioChunker] = None,
+        chunk_concurrency: int = 4,
+        backend: Optional[STTBackend] = None,
+        admission: Optional[AdmissionController] = None
+    ):
         """
         Initialize STT service
 
         Args:
             api_key: OpenAI API key
             model: Whisper model to use (default: whisper-1)
+            client: Shared OpenAI client (default: create own client)
+            hedger: Optional hedger for tail-latency protection
+            preprocessor: Optional audio preprocessor applied to bytes input
+            cache: Optional transcription cache for bytes input
+            chunker: Optional splitter for long audio (transcribed in parallel)
+            chunk_concurrency: Maximum concurrent chunk requests per message
+            backend: Transcription backend (default: Whisper API with the
+                client, model and hedger above)
+            admission: Optional admission controller limiting concurrent
+                transcriptions (short audio is admitted first)
         """
         self.api_key = api_key
         self.model = model
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.hedger = hedger
+        self.backend = backend or WhisperAPIBackend(
+            client=client, model=model, hedger=hedger, api_key=api_key
+        )
+        self.preprocessor = preprocessor
+        self.cache = cache
+        self.chunker = chunker
+        self.chunk_concurrency = chunk_concurrency
+        self.admission = admission
 
-    async def transcribe(self, audio_path: str, language: Optional[str] = None) -> str:
+    @property
+    def client(self) -> Optional[AsyncOpenAI]:
+        """OpenAI client of the backend (None for non-API backends)"""
+        return getattr(self.backend, "client", None)
+
+    @client.setter
+    def client(self, value: AsyncOpenAI):
+        self.backend.client = value
+
+    async def transcribe(
+        self,
+        audio_path: str,
+        language: Optional[str] = None,
+        file_unique_id: Optional[str] = None,
+        duration: Optional[float] = None
+    ) -> str:
         """
         Transcribe audio file to text
 
+        The file is read in a worker thread, so large voice files spilled
+        to disk do not block the event loop, and then goes through the
+        same cache, preprocessing and chunking as transcribe_bytes.
+
         Args:
             audio_path: Path to audio file
             language: Optional language code (e.g., 'ru', 'en')
+            file_unique_id: Telegram file_unique_id used as cache key
+            duration: Audio duration in seconds; long audio is chunked
 
         Returns:
             Transcribed text
 
         Raises:
             FileNotFoundError: If audio file doesn't exist
+            STTOverloadedError: If the admission queue is full
             Exception: If API call fails
         """
         audio_file_path = Path(audio_path)
@@ -41,81 +107,175 @@ class STTService:
         if not audio_file_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-        try:
-            with open(audio_file_path, "rb") as audio_file:
-                logger.info(f"Transcribing audio file: {audio_path}")
+        logger.info(f"Transcribing audio file: {audio_path}")
+        loop = asyncio.get_running_loop()
+        audio_data = await loop.run_in_executor(None, _read_file, audio_file_path)
+        return await self.transcribe_bytes(
+            audio_data,
+            filename=audio_file_path.name,
+            language=language,
+            file_unique_id=file_unique_id,
+            duration=duration
+        )
 
-                # Prepare transcription parameters
-                transcription_params = {
-                    "model": self.model,
-                    "file": audio_file
-                }
+    async def get_cached_transcription(
+        self,
+        file_unique_id: str,
+        language: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Look up transcription by Telegram file_unique_id
 
-                if language:
-                    transcription_params["language"] = language
+        Lets callers skip downloading audio that was already transcribed.
 
-                # Call Whisper API
-                response = await self.client.audio.transcriptions.create(
-                    **transcription_params
-                )
+        Args:
+            file_unique_id: Telegram file_unique_id of the voice message
+            language: Language code the audio was transcribed with
 
-                text = response.text
-                logger.info(f"Transcription successful: {text[:50]}...")
-                return text
+        Returns:
+            Cached text or None
+        """
+        if not self.cache or not file_unique_id:
+            return None
 
-        except Exception as e:
-            logger.error(f"Transcription failed: {e}")
-            raise
+        text = await self.cache.get(self._cache_key(f"file:{file_unique_id}", language))
+        if text is not None:
+            logger.info(f"Transcription cache hit for file {file_unique_id}")
+        return text
 
     async def transcribe_bytes(
         self,
-        audio_bytes: bytes,
+        audio_bytes: Union[bytes, bytearray, memoryview],
         filename: str = "audio.ogg",
-        language: Optional[str] = None
+        language: Optional[str] = None,
+        file_unique_id: Optional[str] = None,
+        duration: Optional[float] = None
     ) -> str:
         """
         Transcribe audio from bytes
 
         Args:
-            audio_bytes: Audio data as bytes
+            audio_bytes: Audio data as bytes or a zero-copy buffer view
             filename: Filename for the audio (used for format detection)
             language: Optional language code
+            file_unique_id: Telegram file_unique_id used as cache key
+            duration: Audio duration in seconds; long audio is chunked
 
         Returns:
             Transcribed text
 
         Raises:
+            STTOverloadedError: If the admission queue is full
             Exception: If API call fails
         """
         try:
             logger.info(f"Transcribing audio from bytes (size: {len(audio_bytes)} bytes)")
 
-            # Create file-like object from bytes
-            audio_file = io.BytesIO(audio_bytes)
-            audio_file.name = filename
+            cache_keys: List[str] = []
+            if self.cache:
+                if file_unique_id:
+                    cache_keys.append(self._cache_key(f"file:{file_unique_id}", language))
+                cache_keys.append(self._cache_key(TranscriptionCache.content_key(audio_bytes), language))
+
+                for key in cache_keys:
+                    text = await self.cache.get(key)
+                    if text is not None:
+                        logger.info("Transcription cache hit")
+                        await self._store_cached(cache_keys, text)
+                        return text
 
-            # Prepare transcription parameters
-            transcription_params = {
-                "model": self.model,
-                "file": audio_file
-            }
+            async with self._admitted(duration):
+                text = None
+                if self.chunker and duration and duration > self.chunker.max_chunk_seconds:
+                    text = await self._transcribe_chunked(audio_bytes, filename, language)
 
-            if language:
-                transcription_params["language"] = language
+                if text is None:
+                    if self.preprocessor:
+                        result = await self.preprocessor.process(audio_bytes, filename)
+                        audio_bytes, filename = result.data, result.filename
 
-            # Call Whisper API
-            response = await self.client.audio.transcriptions.create(
-                **transcription_params
-            )
+                    text = await self._request_transcription(audio_bytes, filename, language, duration)
 
-            text = response.text
             logger.info(f"Transcription successful: {text[:50]}...")
+
+            if self.cache:
+                await self._store_cached(cache_keys, text)
             return text
 
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             raise
 
+    def _admitted(self, duration: Optional[float]) -> AsyncContextManager:
+        """Admission slot for one message (no-op without a controller)"""
+        if self.admission:
+            return self.admission.admit(duration)
+        return nullcontext()
+
+    async def _transcribe_chunked(
+        self,
+        audio_bytes: Union[bytes, bytearray, memoryview],
+        filename: str,
+        language: Optional[str]
+    ) -> Optional[str]:
+        """
+        Split long audio at pauses and transcribe chunks concurrently
+
+        Args:
+            audio_bytes: Audio data
+            filename: Filename for format detection
+            language: Optional language code
+
+        Returns:
+            Stitched text, or None if audio could not be split
+        """
+        chunks = await self.chunker.split(audio_bytes, filename)
+        if len(chunks) < 2:
+            return None
+
+        semaphore = asyncio.Semaphore(self.chunk_concurrency)
+
+        async def transcribe_chunk(chunk: bytes, chunk_name: str) -> str:
+            async with semaphore:
+                return await self._request_transcription(
+                    chunk, chunk_name, language, self.chunker.max_chunk_seconds
+                )
+
+        texts = await asyncio.gather(*(transcribe_chunk(data, name) for data, name in chunks))
+        logger.info(f"Transcribed {len(chunks)} chunks in parallel")
+        return stitch_transcripts(texts)
+
+    @staticmethod
+    def _cache_key(key: str, language: Optional[str]) -> str:
+        """Scope cache key by language, since it changes Whisper output"""
+        return f"{language or 'auto'}:{key}"
+
+    async def _store_cached(self, keys: List[str], text: str):
+        """Store text under every key so later lookups hit either of them"""
+        for key in keys:
+            await self.cache.set(key, text)
+
+    async def _request_transcription(
+        self,
+        audio_data: Union[bytes, bytearray, memoryview],
+        filename: str,
+        language: Optional[str],
+        duration: Optional[float] = None
+    ) -> str:
+        """
+        Transcribe audio with the configured backend
+
+        Args:
+            audio_data: Audio data
+            filename: Filename for format detection
+            language: Optional language code
+            duration: Audio duration in seconds, used for backend routing
+
+        Returns:
+            Transcribed text
+        """
+        return await self.backend.transcribe(audio_data, filename, language, duration)
+
     async def close(self):
-        """Close OpenAI client"""
-        await self.client.close()
+        """Close backend (shared clients are closed by their owner)"""
+        await self.backend.close()
@@ -0,0 +1,236 @@
+"""Bounded cache for speech transcriptions"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+from loguru import logger
+
+
+@dataclass
+class CacheStats:
+    """Counters for transcription cache"""
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TranscriptionCache:
+    """
+    LRU cache of transcriptions with TTL and optional on-disk tier
+
+    Keys are Telegram file_unique_id values or audio content hashes.
+    The disk tier stores one small JSON file per key, written atomically
+    in a worker thread, and evicts least recently used files beyond
+    max_disk_entries. Files left from earlier runs are indexed at start,
+    dropping those past their TTL.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        ttl_seconds: float = 7 * 24 * 3600,
+        disk_dir: Optional[str] = None,
+        max_disk_entries: int = 50000
+    ):
+        """
+        Initialize transcription cache
+
+        Args:
+            max_entries: Maximum entries kept in memory
+            ttl_seconds: Entry lifetime in seconds
+            disk_dir: Directory for on-disk tier (None disables it)
+            max_disk_entries: Maximum entries kept on disk
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_entries = max_disk_entries
+        self.stats = CacheStats()
+
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+        # Disk index in LRU order: file name stem -> expiry time
+        self._disk: "OrderedDict[str, float]" = OrderedDict()
+        self.disk_dir = self._init_disk(disk_dir) if disk_dir else None
+
+    @staticmethod
+    def content_key(audio: Union[bytes, bytearray, memoryview]) -> str:
+        """
+        Build cache key from audio content
+
+        Args:
+            audio: Audio data (hashed without copying)
+
+        Returns:
+            Content hash key
+        """
+        return "sha256:" + hashlib.sha256(audio).hexdigest()
+
+    @property
+    def disk_entries(self) -> int:
+        """Entries held in disk tier"""
+        return len(self._disk)
+
+    def _init_disk(self, disk_dir: str) -> Optional[Path]:
+        """Create disk tier directory and index existing entries"""
+        path = Path(disk_dir)
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"Transcription disk cache disabled ({disk_dir}): {e}")
+            return None
+
+        # Leftovers of writes interrupted by a crash
+        for temp in path.glob("*.tmp"):
+            temp.unlink(missing_ok=True)
+
+        now = time.time()
+        files = sorted((f for f in path.glob("*.json") if f.is_file()), key=lambda f: f.stat().st_mtime)
+        for f in files:
+            expires_at = f.stat().st_mtime + self.ttl_seconds
+            if expires_at <= now:
+                f.unlink(missing_ok=True)
+            else:
+                self._disk[f.stem] = expires_at
+
+        stale = len(self._disk) - self.max_disk_entries
+        for _ in range(max(0, stale)):
+            stem, _ = self._disk.popitem(last=False)
+            (path / f"{stem}.json").unlink(missing_ok=True)
+
+        logger.info(f"Transcription disk cache: {len(self._disk)} entries")
+        return path
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Look up transcription
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached text or None
+        """
+        now = time.time()
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            text, expires_at = entry
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return text
+            del self._entries[key]
+
+        stem = self._disk_stem(key)
+        if self.disk_dir and stem in self._disk:
+            loop = asyncio.get_running_loop()
+            entry = await loop.run_in_executor(None, self._read_file, stem, now)
+            if entry is not None:
+                if stem in self._disk:
+                    self._disk.move_to_end(stem)
+                self._store_memory(key, *entry)
+                self.stats.hits += 1
+                self.stats.disk_hits += 1
+                return entry[0]
+            self._disk.pop(stem, None)
+
+        self.stats.misses += 1
+        return None
+
+    async def set(self, key: str, text: str):
+        """
+        Store transcription
+
+        Args:
+            key: Cache key
+            text: Transcribed text
+        """
+        expires_at = time.time() + self.ttl_seconds
+        self._store_memory(key, text, expires_at)
+
+        if self.disk_dir:
+            stem = self._disk_stem(key)
+            loop = asyncio.get_running_loop()
+            written = await loop.run_in_executor(None, self._write_file, stem, text, expires_at)
+            if written:
+                self._disk[stem] = expires_at
+                self._disk.move_to_end(stem)
+                await self._evict_disk()
+
+    def _store_memory(self, key: str, text: str, expires_at: float):
+        """Insert into memory tier, evicting least recently used entries"""
+        self._entries[key] = (text, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _evict_disk(self):
+        """Remove least recently used files beyond the entry bound"""
+        evicted = []
+        while len(self._disk) > self.max_disk_entries:
+            stem, _ = self._disk.popitem(last=False)
+            evicted.append(stem)
+
+        if evicted:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._remove_files, evicted)
+
+    @staticmethod
+    def _disk_stem(key: str) -> str:
+        """File name stem for key in disk tier"""
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _path(self, stem: str) -> Path:
+        """File path for stem in disk tier"""
+        return self.disk_dir / f"{stem}.json"
+
+    def _read_file(self, stem: str, now: float) -> Optional[Tuple[str, float]]:
+        """Read entry file, removing it if expired or corrupt"""
+        path = self._path(stem)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            text, expires_at = data["text"], float(data["expires_at"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Corrupt transcription cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        if expires_at <= now:
+            path.unlink(missing_ok=True)
+            return None
+        return text, expires_at
+
+    def _write_file(self, stem: str, text: str, expires_at: float) -> bool:
+        """Atomically write entry file"""
+        temp_path = None
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"text": text, "expires_at": expires_at}, f, ensure_ascii=False)
+            os.replace(temp_path, self._path(stem))
+            return True
+        except OSError as e:
+            logger.warning(f"Failed to write transcription cache entry: {e}")
+            if temp_path:
+                Path(temp_path).unlink(missing_ok=True)
+            return False
+
+    def _remove_files(self, stems: List[str]):
+        """Delete evicted files"""
+        for stem in stems:
+            self._path(stem).unlink(missing_ok=True)
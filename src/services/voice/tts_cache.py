@@ -0,0 +1,235 @@
+"""Content-addressed cache for synthesized speech"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+import asyncio
+import hashlib
+import os
+import tempfile
+from loguru import logger
+
+
+@dataclass
+class TTSCacheStats:
+    """Counters for TTS cache"""
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    saved_seconds: float = 0.0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TTSCache:
+    """
+    Two-tier cache of synthesized audio
+
+    Entries are keyed by a hash of (text, voice, model, output format).
+    The memory tier is an LRU bounded by total bytes. The optional disk
+    tier stores one file per key, written atomically via os.replace, and
+    evicts least recently used files when over its size bound.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = 20 * 1024 * 1024,
+        disk_dir: Optional[str] = None,
+        max_disk_bytes: int = 200 * 1024 * 1024
+    ):
+        """
+        Initialize TTS cache
+
+        Args:
+            max_memory_bytes: Size bound of the memory tier
+            disk_dir: Directory for the disk tier (None disables it)
+            max_disk_bytes: Size bound of the disk tier
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.stats = TTSCacheStats()
+
+        self._memory: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._memory_bytes = 0
+
+        # Disk index in LRU order: key -> (size, synthesis seconds)
+        self._disk: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        self._disk_bytes = 0
+        self.disk_dir = self._init_disk(disk_dir) if disk_dir else None
+
+    @staticmethod
+    def make_key(text: str, voice_id: str, model: str, output_format: str) -> str:
+        """
+        Build cache key
+
+        Args:
+            text: Synthesized text
+            voice_id: Voice ID
+            model: TTS model
+            output_format: Audio output format
+
+        Returns:
+            Hex digest identifying the audio
+        """
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return hashlib.sha256(f"{text_hash}|{voice_id}|{model}|{output_format}".encode()).hexdigest()
+
+    def _init_disk(self, disk_dir: str) -> Optional[Path]:
+        """Create disk tier directory and index existing files"""
+        path = Path(disk_dir)
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(f"TTS disk cache disabled ({disk_dir}): {e}")
+            return None
+
+        files = sorted(
+            (f for f in path.glob("*.audio") if f.is_file()),
+            key=lambda f: f.stat().st_mtime
+        )
+        for f in files:
+            size = f.stat().st_size
+            self._disk[f.stem] = (size, 0.0)
+            self._disk_bytes += size
+
+        logger.info(f"TTS disk cache: {len(self._disk)} entries, {self._disk_bytes} bytes")
+        return path
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes held in memory tier"""
+        return self._memory_bytes
+
+    @property
+    def disk_bytes(self) -> int:
+        """Bytes held in disk tier"""
+        return self._disk_bytes
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up audio
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached audio or None
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            self.stats.hits += 1
+            self.stats.saved_seconds += entry[1]
+            return entry[0]
+
+        if self.disk_dir and key in self._disk:
+            loop = asyncio.get_running_loop()
+            audio = await loop.run_in_executor(None, self._read_file, key)
+            if audio is not None:
+                seconds = self._disk[key][1]
+                self._disk.move_to_end(key)
+                self._store_memory(key, audio, seconds)
+                self.stats.hits += 1
+                self.stats.disk_hits += 1
+                self.stats.saved_seconds += seconds
+                return audio
+            self._forget_disk(key)
+
+        self.stats.misses += 1
+        return None
+
+    async def set(self, key: str, audio: bytes, synthesis_seconds: float = 0.0):
+        """
+        Store audio
+
+        Args:
+            key: Cache key from make_key
+            audio: Synthesized audio
+            synthesis_seconds: Time the synthesis took (reported as saved on hits)
+        """
+        self._store_memory(key, audio, synthesis_seconds)
+
+        if self.disk_dir and len(audio) <= self.max_disk_bytes:
+            loop = asyncio.get_running_loop()
+            written = await loop.run_in_executor(None, self._write_file, key, audio)
+            if written:
+                self._forget_disk(key)
+                self._disk[key] = (len(audio), synthesis_seconds)
+                self._disk_bytes += len(audio)
+                await self._evict_disk()
+
+    def _store_memory(self, key: str, audio: bytes, seconds: float):
+        """Insert into memory tier, evicting least recently used entries"""
+        if len(audio) > self.max_memory_bytes:
+            return
+
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous[0])
+
+        self._memory[key] = (audio, seconds)
+        self._memory_bytes += len(audio)
+
+        while self._memory_bytes > self.max_memory_bytes:
+            _, (evicted, _) = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+            self.stats.evictions += 1
+
+    def _forget_disk(self, key: str):
+        """Drop key from disk index"""
+        entry = self._disk.pop(key, None)
+        if entry is not None:
+            self._disk_bytes -= entry[0]
+
+    async def _evict_disk(self):
+        """Remove least recently used files until under the size bound"""
+        evicted = []
+        while self._disk_bytes > self.max_disk_bytes:
+            key, (size, _) = self._disk.popitem(last=False)
+            self._disk_bytes -= size
+            evicted.append(key)
+
+        if evicted:
+            self.stats.evictions += len(evicted)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._remove_files, evicted)
+
+    def _path(self, key: str) -> Path:
+        """File path for key in disk tier"""
+        return self.disk_dir / f"{key}.audio"
+
+    def _read_file(self, key: str) -> Optional[bytes]:
+        """Read audio file, touching it for LRU order across restarts"""
+        path = self._path(key)
+        try:
+            audio = path.read_bytes()
+            os.utime(path)
+            return audio
+        except OSError as e:
+            logger.warning(f"Failed to read TTS cache entry {path}: {e}")
+            return None
+
+    def _write_file(self, key: str, audio: bytes) -> bool:
+        """Atomically write audio file"""
+        temp_path = None
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(audio)
+            os.replace(temp_path, self._path(key))
+            return True
+        except OSError as e:
+            logger.warning(f"Failed to write TTS cache entry: {e}")
+            if temp_path:
+                Path(temp_path).unlink(missing_ok=True)
+            return False
+
+    def _remove_files(self, keys: List[str]):
+        """Delete evicted files"""
+        for key in keys:
+            self._path(key).unlink(missing_ok=True)
@@ -1,55 +1,128 @@
 """Text-to-Speech service using ElevenLabs"""
-from typing import Optional
-try:
-    from elevenlabs.client import ElevenLabs
-except ImportError:
-    # Fallback for older version
-    from elevenlabs import generate, set_api_key
+from typing import List, Optional
 from loguru import logger
 import asyncio
+import re
+import time
+
+from .audio_stitching import AudioStitcher
+from .elevenlabs_client import ElevenLabsStreamingClient
+from .tts_cache import TTSCache
+from .voice_format import VoiceEncoder
+
+_BLOCK_SPLIT_RE = re.compile(r"\n\s*\n")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?…])\s+")
+
+
+def split_for_synthesis(text: str, max_chars: int = 250) -> List[str]:
+    """
+    Split text into segments for parallel synthesis
+
+    Paragraphs (one event per paragraph in agenda replies) become separate
+    segments so unchanged lines keep the same cache key. Paragraphs longer
+    than max_chars are split further at sentence ends.
+
+    Args:
+        text: Text to split
+        max_chars: Preferred maximum segment length
+
+    Returns:
+        Non-empty segments in order
+    """
+    segments = []
+
+    for block in _BLOCK_SPLIT_RE.split(text):
+        block = block.strip()
+        if not block:
+            continue
+        if len(block) <= max_chars:
+            segments.append(block)
+            continue
+
+        current = ""
+        for sentence in _SENTENCE_SPLIT_RE.split(block):
+            if current and len(current) + 1 + len(sentence) > max_chars:
+                segments.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}" if current else sentence
+        if current:
+            segments.append(current)
+
+    return segments
 
 
 class TTSService:
     """Text-to-Speech service using ElevenLabs API"""
 
-    def __init__(self, api_key: str, voice_id: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: str,
+        voice_id: Optional[str] = None,
+        cache: Optional[TTSCache] = None,
+        output_format: str = "opus_48000_32",
+        stitcher: Optional[AudioStitcher] = None,
+        max_concurrency: int = 3,
+        segment_max_chars: int = 250,
+        parallel_min_chars: int = 300,
+        voice_encoder: Optional[VoiceEncoder] = None,
+        http_client: Optional[ElevenLabsStreamingClient] = None
+    ):
         """
         Initialize TTS service
 
         Args:
             api_key: ElevenLabs API key
             voice_id: Voice ID to use (default: Rachel voice)
+            cache: Optional cache of synthesized audio
+            output_format: Audio format produced by the API (part of cache key);
+                Opus output is sent as voice without transcoding
+            stitcher: Joins segments of long texts (None disables splitting)
+            max_concurrency: Maximum concurrent segment requests per reply
+            segment_max_chars: Preferred maximum segment length
+            parallel_min_chars: Shorter texts are synthesized in one request
+            voice_encoder: Converts results to OGG/Opus for Telegram voice
+            http_client: Shared streaming client (default: own client)
         """
         self.api_key = api_key
         self.voice_id = voice_id or "21m00Tcm4TlvDq8ikWAM"  # Rachel voice
+        self.cache = cache
+        self.output_format = output_format
+        self.stitcher = stitcher
+        self.max_concurrency = max_concurrency
+        self.segment_max_chars = segment_max_chars
+        self.parallel_min_chars = parallel_min_chars
+        self.voice_encoder = voice_encoder
 
-        # Try new API first
-        try:
-            self.client = ElevenLabs(api_key=api_key)
-            self.use_new_api = True
-        except (NameError, ImportError):
-            set_api_key(api_key)
-            self.use_new_api = False
+        self.client = http_client or ElevenLabsStreamingClient(api_key=api_key)
+        self._owns_client = http_client is None
 
     async def synthesize(
         self,
         text: str,
         voice_id: Optional[str] = None,
-        model: str = "eleven_multilingual_v2"
+        model: str = "eleven_multilingual_v2",
+        raw: bool = False
     ) -> bytes:
         """
         Synthesize speech from text
 
+        Long texts are split at event and sentence boundaries when a
+        stitcher is configured; segments are synthesized concurrently
+        (each cached separately) and joined into one message.
+
         Args:
             text: Text to convert to speech
             voice_id: Optional voice ID (overrides default)
             model: Model to use (default: eleven_multilingual_v2)
+            raw: Return API format even if a voice encoder is configured
 
         Returns:
-            Audio data as bytes (MP3 format)
+            Audio data as bytes (OGG/Opus with a voice encoder, otherwise the API format)
 
         Raises:
             ValueError: If text is empty
+            VoiceFormatError: If audio cannot be encoded as OGG/Opus
             Exception: If API call fails
         """
         if not text or not text.strip():
@@ -57,41 +130,156 @@ class TTSService:
 
         voice = voice_id or self.voice_id
 
+        if self.voice_encoder and not raw:
+            return await self._synthesize_voice(text, voice, model)
+        return await self._render(text, voice, model)
+
+    async def _synthesize_voice(self, text: str, voice: str, model: str) -> bytes:
+        """
+        Synthesize and encode text, caching the encoded result
+
+        Args:
+            text: Text to convert to speech
+            voice: Voice ID
+            model: TTS model
+
+        Returns:
+            OGG/Opus audio
+        """
+        cache_key = None
+        if self.cache:
+            cache_key = TTSCache.make_key(text, voice, model, self.voice_encoder.format_id)
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"TTS cache hit: {text[:50]}...")
+                return cached
+
+        started = time.perf_counter()
+        audio_bytes = await self._render(text, voice, model, encoder=self.voice_encoder)
+
+        if cache_key:
+            await self.cache.set(cache_key, audio_bytes, time.perf_counter() - started)
+        return audio_bytes
+
+    async def _render(
+        self,
+        text: str,
+        voice: str,
+        model: str,
+        encoder: Optional[VoiceEncoder] = None
+    ) -> bytes:
+        """
+        Synthesize text, in parallel segments if long
+
+        Args:
+            text: Text to convert to speech
+            voice: Voice ID
+            model: TTS model
+            encoder: Encode the result as OGG/Opus (default: API format)
+
+        Returns:
+            Audio data as bytes
+        """
+        if self.stitcher and len(text) >= self.parallel_min_chars:
+            segments = split_for_synthesis(text, self.segment_max_chars)
+            if len(segments) > 1:
+                return await self._synthesize_segments(text, segments, voice, model, encoder)
+
+        audio_bytes = await self._synthesize_cached(text, voice, model)
+        return await encoder.encode(audio_bytes) if encoder else audio_bytes
+
+    async def _synthesize_segments(
+        self,
+        text: str,
+        segments: List[str],
+        voice: str,
+        model: str,
+        encoder: Optional[VoiceEncoder] = None
+    ) -> bytes:
+        """
+        Synthesize segments concurrently and stitch them
+
+        With an encoder the stitcher exports OGG/Opus directly, so the
+        reply is not transcoded twice.
+
+        Args:
+            text: Full text (cache key of the stitched result)
+            segments: Text segments in order
+            voice: Voice ID
+            model: TTS model
+            encoder: Encode the result as OGG/Opus (default: API format)
+
+        Returns:
+            Stitched audio
+        """
+        # Encoded replies are cached by _synthesize_voice
+        cache_key = None
+        if self.cache and encoder is None:
+            cache_key = TTSCache.make_key(text, voice, model, self.output_format)
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"TTS cache hit: {text[:50]}...")
+                return cached
+
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def synthesize_segment(segment: str) -> bytes:
+            async with semaphore:
+                return await self._synthesize_cached(segment, voice, model)
+
+        parts = await asyncio.gather(*(synthesize_segment(segment) for segment in segments))
+        audio_bytes = await self.stitcher.concatenate(list(parts), encoder)
+
+        elapsed = time.perf_counter() - started
+        logger.info(f"Synthesized {len(segments)} segments in {elapsed:.2f}s ({len(audio_bytes)} bytes)")
+
+        if cache_key:
+            await self.cache.set(cache_key, audio_bytes, elapsed)
+        return audio_bytes
+
+    async def _synthesize_cached(self, text: str, voice: str, model: str) -> bytes:
+        """
+        Synthesize text with one API request, using the cache if configured
+
+        Args:
+            text: Text to convert to speech
+            voice: Voice ID
+            model: TTS model
+
+        Returns:
+            Audio data as bytes
+        """
+        cache_key = None
+        if self.cache:
+            cache_key = TTSCache.make_key(text, voice, model, self.output_format)
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"TTS cache hit: {text[:50]}...")
+                return cached
+
         try:
             logger.info(f"Synthesizing speech: {text[:50]}... (voice: {voice})")
+            started = time.perf_counter()
 
-            loop = asyncio.get_event_loop()
-
-            if self.use_new_api:
-                # New API (v1.0+)
-                audio_data = await loop.run_in_executor(
-                    None,
-                    lambda: self.client.generate(
-                        text=text,
-                        voice=voice,
-                        model=model
-                    )
-                )
-            else:
-                # Old API (v0.x)
-                audio_data = await loop.run_in_executor(
-                    None,
-                    lambda: generate(
-                        text=text,
-                        voice=voice,
-                        model=model
-                    )
-                )
-
-            # Convert generator to bytes
-            if hasattr(audio_data, '__iter__') and not isinstance(audio_data, bytes):
-                audio_bytes = b''.join(audio_data)
-            else:
-                audio_bytes = audio_data
+            audio_bytes = await self.client.synthesize(
+                text,
+                voice_id=voice,
+                model_id=model,
+                output_format=self.output_format
+            )
 
             logger.info(f"Synthesis successful (size: {len(audio_bytes)} bytes)")
+
+            if cache_key:
+                await self.cache.set(cache_key, audio_bytes, time.perf_counter() - started)
             return audio_bytes
 
         except Exception as e:
             logger.error(f"Synthesis failed: {e}")
             raise
+
+    async def close(self):
+        """Close own HTTP client"""
+        if self._owns_client:
+            await self.client.close()
@@ -0,0 +1,178 @@
+"""OGG/Opus encoding and validation for Telegram voice messages"""
+from dataclasses import dataclass
+from typing import Optional
+import io
+import time
+from pydub import AudioSegment
+from loguru import logger
+
+from .process_pool import ProcessPool
+
+# Ogg page header is 27 bytes followed by the segment table
+_OGG_HEADER_SIZE = 27
+
+
+class VoiceFormatError(Exception):
+    """Raised when audio cannot be turned into a Telegram voice message"""
+
+
+def is_ogg_opus(data: bytes) -> bool:
+    """
+    Check that audio is an Ogg container whose first stream is Opus
+
+    Only the first page header is inspected, so the check is O(1).
+
+    Args:
+        data: Encoded audio
+
+    Returns:
+        True if data starts with an OggS page carrying OpusHead
+    """
+    if len(data) < _OGG_HEADER_SIZE or data[:4] != b"OggS":
+        return False
+    payload = _OGG_HEADER_SIZE + data[26]
+    return data[payload:payload + 8] == b"OpusHead"
+
+
+def audio_format_of(output_format: str) -> str:
+    """
+    Container of an ElevenLabs output format, as named by ffmpeg
+
+    Args:
+        output_format: ElevenLabs output format (e.g., 'opus_48000_32')
+
+    Returns:
+        Format for decoding the audio (e.g., 'ogg')
+    """
+    codec = output_format.split("_", 1)[0]
+    return "ogg" if codec == "opus" else codec
+
+
+def transcode_to_opus(
+    data: bytes,
+    input_format: Optional[str] = "mp3",
+    bitrate: str = "32k",
+    sample_rate: int = 48000
+) -> bytes:
+    """
+    Transcode audio to mono OGG/Opus
+
+    Args:
+        data: Encoded audio
+        input_format: Input format; None to autodetect
+        bitrate: Opus bitrate
+        sample_rate: Output sample rate (Opus native rate is 48 kHz)
+
+    Returns:
+        OGG/Opus audio
+    """
+    segment = AudioSegment.from_file(io.BytesIO(data), format=input_format)
+    return export_opus(segment, bitrate, sample_rate)
+
+
+def export_opus(segment: AudioSegment, bitrate: str = "32k", sample_rate: int = 48000) -> bytes:
+    """
+    Encode decoded audio as mono OGG/Opus
+
+    Args:
+        segment: Decoded audio
+        bitrate: Opus bitrate
+        sample_rate: Output sample rate (Opus native rate is 48 kHz)
+
+    Returns:
+        OGG/Opus audio
+    """
+    segment = segment.set_channels(1).set_frame_rate(sample_rate)
+
+    out = io.BytesIO()
+    segment.export(out, format="ogg", codec="libopus", bitrate=bitrate)
+    return out.getvalue()
+
+
+@dataclass
+class VoiceEncoderStats:
+    """Counters for voice encoding"""
+    encoded: int = 0
+    passthrough: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+
+
+class VoiceEncoder:
+    """
+    Converts synthesized speech to OGG/Opus in a worker process pool
+
+    Audio that already is OGG/Opus passes through untouched. Output is
+    validated before it is returned, so callers never receive audio that
+    Telegram would reject as a voice message.
+    """
+
+    def __init__(
+        self,
+        input_format: str = "mp3",
+        bitrate: str = "32k",
+        pool: Optional[ProcessPool] = None
+    ):
+        """
+        Initialize voice encoder
+
+        Args:
+            input_format: Format of audio produced by TTS
+            bitrate: Opus bitrate
+            pool: Shared worker pool (default: own pool)
+        """
+        self.input_format = input_format
+        self.bitrate = bitrate
+        self.stats = VoiceEncoderStats()
+
+        self.pool = pool or ProcessPool()
+        self._owns_pool = pool is None
+
+    @property
+    def format_id(self) -> str:
+        """Identifier of produced format (used in cache keys)"""
+        return f"ogg_opus_{self.bitrate}"
+
+    async def encode(self, audio: bytes) -> bytes:
+        """
+        Encode audio as OGG/Opus
+
+        Args:
+            audio: Synthesized audio
+
+        Returns:
+            OGG/Opus audio
+
+        Raises:
+            VoiceFormatError: If transcoding fails or produces invalid output
+        """
+        if is_ogg_opus(audio):
+            self.stats.passthrough += 1
+            return audio
+
+        started = time.perf_counter()
+        try:
+            encoded = await self.pool.run(
+                transcode_to_opus,
+                audio,
+                self.input_format,
+                self.bitrate
+            )
+        except Exception as e:
+            self.stats.failed += 1
+            raise VoiceFormatError(f"Opus transcoding failed: {e}") from e
+
+        if not is_ogg_opus(encoded):
+            self.stats.failed += 1
+            raise VoiceFormatError("Transcoder output is not OGG/Opus")
+
+        elapsed = time.perf_counter() - started
+        self.stats.encoded += 1
+        self.stats.elapsed_seconds += elapsed
+        logger.debug(f"Encoded voice: {len(audio)} -> {len(encoded)} bytes in {elapsed * 1000:.0f}ms")
+        return encoded
+
+    async def close(self):
+        """Shut down own worker pool"""
+        if self._owns_pool:
+            await self.pool.close()
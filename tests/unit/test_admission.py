@@ -0,0 +1,89 @@
+"""Unit tests for STT admission control"""
+import pytest
+import asyncio
+from src.services.voice.admission import AdmissionController, STTOverloadedError
+
+
+async def _hold(controller, duration, order, release):
+    async with controller.admit(duration):
+        order.append(duration)
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit():
+    """Test no more than max_concurrent requests run at once"""
+    controller = AdmissionController(max_concurrent=2)
+    order, release = [], asyncio.Event()
+
+    tasks = [asyncio.create_task(_hold(controller, d, order, release)) for d in (5, 5, 5)]
+    await asyncio.sleep(0.01)
+
+    assert controller.in_flight == 2
+    assert controller.queue_depth == 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert controller.in_flight == 0
+    assert controller.stats.admitted == 3
+    assert controller.stats.queued == 1
+
+
+@pytest.mark.asyncio
+async def test_short_audio_admitted_first():
+    """Test waiting short commands overtake long voice notes"""
+    controller = AdmissionController(max_concurrent=1)
+    order = []
+    gate = asyncio.Event()
+
+    blocker = asyncio.create_task(_hold(controller, 1, order, gate))
+    await asyncio.sleep(0)
+    done = asyncio.Event()
+    done.set()
+    waiting = [asyncio.create_task(_hold(controller, d, order, done)) for d in (60, 45, 2)]
+    await asyncio.sleep(0.01)
+
+    gate.set()
+    await asyncio.gather(blocker, *waiting)
+
+    assert order == [1, 2, 45, 60]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects():
+    """Test backpressure when queue is full"""
+    controller = AdmissionController(max_concurrent=1, max_queue_size=1)
+    order, release = [], asyncio.Event()
+
+    tasks = [asyncio.create_task(_hold(controller, 3, order, release)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(STTOverloadedError):
+        async with controller.admit(3):
+            pass
+
+    assert controller.stats.rejected == 1
+    release.set()
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_wait_timeout_releases_queue_entry():
+    """Test timed out waiter is removed and slot accounting stays correct"""
+    controller = AdmissionController(max_concurrent=1, max_wait_seconds=0.01)
+    order, release = [], asyncio.Event()
+    holder = asyncio.create_task(_hold(controller, 3, order, release))
+    await asyncio.sleep(0)
+
+    with pytest.raises(STTOverloadedError):
+        async with controller.admit(3):
+            pass
+
+    assert controller.stats.timed_out == 1
+    assert controller.queue_depth == 0
+    release.set()
+    await holder
+    assert controller.in_flight == 0
+
+    async with controller.admit(3):
+        assert controller.in_flight == 1
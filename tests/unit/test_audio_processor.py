@@ -0,0 +1,95 @@
+"""Unit tests for audio preprocessing"""
+import pytest
+import io
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, AsyncMock
+from pydub import AudioSegment
+from pydub.generators import Sine
+from src.services.voice.audio_processor import AudioPreprocessor, preprocess_audio
+from src.services.voice.process_pool import ProcessPool
+from src.services.voice.stt_service import STTService
+
+
+def _voice_wav(lead_ms: int = 1000, speech_ms: int = 500, trail_ms: int = 1000) -> bytes:
+    """Stereo 44.1 kHz WAV with silence around a tone"""
+    silence = AudioSegment.silent(duration=lead_ms, frame_rate=44100)
+    tone = Sine(440).to_audio_segment(duration=speech_ms).set_frame_rate(44100)
+    tail = AudioSegment.silent(duration=trail_ms, frame_rate=44100)
+    audio = (silence + tone + tail).set_channels(2)
+
+    out = io.BytesIO()
+    audio.export(out, format="wav")
+    return out.getvalue()
+
+
+def test_preprocess_audio_trims_and_downmixes():
+    """Test silence is trimmed and audio converted to 16 kHz mono"""
+    data, duration, trimmed = preprocess_audio(_voice_wav(), "wav", output_format="wav")
+
+    result = AudioSegment.from_file(io.BytesIO(data), format="wav")
+    assert result.channels == 1
+    assert result.frame_rate == 16000
+    assert duration == pytest.approx(0.8, abs=0.05)
+    assert trimmed == pytest.approx(1.7, abs=0.05)
+
+
+@pytest.mark.asyncio
+async def test_preprocessor_reports_bytes_saved():
+    """Test preprocessor returns smaller audio and records stats"""
+    original = _voice_wav()
+    preprocessor = AudioPreprocessor(output_format="wav", pool=ProcessPool(executor=ThreadPoolExecutor(1)))
+
+    result = await preprocessor.process(memoryview(original), "voice.wav")
+
+    assert result.processed_bytes < result.original_bytes
+    assert result.filename == "voice.wav"
+    assert preprocessor.stats.processed == 1
+    assert preprocessor.stats.bytes_saved == len(original) - len(result.data)
+    assert preprocessor.stats.average_latency_ms > 0
+
+
+@pytest.mark.asyncio
+async def test_preprocessor_runs_in_process_pool():
+    """Test default process pool executes preprocessing"""
+    preprocessor = AudioPreprocessor(output_format="wav", pool=ProcessPool(max_workers=1))
+
+    result = await preprocessor.process(_voice_wav(), "voice.wav")
+    await preprocessor.close()
+
+    assert result.processed_bytes < result.original_bytes
+
+
+@pytest.mark.asyncio
+async def test_preprocessor_falls_back_on_error():
+    """Test undecodable audio is passed through unchanged"""
+    preprocessor = AudioPreprocessor(output_format="wav", pool=ProcessPool(executor=ThreadPoolExecutor(1)))
+
+    result = await preprocessor.process(b"not audio", "voice.wav")
+
+    assert result.data == b"not audio"
+    assert result.filename == "voice.wav"
+    assert preprocessor.stats.failed == 1
+
+
+def test_unsupported_output_format():
+    """Test unknown output format is rejected"""
+    with pytest.raises(ValueError):
+        AudioPreprocessor(output_format="mp3")
+
+
+@pytest.mark.asyncio
+async def test_stt_service_uploads_preprocessed_audio():
+    """Test STTService sends preprocessed audio to Whisper"""
+    preprocessor = AudioPreprocessor(output_format="wav", pool=ProcessPool(executor=ThreadPoolExecutor(1)))
+    service = STTService(api_key="test_key", preprocessor=preprocessor)
+    mock_client = AsyncMock()
+    mock_response = Mock()
+    mock_response.text = "что сегодня"
+    mock_client.audio.transcriptions.create = AsyncMock(return_value=mock_response)
+    service.client = mock_client
+
+    original = _voice_wav()
+    await service.transcribe_bytes(original, "voice.wav")
+
+    uploaded = mock_client.audio.transcriptions.create.call_args[1]["file"]
+    assert len(uploaded.getvalue()) < len(original)
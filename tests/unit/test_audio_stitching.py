@@ -0,0 +1,156 @@
+"""Unit tests for parallel TTS synthesis and audio stitching"""
+import pytest
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, Mock, patch
+from pydub import AudioSegment
+from pydub.generators import Sine
+from src.services.voice.audio_stitching import AudioStitcher, concatenate_audio
+from src.services.voice.process_pool import ProcessPool
+from src.services.voice.tts_cache import TTSCache
+from src.services.voice.tts_service import TTSService, split_for_synthesis
+from src.services.voice.voice_format import VoiceEncoder, VoiceFormatError
+
+AGENDA = (
+    "У вас 3 событий на сегодня:\n\n"
+    "1. Стендап\n   Время: 10:00 - 10:15\n\n"
+    "2. Обед с командой\n   Время: 13:00 - 14:00\n\n"
+    "3. Ревью архитектуры\n   Время: 16:00 - 17:00"
+)
+
+OGG_OPUS = b"OggS\x00\x02" + bytes(20) + b"\x01\x13" + b"OpusHead" + bytes(11)
+
+
+def _tone_wav(volume_db: float, duration_ms: int = 300) -> bytes:
+    out = io.BytesIO()
+    Sine(440).to_audio_segment(duration=duration_ms, volume=volume_db).export(out, format="wav")
+    return out.getvalue()
+
+
+async def _join(parts):
+    return b"|".join(parts)
+
+
+def test_split_keeps_events_separate():
+    """Test agenda is split at event boundaries"""
+    segments = split_for_synthesis(AGENDA)
+
+    assert len(segments) == 4
+    assert segments[2].startswith("2. Обед с командой")
+
+
+def test_split_long_paragraph_at_sentences():
+    """Test long paragraph is split at sentence ends"""
+    text = "Первое предложение. Второе предложение! Третье?"
+
+    assert split_for_synthesis(text, max_chars=25) == [
+        "Первое предложение.", "Второе предложение!", "Третье?"
+    ]
+
+
+def test_concatenate_normalizes_loudness():
+    """Test quiet and loud segments end up at the same loudness"""
+    data = concatenate_audio([_tone_wav(-30), _tone_wav(-5)], audio_format="wav", gap_ms=100)
+
+    combined = AudioSegment.from_file(io.BytesIO(data), format="wav")
+    assert len(combined) == pytest.approx(700, abs=5)
+    assert combined[:300].dBFS == pytest.approx(combined[400:].dBFS, abs=0.5)
+
+
+@pytest.mark.asyncio
+async def test_stitcher_falls_back_to_joining_bytes():
+    """Test undecodable segments are joined as is"""
+    stitcher = AudioStitcher(pool=ProcessPool(executor=ThreadPoolExecutor(1)))
+
+    assert await stitcher.concatenate([b"a", b"b"]) == b"ab"
+    assert stitcher.stats.fallbacks == 1
+
+
+@pytest.mark.asyncio
+async def test_stitcher_does_not_join_ogg_bytes():
+    """Test undecodable Ogg segments raise instead of being chained"""
+    stitcher = AudioStitcher(audio_format="ogg", pool=ProcessPool(executor=ThreadPoolExecutor(1)))
+
+    with pytest.raises(VoiceFormatError):
+        await stitcher.concatenate([b"a", b"b"])
+    assert stitcher.stats.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_segments_synthesized_concurrently_and_cached():
+    """Test segments run in parallel within the limit and are cached separately"""
+    active = 0
+    peak = 0
+
+    async def generate(text, voice_id, model_id, output_format):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.02)
+        active -= 1
+        return text.encode()
+
+    stitcher = Mock()
+    stitcher.concatenate = lambda parts, encoder=None: _join(parts)
+    cache = TTSCache()
+    service = TTSService(
+        api_key="test", voice_id="voice", cache=cache, stitcher=stitcher,
+        max_concurrency=2, parallel_min_chars=50
+    )
+    service.client = Mock()
+    service.client.synthesize = AsyncMock(side_effect=generate)
+
+    audio = await service.synthesize(AGENDA)
+    assert audio == b"|".join(s.encode() for s in split_for_synthesis(AGENDA))
+    assert peak == 2
+
+    # One event changed: only that segment is synthesized again
+    service.client.synthesize.reset_mock()
+    await service.synthesize(AGENDA.replace("16:00 - 17:00", "16:30 - 17:30"))
+    assert service.client.synthesize.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_short_text_single_request():
+    """Test short replies are not split"""
+    stitcher = Mock()
+    service = TTSService(api_key="test", stitcher=stitcher)
+    service.client = Mock()
+    service.client.synthesize = AsyncMock(return_value=b"audio")
+
+    assert await service.synthesize("Привет.\n\nКак дела?") == b"audio"
+    service.client.synthesize.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_stitcher_exports_opus_for_encoder():
+    """Test stitched voice replies are encoded once, straight to OGG/Opus"""
+    encoder = VoiceEncoder(bitrate="24k")
+    encoder.encode = AsyncMock()
+    stitcher = AudioStitcher(pool=ProcessPool(executor=ThreadPoolExecutor(1)))
+
+    with patch("src.services.voice.audio_stitching.concatenate_audio", return_value=OGG_OPUS) as concatenate:
+        assert await stitcher.concatenate([b"a", b"b"], encoder) == OGG_OPUS
+
+    assert concatenate.call_args.kwargs["opus_bitrate"] == "24k"
+    encoder.encode.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_segmented_voice_reply_stitched_for_encoder():
+    """Test segmented replies are not transcoded again after stitching"""
+    encoder = Mock(format_id="ogg_opus_32k")
+    encoder.encode = AsyncMock()
+    stitcher = Mock()
+    stitcher.concatenate = AsyncMock(return_value=OGG_OPUS)
+    service = TTSService(
+        api_key="test", cache=TTSCache(), stitcher=stitcher,
+        parallel_min_chars=50, voice_encoder=encoder
+    )
+    service.client = Mock()
+    service.client.synthesize = AsyncMock(side_effect=lambda text, **kwargs: text.encode())
+
+    assert await service.synthesize(AGENDA) == OGG_OPUS
+    assert stitcher.concatenate.call_args.args[1] is encoder
+    encoder.encode.assert_not_called()
@@ -1,18 +1,32 @@
 """Unit tests for Telegram Bot Handlers"""
+import asyncio
+import os
+import time
 import pytest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from datetime import datetime, timedelta
 from telegram import Update, Voice, Message, User, Chat
+from telegram.error import BadRequest
 from telegram.ext import ContextTypes
-from src.bot.handlers import BotHandlers
+from src.bot.handlers import BotHandlers, VoiceJob
+from src.bot.update_processor import FairUpdateProcessor
 from src.services.calendar.models import Event, Command, Intent
+from src.services.calendar.prefetch import CalendarPrefetcher
+from src.services.nlp.datetime_parser import RussianDateTimeParser, TimeRange
+from src.services.voice.admission import STTOverloadedError
+from src.services.voice.voice_format import VoiceFormatError
+
+# First Ogg page carrying an Opus identification header
+OGG_OPUS = b"OggS\x00\x02" + bytes(20) + b"\x01\x13" + b"OpusHead" + bytes(11)
 
 
 @pytest.fixture
 def bot_handlers():
     """BotHandlers fixture"""
+    stt_service = AsyncMock()
+    stt_service.get_cached_transcription.return_value = None
     return BotHandlers(
-        stt_service=AsyncMock(),
+        stt_service=stt_service,
         tts_service=AsyncMock(),
         nlp_service=AsyncMock(),
         calendar_aggregator=AsyncMock()
@@ -68,14 +82,15 @@ async def test_voice_message_handler_get_today(bot_handlers, mock_update, mock_c
     # Mock voice message
     mock_update.message.voice = Mock(spec=Voice)
     mock_update.message.voice.file_id = "test_file_id"
+    mock_update.message.voice.file_size = 4096
 
     # Mock file download
     mock_file = AsyncMock()
-    mock_file.download_to_drive = AsyncMock()
+    mock_file.download_to_memory = AsyncMock()
     mock_context.bot.get_file = AsyncMock(return_value=mock_file)
 
     # Mock STT result
-    bot_handlers.stt_service.transcribe.return_value = "что сегодня в календаре"
+    bot_handlers.stt_service.transcribe_bytes.return_value = "что сегодня в календаре"
 
     # Mock NLP result
     bot_handlers.nlp_service.parse.return_value = Command(
@@ -97,13 +112,13 @@ async def test_voice_message_handler_get_today(bot_handlers, mock_update, mock_c
     ]
 
     # Mock TTS result
-    bot_handlers.tts_service.synthesize.return_value = b"fake audio data"
+    bot_handlers.tts_service.synthesize.return_value = OGG_OPUS
 
     # Execute handler
     await bot_handlers.voice_message_handler(mock_update, mock_context)
 
     # Verify flow
-    bot_handlers.stt_service.transcribe.assert_called_once()
+    bot_handlers.stt_service.transcribe_bytes.assert_called_once()
     bot_handlers.nlp_service.parse.assert_called_once()
     bot_handlers.calendar_aggregator.get_today_events.assert_called_once()
     bot_handlers.tts_service.synthesize.assert_called_once()
@@ -115,12 +130,13 @@ async def test_voice_message_handler_get_tomorrow(bot_handlers, mock_update, moc
     """Test voice message handler with 'get tomorrow' command"""
     mock_update.message.voice = Mock(spec=Voice)
     mock_update.message.voice.file_id = "test_file_id"
+    mock_update.message.voice.file_size = 4096
 
     mock_file = AsyncMock()
-    mock_file.download_to_drive = AsyncMock()
+    mock_file.download_to_memory = AsyncMock()
     mock_context.bot.get_file = AsyncMock(return_value=mock_file)
 
-    bot_handlers.stt_service.transcribe.return_value = "что завтра"
+    bot_handlers.stt_service.transcribe_bytes.return_value = "что завтра"
 
     bot_handlers.nlp_service.parse.return_value = Command(
         intent=Intent.GET_TOMORROW,
@@ -146,12 +162,13 @@ async def test_voice_message_handler_get_upcoming(bot_handlers, mock_update, moc
     """Test voice message handler with 'get upcoming' command"""
     mock_update.message.voice = Mock(spec=Voice)
     mock_update.message.voice.file_id = "test_file_id"
+    mock_update.message.voice.file_size = 4096
 
     mock_file = AsyncMock()
-    mock_file.download_to_drive = AsyncMock()
+    mock_file.download_to_memory = AsyncMock()
     mock_context.bot.get_file = AsyncMock(return_value=mock_file)
 
-    bot_handlers.stt_service.transcribe.return_value = "что в ближайшие 3 часа"
+    bot_handlers.stt_service.transcribe_bytes.return_value = "что в ближайшие 3 часа"
 
     bot_handlers.nlp_service.parse.return_value = Command(
         intent=Intent.GET_UPCOMING,
@@ -182,12 +199,13 @@ async def test_voice_message_handler_find_meeting(bot_handlers, mock_update, moc
     """Test voice message handler with 'find meeting' command"""
     mock_update.message.voice = Mock(spec=Voice)
     mock_update.message.voice.file_id = "test_file_id"
+    mock_update.message.voice.file_size = 4096
 
     mock_file = AsyncMock()
-    mock_file.download_to_drive = AsyncMock()
+    mock_file.download_to_memory = AsyncMock()
     mock_context.bot.get_file = AsyncMock(return_value=mock_file)
 
-    bot_handlers.stt_service.transcribe.return_value = "когда встреча с Иваном"
+    bot_handlers.stt_service.transcribe_bytes.return_value = "когда встреча с Иваном"
 
     bot_handlers.nlp_service.parse.return_value = Command(
         intent=Intent.FIND_MEETING,
@@ -218,12 +236,13 @@ async def test_voice_message_handler_unknown_intent(bot_handlers, mock_update, m
     """Test voice message handler with unknown intent"""
     mock_update.message.voice = Mock(spec=Voice)
     mock_update.message.voice.file_id = "test_file_id"
+    mock_update.message.voice.file_size = 4096
 
     mock_file = AsyncMock()
-    mock_file.download_to_drive = AsyncMock()
+    mock_file.download_to_memory = AsyncMock()
     mock_context.bot.get_file = AsyncMock(return_value=mock_file)
 
-    bot_handlers.stt_service.transcribe.return_value = "абракадабра"
+    bot_handlers.stt_service.transcribe_bytes.return_value = "абракадабра"
 
     bot_handlers.nlp_service.parse.return_value = Command(
         intent=Intent.UNKNOWN,
@@ -246,13 +265,14 @@ async def test_voice_message_handler_stt_error(bot_handlers, mock_update, mock_c
     """Test voice message handler with STT error"""
     mock_update.message.voice = Mock(spec=Voice)
     mock_update.message.voice.file_id = "test_file_id"
+    mock_update.message.voice.file_size = 4096
 
     mock_file = AsyncMock()
-    mock_file.download_to_drive = AsyncMock()
+    mock_file.download_to_memory = AsyncMock()
     mock_context.bot.get_file = AsyncMock(return_value=mock_file)
 
     # STT fails
-    bot_handlers.stt_service.transcribe.side_effect = Exception("STT API Error")
+    bot_handlers.stt_service.transcribe_bytes.side_effect = Exception("STT API Error")
 
     await bot_handlers.voice_message_handler(mock_update, mock_context)
 
@@ -268,12 +288,13 @@ async def test_voice_message_handler_calendar_error(bot_handlers, mock_update, m
     """Test voice message handler with calendar error"""
     mock_update.message.voice = Mock(spec=Voice)
     mock_update.message.voice.file_id = "test_file_id"
+    mock_update.message.voice.file_size = 4096
 
     mock_file = AsyncMock()
-    mock_file.download_to_drive = AsyncMock()
+    mock_file.download_to_memory = AsyncMock()
     mock_context.bot.get_file = AsyncMock(return_value=mock_file)
 
-    bot_handlers.stt_service.transcribe.return_value = "что сегодня"
+    bot_handlers.stt_service.transcribe_bytes.return_value = "что сегодня"
 
     bot_handlers.nlp_service.parse.return_value = Command(
         intent=Intent.GET_TODAY,
@@ -345,3 +366,624 @@ def test_format_events_response_empty(bot_handlers):
     response = bot_handlers._format_events_response([])
 
     assert "нет событий" in response.lower() or "свободен" in response.lower()
+
+
+@pytest.mark.asyncio
+async def test_execute_create_event(bot_handlers):
+    """Test CREATE_EVENT resolves time locally and creates event"""
+    command = Command(
+        intent=Intent.CREATE_EVENT,
+        original_text="создай встречу с командой завтра в три",
+        parameters={"title": "Встреча с командой", "time": "завтра в три"},
+        confidence=0.9
+    )
+
+    async def create(event):
+        return event
+
+    bot_handlers.calendar_aggregator.create_event.side_effect = create
+
+    response = await bot_handlers._execute_command(command)
+
+    created = bot_handlers.calendar_aggregator.create_event.call_args[0][0]
+    assert created.title == "Встреча с командой"
+    assert created.start.strftime("%H:%M") == "15:00"
+    assert created.end - created.start == timedelta(hours=1)
+    assert "создана" in response
+    assert "15:00" in response
+
+
+@pytest.mark.asyncio
+async def test_execute_create_event_unparsed_time(bot_handlers):
+    """Test CREATE_EVENT without recognizable time asks to repeat"""
+    command = Command(
+        intent=Intent.CREATE_EVENT,
+        original_text="создай встречу",
+        parameters={"title": "Встреча"},
+        confidence=0.9
+    )
+
+    response = await bot_handlers._execute_command(command)
+
+    bot_handlers.calendar_aggregator.create_event.assert_not_called()
+    assert "не удалось" in response.lower()
+
+
+@pytest.mark.asyncio
+async def test_voice_downloaded_to_memory(bot_handlers, mock_update, mock_context):
+    """Test voice is transcribed from an in-memory buffer view"""
+    mock_update.message.voice = Mock(spec=Voice)
+    mock_update.message.voice.file_id = "test_file_id"
+    mock_update.message.voice.file_size = 4096
+
+    async def download(out):
+        out.write(b"OggS voice data")
+
+    mock_file = AsyncMock()
+    mock_file.download_to_memory = AsyncMock(side_effect=download)
+    mock_context.bot.get_file = AsyncMock(return_value=mock_file)
+
+    job = VoiceJob(update=mock_update, context=mock_context)
+    await bot_handlers._download_stage(job)
+    await bot_handlers._stt_stage(job)
+
+    audio_arg = bot_handlers.stt_service.transcribe_bytes.call_args[0][0]
+    assert isinstance(audio_arg, memoryview)
+    assert bytes(audio_arg) == b"OggS voice data"
+    mock_file.download_to_drive.assert_not_called()
+    assert job.text == bot_handlers.stt_service.transcribe_bytes.return_value
+    assert job.audio is None
+
+
+@pytest.mark.asyncio
+async def test_oversized_voice_temp_file_removed_on_error(bot_handlers, mock_update):
+    """Test oversized voice uses temp file that is removed even if STT fails"""
+    mock_update.message.voice = Mock(spec=Voice)
+    mock_update.message.voice.file_size = bot_handlers.max_in_memory_voice_bytes + 1
+
+    mock_file = AsyncMock()
+    context = Mock()
+    context.bot.get_file = AsyncMock(return_value=mock_file)
+    bot_handlers.stt_service.transcribe.side_effect = Exception("STT API Error")
+
+    job = VoiceJob(update=mock_update, context=context)
+    await bot_handlers._download_stage(job)
+    with pytest.raises(Exception, match="STT API Error"):
+        await bot_handlers._stt_stage(job)
+
+    temp_path = mock_file.download_to_drive.call_args[0][0]
+    assert not os.path.exists(temp_path)
+    bot_handlers.stt_service.transcribe_bytes.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cached_voice_skips_download(bot_handlers, mock_update, mock_context):
+    """Test cached transcription is used without downloading the voice file"""
+    mock_update.message.voice = Mock(spec=Voice)
+    mock_update.message.voice.file_id = "test_file_id"
+    mock_update.message.voice.file_unique_id = "unique_id"
+    bot_handlers.stt_service.get_cached_transcription.return_value = "что сегодня"
+
+    job = VoiceJob(update=mock_update, context=mock_context)
+    await bot_handlers._download_stage(job)
+    await bot_handlers._stt_stage(job)
+
+    assert job.text == "что сегодня"
+    bot_handlers.stt_service.get_cached_transcription.assert_called_once_with("unique_id", language="ru")
+    mock_context.bot.get_file.assert_not_called()
+    bot_handlers.stt_service.transcribe_bytes.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_voice_message_handler_stt_overloaded(bot_handlers, mock_update, mock_context):
+    """Test user is asked to retry when STT queue is full"""
+    mock_update.message.voice = Mock(spec=Voice)
+    mock_update.message.voice.file_id = "test_file_id"
+    mock_update.message.voice.file_size = 4096
+    mock_update.message.reply_text = AsyncMock()
+    mock_context.bot.get_file = AsyncMock(return_value=AsyncMock())
+    bot_handlers.stt_service.transcribe_bytes.side_effect = STTOverloadedError("STT queue is full")
+
+    await bot_handlers.voice_message_handler(mock_update, mock_context)
+
+    assert "попробуйте через минуту" in mock_update.message.reply_text.call_args[0][0].lower()
+    bot_handlers.nlp_service.parse.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_send_voice_reuses_file_id(bot_handlers, mock_update):
+    """Test repeated audio is sent by file_id instead of re-uploading"""
+    uploaded = Mock()
+    uploaded.voice.file_id = "telegram_file_id"
+    mock_update.message.reply_voice = AsyncMock(return_value=uploaded)
+
+    await bot_handlers._send_voice(mock_update, OGG_OPUS)
+    await bot_handlers._send_voice(mock_update, OGG_OPUS)
+
+    calls = mock_update.message.reply_voice.call_args_list
+    assert calls[0][1]["voice"] == OGG_OPUS
+    assert calls[1][1]["voice"] == "telegram_file_id"
+    assert bot_handlers.voice_file_cache.stats.reused == 1
+
+
+@pytest.mark.asyncio
+async def test_send_voice_reuploads_rejected_file_id(bot_handlers, mock_update):
+    """Test stale file_id is invalidated and audio uploaded again"""
+    key = bot_handlers.voice_file_cache.audio_key(OGG_OPUS)
+    bot_handlers.voice_file_cache.set(key, "stale_id")
+
+    uploaded = Mock()
+    uploaded.voice.file_id = "fresh_id"
+    mock_update.message.reply_voice = AsyncMock(
+        side_effect=[BadRequest("Wrong file identifier"), uploaded]
+    )
+
+    await bot_handlers._send_voice(mock_update, OGG_OPUS)
+
+    assert mock_update.message.reply_voice.call_args[1]["voice"] == OGG_OPUS
+    assert bot_handlers.voice_file_cache.get(key) == "fresh_id"
+    assert bot_handlers.voice_file_cache.stats.invalidated == 1
+
+
+@pytest.mark.asyncio
+async def test_non_opus_voice_not_uploaded(bot_handlers, mock_update):
+    """Test audio that is not OGG/Opus is rejected before upload"""
+    mock_update.message.reply_voice = AsyncMock()
+
+    with pytest.raises(VoiceFormatError):
+        await bot_handlers._send_voice(mock_update, b"ID3 mp3 data")
+
+    mock_update.message.reply_voice.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_long_agenda_spoken_as_summary(bot_handlers, mock_update, mock_context):
+    """Test long agenda is summarized by voice and listed as text"""
+    mock_update.message.voice = Mock(spec=Voice)
+    mock_update.message.voice.file_id = "test_file_id"
+    mock_update.message.voice.file_size = 4096
+    mock_update.message.reply_text = AsyncMock()
+    mock_update.message.reply_voice = AsyncMock()
+    mock_context.bot.get_file = AsyncMock(return_value=AsyncMock())
+    bot_handlers.stt_service.transcribe_bytes.return_value = "что сегодня"
+    bot_handlers.nlp_service.parse.return_value = Command(
+        intent=Intent.GET_TODAY, original_text="что сегодня", parameters={}, confidence=0.95
+    )
+
+    start = datetime(2024, 1, 15, 9, 0)
+    bot_handlers.calendar_aggregator.get_today_events.return_value = [
+        Event(
+            id=str(i), title=f"Встреча {i}",
+            start=start + timedelta(hours=i), end=start + timedelta(hours=i, minutes=30),
+            attendees=[], source="yandex", raw_data={}
+        )
+        for i in range(6)
+    ]
+    bot_handlers.tts_service.synthesize.return_value = OGG_OPUS
+
+    await bot_handlers.voice_message_handler(mock_update, mock_context)
+
+    spoken = bot_handlers.tts_service.synthesize.call_args[0][0]
+    assert spoken.startswith("У вас 6 событий на сегодня.")
+    mock_update.message.reply_voice.assert_called_once()
+    assert "6. Встреча 5" in mock_update.message.reply_text.call_args[0][0]
+
+
+@pytest.mark.asyncio
+async def test_reply_mode_command_sets_text_only(bot_handlers, mock_update, mock_context):
+    """Test /reply text makes voice commands answer without TTS"""
+    mock_update.message.reply_text = AsyncMock()
+    mock_context.args = ["text"]
+
+    await bot_handlers.reply_mode_command(mock_update, mock_context)
+
+    assert "только текстом" in mock_update.message.reply_text.call_args[0][0]
+
+    mock_update.message.voice = Mock(spec=Voice)
+    mock_update.message.voice.file_id = "test_file_id"
+    mock_update.message.voice.file_size = 4096
+    mock_context.bot.get_file = AsyncMock(return_value=AsyncMock())
+    bot_handlers.stt_service.transcribe_bytes.return_value = "что завтра"
+    bot_handlers.nlp_service.parse.return_value = Command(
+        intent=Intent.GET_TOMORROW, original_text="что завтра", parameters={}, confidence=0.9
+    )
+    bot_handlers.calendar_aggregator.get_tomorrow_events.return_value = []
+
+    await bot_handlers.voice_message_handler(mock_update, mock_context)
+
+    bot_handlers.tts_service.synthesize.assert_not_called()
+    assert "нет событий" in mock_update.message.reply_text.call_args[0][0]
+
+
+@pytest.mark.asyncio
+async def test_voice_progress_uses_single_edited_message(bot_handlers, mock_update, mock_context):
+    """Test progress is one status message edited in place and deleted after the answer"""
+    status = Mock()
+    status.edit_text = AsyncMock()
+    status.delete = AsyncMock()
+    mock_update.message.reply_text = AsyncMock(return_value=status)
+    mock_update.message.reply_voice = AsyncMock()
+    mock_update.message.voice = Mock(spec=Voice)
+    mock_update.message.voice.file_id = "test_file_id"
+    mock_update.message.voice.file_size = 4096
+    mock_context.bot.get_file = AsyncMock(return_value=AsyncMock())
+
+    async def slow_transcription(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return "что завтра"
+
+    async def slow_synthesis(text):
+        await asyncio.sleep(0.01)
+        return OGG_OPUS
+
+    bot_handlers.stt_service.transcribe_bytes.side_effect = slow_transcription
+    bot_handlers.tts_service.synthesize.side_effect = slow_synthesis
+    bot_handlers.nlp_service.parse.return_value = Command(
+        intent=Intent.GET_TOMORROW, original_text="что завтра", parameters={}, confidence=0.9
+    )
+    bot_handlers.calendar_aggregator.get_tomorrow_events.return_value = []
+
+    await bot_handlers.voice_message_handler(mock_update, mock_context)
+
+    mock_update.message.reply_text.assert_awaited_once_with("🎤 Распознаю голосовое сообщение...")
+    assert status.edit_text.call_args_list[-1][0][0] == "🔊 Генерирую ответ..."
+    status.delete.assert_awaited_once()
+    mock_update.message.reply_voice.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_voice_command_uses_calendar_prefetch(mock_update, mock_context):
+    """Test today's events fetched during STT are not fetched again"""
+    stt_service = AsyncMock()
+    stt_service.get_cached_transcription.return_value = None
+    stt_service.transcribe_bytes.return_value = "что сегодня"
+    calendar_aggregator = AsyncMock()
+    calendar_aggregator.get_today_events.return_value = []
+    prefetcher = CalendarPrefetcher(calendar_aggregator)
+    handlers = BotHandlers(
+        stt_service=stt_service,
+        tts_service=AsyncMock(),
+        nlp_service=AsyncMock(),
+        calendar_aggregator=calendar_aggregator,
+        calendar_prefetcher=prefetcher
+    )
+    handlers.nlp_service.parse.return_value = Command(
+        intent=Intent.GET_TODAY, original_text="что сегодня", parameters={}, confidence=0.95
+    )
+    handlers.tts_service.synthesize.return_value = OGG_OPUS
+    mock_update.message.voice = Mock(spec=Voice)
+    mock_update.message.voice.file_id = "test_file_id"
+    mock_update.message.voice.file_size = 4096
+    mock_context.bot.get_file = AsyncMock(return_value=AsyncMock())
+
+    await handlers.voice_message_handler(mock_update, mock_context)
+
+    calendar_aggregator.get_today_events.assert_awaited_once()
+    assert prefetcher.stats.hits == 1
+    assert prefetcher.stats.wasted == 1
+
+
+@pytest.mark.asyncio
+async def test_voice_message_through_staged_pipeline(mock_update, mock_context):
+    """Test voice message is answered by the started stage pipeline"""
+    stt_service = AsyncMock()
+    stt_service.get_cached_transcription.return_value = "что завтра"
+    handlers = BotHandlers(
+        stt_service=stt_service,
+        tts_service=AsyncMock(),
+        nlp_service=AsyncMock(),
+        calendar_aggregator=AsyncMock(),
+        stage_workers={"tts": 2},
+        stage_queue_size=4
+    )
+    handlers.nlp_service.parse.return_value = Command(
+        intent=Intent.GET_TOMORROW, original_text="что завтра", parameters={}, confidence=0.9
+    )
+    handlers.calendar_aggregator.get_tomorrow_events.return_value = []
+    handlers.tts_service.synthesize.return_value = OGG_OPUS
+    mock_update.message.voice = Mock(spec=Voice)
+    mock_update.message.reply_voice = AsyncMock()
+
+    await handlers.voice_pipeline.start()
+    try:
+        await handlers.voice_message_handler(mock_update, mock_context)
+    finally:
+        await handlers.voice_pipeline.stop()
+
+    mock_update.message.reply_voice.assert_called_once()
+    stages = {stage.name: stage for stage in handlers.voice_pipeline.stages}
+    assert list(stages) == ["download", "stt", "nlp", "calendar", "tts", "send"]
+    assert stages["tts"].workers == 2
+    assert all(stage.stats.processed == 1 for stage in stages.values())
+
+
+def _deadline_handlers(deadline_seconds: float) -> BotHandlers:
+    stt_service = AsyncMock()
+    stt_service.get_cached_transcription.return_value = None
+    stt_service.transcribe_bytes.return_value = "что сегодня"
+    handlers = BotHandlers(
+        stt_service=stt_service,
+        tts_service=AsyncMock(),
+        nlp_service=AsyncMock(),
+        calendar_aggregator=AsyncMock(),
+        deadline_seconds=deadline_seconds
+    )
+    handlers.nlp_service.parse.return_value = Command(
+        intent=Intent.GET_TODAY, original_text="что сегодня", parameters={}, confidence=0.95
+    )
+    handlers.calendar_aggregator.get_today_events.return_value = []
+    handlers.tts_service.synthesize.return_value = OGG_OPUS
+    return handlers
+
+
+async def _hang(*args, **kwargs):
+    await asyncio.sleep(10)
+
+
+@pytest.fixture
+def voice_update(mock_update, mock_context):
+    """Voice message update with downloadable file"""
+    mock_update.message.voice = Mock(spec=Voice)
+    mock_update.message.voice.file_id = "test_file_id"
+    mock_update.message.voice.file_size = 4096
+    mock_update.message.voice.duration = 2
+    mock_update.message.reply_voice = AsyncMock()
+    mock_context.bot.get_file = AsyncMock(return_value=AsyncMock())
+    return mock_update
+
+
+@pytest.mark.asyncio
+async def test_late_nlp_falls_back_to_keywords(voice_update, mock_context):
+    """Test NLP out of time guesses the intent from keywords"""
+    handlers = _deadline_handlers(0.2)
+    handlers.nlp_service.parse.side_effect = _hang
+
+    await handlers.voice_message_handler(voice_update, mock_context)
+
+    handlers.calendar_aggregator.get_today_events.assert_awaited_once()
+    voice_update.message.reply_voice.assert_called_once()
+    assert handlers.deadline_stats.misses == {"nlp": 1}
+    assert handlers.deadline_stats.degraded == 1
+
+
+@pytest.mark.asyncio
+async def test_late_calendar_repeats_todays_answer_as_text(voice_update, mock_context):
+    """Test calendar out of time repeats the last answer with a note, as text"""
+    handlers = _deadline_handlers(0.2)
+    await handlers.voice_message_handler(voice_update, mock_context)
+    voice_update.message.reply_voice.reset_mock()
+
+    handlers.calendar_aggregator.get_today_events.side_effect = _hang
+    await handlers.voice_message_handler(voice_update, mock_context)
+
+    reply = voice_update.message.reply_text.call_args[0][0]
+    assert "Календарь не ответил вовремя, данные на" in reply
+    assert "нет событий" in reply
+    voice_update.message.reply_voice.assert_not_called()
+    assert handlers.deadline_stats.misses == {"calendar": 1}
+
+
+@pytest.mark.asyncio
+async def test_late_calendar_without_answer_asks_to_retry(voice_update, mock_context):
+    """Test calendar out of time with nothing cached asks to retry"""
+    handlers = _deadline_handlers(0.2)
+    handlers.calendar_aggregator.get_today_events.side_effect = _hang
+
+    await handlers.voice_message_handler(voice_update, mock_context)
+
+    reply = voice_update.message.reply_text.call_args[0][0]
+    assert "Попробуйте еще раз через минуту" in reply
+    handlers.tts_service.synthesize.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_late_tts_sends_text(voice_update, mock_context):
+    """Test TTS out of time sends the reply as text"""
+    handlers = _deadline_handlers(0.2)
+    handlers.tts_service.synthesize.side_effect = _hang
+
+    await handlers.voice_message_handler(voice_update, mock_context)
+
+    voice_update.message.reply_voice.assert_not_called()
+    assert "нет событий" in voice_update.message.reply_text.call_args[0][0]
+    assert handlers.deadline_stats.misses == {"tts": 1}
+
+
+@pytest.mark.asyncio
+async def test_late_stt_asks_to_repeat(voice_update, mock_context):
+    """Test STT out of time asks the user to send the message again"""
+    handlers = _deadline_handlers(0.2)
+    handlers.stt_service.transcribe_bytes.side_effect = _hang
+
+    await handlers.voice_message_handler(voice_update, mock_context)
+
+    assert "Не успел распознать" in voice_update.message.reply_text.call_args[0][0]
+    handlers.nlp_service.parse.assert_not_called()
+    assert handlers.deadline_stats.misses == {"stt": 1}
+
+
+@pytest.mark.asyncio
+async def test_long_voice_gets_more_time_for_stt(voice_update, mock_context):
+    """Test the budget grows with voice duration, so long messages are transcribed"""
+    handlers = _deadline_handlers(0.2)
+    handlers.deadline_per_audio_second = 0.2
+    voice_update.message.voice.duration = 3
+
+    async def slow_transcription(*args, **kwargs):
+        await asyncio.sleep(0.2)
+        return "что сегодня"
+
+    handlers.stt_service.transcribe_bytes.side_effect = slow_transcription
+
+    await handlers.voice_message_handler(voice_update, mock_context)
+
+    handlers.nlp_service.parse.assert_awaited_once()
+    assert handlers.deadline_stats.total_misses == 0
+
+
+def test_deadline_starts_at_update_arrival(voice_update, mock_context):
+    """Test time the update waited in the processor counts against its budget"""
+    handlers = _deadline_handlers(20.0)
+    processor = FairUpdateProcessor()
+    processor.arrival_time = Mock(return_value=time.monotonic() - 5.0)
+    mock_context.application.update_processor = processor
+
+    deadline = handlers._voice_deadline(voice_update, mock_context)
+
+    processor.arrival_time.assert_called_once_with(voice_update)
+    assert deadline.remaining == pytest.approx(15.0, abs=0.1)
+
+
+@pytest.mark.asyncio
+async def test_late_event_creation_finishes_and_reports(voice_update, mock_context):
+    """Test a calendar write is not cancelled by the deadline and its result is sent"""
+    handlers = _deadline_handlers(0.2)
+    start = datetime(2030, 1, 15, 15, 0)
+    handlers.datetime_parser = Mock()
+    handlers.datetime_parser.parse.return_value = TimeRange(start=start, end=start + timedelta(hours=1))
+    handlers.nlp_service.parse.return_value = Command(
+        intent=Intent.CREATE_EVENT, original_text="создай встречу в три",
+        parameters={"title": "Ревью", "time": "в три"}, confidence=0.9
+    )
+
+    async def slow_create(event):
+        await asyncio.sleep(0.3)
+        return event
+
+    handlers.calendar_aggregator.create_event.side_effect = slow_create
+
+    await handlers.voice_message_handler(voice_update, mock_context)
+
+    handlers.calendar_aggregator.create_event.assert_awaited_once()
+    reply = voice_update.message.reply_text.call_args[0][0]
+    assert "«Ревью» создана" in reply
+    assert "Попробуйте" not in reply
+    assert "calendar" not in handlers.deadline_stats.misses
+
+
+def _many_events(count: int) -> list:
+    start = datetime(2024, 1, 15, 9, 0)
+    return [
+        Event(
+            id=str(i), title=f"Встреча {i}", start=start + timedelta(minutes=i),
+            end=start + timedelta(minutes=i + 30), attendees=[], source="yandex", raw_data={}
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_long_agenda_paged_with_show_more(bot_handlers, mock_update, mock_context):
+    """Test long text reply is split into pages behind a show more button"""
+    mock_update.message.text = "что сегодня"
+    mock_update.message.reply_text = AsyncMock()
+    bot_handlers.nlp_service.parse.return_value = Command(
+        intent=Intent.GET_TODAY, original_text="что сегодня", parameters={}, confidence=0.95
+    )
+    bot_handlers.calendar_aggregator.get_today_events.return_value = _many_events(300)
+
+    await bot_handlers.text_message_handler(mock_update, mock_context)
+
+    # The first pages go out at once, the last of them carries the button
+    calls = mock_update.message.reply_text.call_args_list
+    assert len(calls) == bot_handlers.eager_pages
+    assert calls[0][0][0].startswith("У вас 300 событий на сегодня:")
+    assert all(len(call[0][0]) <= 4096 for call in calls)
+    assert all("reply_markup" not in call[1] for call in calls[:-1])
+    markup = calls[-1][1]["reply_markup"]
+    callback_data = markup.inline_keyboard[0][0].callback_data
+    assert callback_data.startswith(BotHandlers.SHOW_MORE_CALLBACK)
+
+    # Pressing the button sends the next page without querying the calendar again
+    query = Mock()
+    query.data = callback_data
+    query.answer = AsyncMock()
+    query.edit_message_reply_markup = AsyncMock()
+    query.message.reply_text = AsyncMock()
+    callback_update = Mock(spec=Update)
+    callback_update.callback_query = query
+
+    await bot_handlers.show_more_callback(callback_update, mock_context)
+
+    next_page = query.message.reply_text.call_args[0][0]
+    assert len(next_page) <= 4096
+    assert next_page.split(".")[0].isdigit()
+    query.edit_message_reply_markup.assert_awaited_once_with(reply_markup=None)
+    bot_handlers.calendar_aggregator.get_today_events.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_reply_of_few_pages_sent_progressively(bot_handlers, mock_update, mock_context):
+    """Test a reply within the eager pages is sent in full without a button"""
+    mock_update.message.text = "что сегодня"
+    mock_update.message.reply_text = AsyncMock()
+    bot_handlers.nlp_service.parse.return_value = Command(
+        intent=Intent.GET_TODAY, original_text="что сегодня", parameters={}, confidence=0.95
+    )
+    bot_handlers.calendar_aggregator.get_today_events.return_value = _many_events(150)
+
+    await bot_handlers.text_message_handler(mock_update, mock_context)
+
+    calls = mock_update.message.reply_text.call_args_list
+    assert len(calls) == 2
+    assert all("reply_markup" not in call[1] for call in calls)
+    assert calls[1][0][0].rstrip().endswith("Встреча 149\n   Время: 11:29 - 11:59")
+    assert len(bot_handlers.page_store) == 0
+
+
+@pytest.mark.asyncio
+async def test_show_more_for_expired_reply(bot_handlers, mock_context):
+    """Test unknown continuation token is answered without sending a page"""
+    query = Mock()
+    query.data = f"{BotHandlers.SHOW_MORE_CALLBACK}unknown"
+    query.answer = AsyncMock()
+    query.edit_message_reply_markup = AsyncMock()
+    query.message.reply_text = AsyncMock()
+    callback_update = Mock(spec=Update)
+    callback_update.callback_query = query
+
+    await bot_handlers.show_more_callback(callback_update, mock_context)
+
+    assert "устарел" in query.answer.call_args[0][0]
+    query.message.reply_text.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_create_event_in_past_rejected(bot_handlers):
+    """Test CREATE_EVENT for a time that already passed today is not written"""
+    start = datetime(2026, 10, 18, 10, 0)
+    bot_handlers.datetime_parser = Mock()
+    bot_handlers.datetime_parser.parse.return_value = TimeRange(
+        start=start, end=start + timedelta(hours=1), past=True
+    )
+    command = Command(
+        intent=Intent.CREATE_EVENT,
+        original_text="создай встречу сегодня в 10",
+        parameters={"title": "Встреча", "time": "сегодня в 10"},
+        confidence=0.9
+    )
+
+    response = await bot_handlers._execute_command(command)
+
+    bot_handlers.calendar_aggregator.create_event.assert_not_called()
+    assert "уже прошло" in response
+    assert "10:00" in response
+
+
+def test_stale_events_key_uses_user_timezone():
+    """Test cached answers for "today" are keyed by the user's date"""
+    command = Command(intent=Intent.GET_TODAY, original_text="что сегодня", parameters={}, confidence=0.9)
+    east, west = (
+        BotHandlers(
+            stt_service=AsyncMock(),
+            tts_service=AsyncMock(),
+            nlp_service=AsyncMock(),
+            calendar_aggregator=AsyncMock(),
+            datetime_parser=RussianDateTimeParser(timezone=timezone)
+        )
+        for timezone in ("Pacific/Kiritimati", "Pacific/Pago_Pago")
+    )
+
+    # UTC+14 and UTC-11 are always on different dates
+    assert east._events_key(command)[2] != west._events_key(command)[2]
+    assert east._events_key(command)[2] == datetime.now(east.datetime_parser.tz).date()
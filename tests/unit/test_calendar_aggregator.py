@@ -307,3 +307,41 @@ def test_remove_provider(aggregator):
     aggregator.remove_provider("test")
 
     assert "test" not in aggregator.providers
+
+
+@pytest.mark.asyncio
+async def test_create_event_uses_writable_provider(aggregator):
+    """Test create_event delegates to provider supporting creation"""
+    now = datetime.now()
+    event = Event(
+        id="new", title="Planning",
+        start=now, end=now + timedelta(hours=1),
+        attendees=[], source="", raw_data={}
+    )
+
+    read_only = Mock(spec=["get_events"])
+    writable = AsyncMock()
+    writable.create_event.return_value = event
+
+    aggregator.add_provider("google", read_only)
+    aggregator.add_provider("yandex", writable)
+
+    result = await aggregator.create_event(event)
+
+    assert result == event
+    writable.create_event.assert_called_once_with(event)
+
+
+@pytest.mark.asyncio
+async def test_create_event_no_writable_provider(aggregator):
+    """Test create_event fails without writable providers"""
+    now = datetime.now()
+    event = Event(
+        id="new", title="Planning",
+        start=now, end=now + timedelta(hours=1),
+        attendees=[], source="", raw_data={}
+    )
+    aggregator.add_provider("google", Mock(spec=["get_events"]))
+
+    with pytest.raises(ValueError):
+        await aggregator.create_event(event)
@@ -0,0 +1,118 @@
+"""Unit tests for speculative calendar prefetch"""
+import pytest
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+from src.services.calendar.models import Event
+from src.services.calendar.prefetch import CalendarPrefetcher
+
+
+def _event(event_id: str, start: datetime, minutes: int = 60) -> Event:
+    return Event(
+        id=event_id, title=f"Событие {event_id}",
+        start=start, end=start + timedelta(minutes=minutes),
+        attendees=[], source="yandex", raw_data={}
+    )
+
+
+@pytest.fixture
+def aggregator():
+    """Aggregator mock with fixed today/tomorrow windows"""
+    aggregator = AsyncMock()
+    aggregator.get_today_events.return_value = [_event("today", datetime(2024, 1, 15, 10, 0))]
+    aggregator.get_tomorrow_events.return_value = [_event("tomorrow", datetime(2024, 1, 16, 10, 0))]
+    return aggregator
+
+
+@pytest.mark.asyncio
+async def test_matching_intent_uses_prefetched_window(aggregator):
+    """Test today's query is answered from the prefetch; tomorrow is wasted"""
+    prefetcher = CalendarPrefetcher(aggregator)
+
+    prefetch = prefetcher.start(user_id=1)
+    events = await prefetch.today()
+    prefetch.close()
+
+    assert [e.id for e in events] == ["today"]
+    aggregator.get_today_events.assert_awaited_once()
+    assert prefetcher.stats.hits == 1
+    assert prefetcher.stats.wasted == 1
+    assert prefetcher.stats.hit_ratio == 1.0
+
+
+@pytest.mark.asyncio
+async def test_prefetch_rate_limited_per_user(aggregator):
+    """Test second message of a user within the interval is not prefetched"""
+    prefetcher = CalendarPrefetcher(aggregator, min_interval_seconds=60)
+
+    prefetcher.start(user_id=1).close()
+    limited = prefetcher.start(user_id=1)
+    other_user = prefetcher.start(user_id=2)
+
+    assert await limited.tomorrow() is None
+    assert await other_user.tomorrow() is not None
+    assert prefetcher.stats.rate_limited == 1
+    assert prefetcher.stats.started == 2
+    assert prefetcher.stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_upcoming_cut_from_windows(aggregator):
+    """Test upcoming hours are filtered from both windows without duplicates"""
+    now = datetime.now()
+    soon = _event("soon", now + timedelta(hours=1))
+    aggregator.get_today_events.return_value = [
+        _event("past", now - timedelta(hours=3)),
+        soon,
+    ]
+    aggregator.get_tomorrow_events.return_value = [soon, _event("later", now + timedelta(hours=5))]
+    prefetcher = CalendarPrefetcher(aggregator)
+
+    prefetch = prefetcher.start(user_id=1)
+    events = await prefetch.upcoming(hours=3)
+    prefetch.close()
+
+    assert [e.id for e in events] == ["soon"]
+    assert prefetcher.stats.hits == 1
+    assert prefetcher.stats.wasted == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_prefetch_falls_back(aggregator):
+    """Test failed fetch reports a miss so the caller fetches again"""
+    aggregator.get_today_events.side_effect = Exception("CalDAV unavailable")
+    prefetcher = CalendarPrefetcher(aggregator)
+
+    prefetch = prefetcher.start(user_id=1)
+    assert await prefetch.today() is None
+    prefetch.close()
+
+    assert prefetcher.stats.failed == 1
+    assert prefetcher.stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_unused_prefetch_cancelled(aggregator):
+    """Test fetches still running when the command is done are cancelled"""
+    async def slow_fetch():
+        await asyncio.sleep(10)
+
+    aggregator.get_today_events.side_effect = slow_fetch
+    aggregator.get_tomorrow_events.side_effect = slow_fetch
+    prefetcher = CalendarPrefetcher(aggregator, max_in_flight=2)
+
+    prefetch = prefetcher.start(user_id=1)
+    await asyncio.sleep(0)
+
+    # Both in-flight slots are taken
+    assert await prefetcher.start(user_id=2).today() is None
+
+    prefetch.close()
+    await asyncio.sleep(0.01)
+
+    assert prefetcher.stats.wasted == 2
+    assert prefetcher.stats.rate_limited == 1
+
+    # Cancelled fetches release their slots
+    prefetcher.start(user_id=3).close()
+    assert prefetcher.stats.started == 2
@@ -0,0 +1,103 @@
+"""Unit tests for chunked transcription"""
+import pytest
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, AsyncMock
+from pydub import AudioSegment
+from pydub.generators import Sine
+from src.services.voice.chunking import AudioChunker, split_audio, stitch_transcripts
+from src.services.voice.process_pool import ProcessPool
+from src.services.voice.stt_service import STTService
+
+
+def _speech_wav(parts_ms, pause_ms: int = 600) -> bytes:
+    """WAV with tones of given lengths separated by pauses"""
+    audio = AudioSegment.silent(duration=0, frame_rate=16000)
+    for i, length in enumerate(parts_ms):
+        if i:
+            audio += AudioSegment.silent(duration=pause_ms, frame_rate=16000)
+        audio += Sine(440).to_audio_segment(duration=length).set_frame_rate(16000)
+
+    out = io.BytesIO()
+    audio.set_channels(1).export(out, format="wav")
+    return out.getvalue()
+
+
+def _durations(chunks):
+    return [len(AudioSegment.from_file(io.BytesIO(c), format="wav")) for c in chunks]
+
+
+def test_split_audio_cuts_at_pauses():
+    """Test chunks end at pauses and do not exceed max length"""
+    chunks, hard_cuts = split_audio(_speech_wav([1500, 1500, 1500]), "wav", max_chunk_seconds=2.5, output_format="wav")
+
+    assert hard_cuts == 0
+    assert len(chunks) == 3
+    assert all(d <= 2500 for d in _durations(chunks))
+
+
+def test_split_audio_hard_cut_with_overlap():
+    """Test audio without pauses is cut at max length with overlap"""
+    chunks, hard_cuts = split_audio(_speech_wav([5000]), "wav", max_chunk_seconds=2.0, output_format="wav", overlap_ms=500)
+
+    assert hard_cuts == 2
+    assert sum(_durations(chunks)) == pytest.approx(5000 + 2 * 500, abs=20)
+
+
+def test_stitch_transcripts_removes_overlap():
+    """Test words repeated across a cut are kept once"""
+    texts = ["Создай встречу завтра в", "завтра в три часа с Иваном.", "Иваном. Напомни за час"]
+
+    assert stitch_transcripts(texts) == "Создай встречу завтра в три часа с Иваном. Напомни за час"
+
+
+def test_stitch_transcripts_without_overlap():
+    """Test chunks without overlap are simply joined"""
+    assert stitch_transcripts(["что сегодня", "", "в календаре"]) == "что сегодня в календаре"
+
+
+@pytest.mark.asyncio
+async def test_chunker_failure_returns_empty():
+    """Test undecodable audio falls back to whole-file transcription"""
+    chunker = AudioChunker(output_format="wav", pool=ProcessPool(executor=ThreadPoolExecutor(1)))
+
+    assert await chunker.split(b"not audio", "voice.wav") == []
+    assert chunker.stats.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_long_audio_transcribed_in_parallel():
+    """Test chunks are transcribed concurrently and stitched in order"""
+    in_flight = 0
+    peak = 0
+
+    async def create(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return Mock(text=kwargs["file"].name)
+
+    mock_client = AsyncMock()
+    mock_client.audio.transcriptions.create = create
+    chunker = AudioChunker(max_chunk_seconds=2.5, output_format="wav", pool=ProcessPool(executor=ThreadPoolExecutor(1)))
+    service = STTService(api_key="test", client=mock_client, chunker=chunker, chunk_concurrency=2)
+
+    text = await service.transcribe_bytes(_speech_wav([1500, 1500, 1500]), "voice.wav", duration=5.7)
+
+    assert text == "voice_0.wav voice_1.wav voice_2.wav"
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_short_audio_single_request():
+    """Test short audio takes the single-request path"""
+    mock_client = AsyncMock()
+    mock_client.audio.transcriptions.create = AsyncMock(return_value=Mock(text="что сегодня"))
+    chunker = Mock(max_chunk_seconds=20.0)
+    service = STTService(api_key="test", client=mock_client, chunker=chunker)
+
+    assert await service.transcribe_bytes(b"audio", "voice.ogg", duration=3) == "что сегодня"
+    chunker.split.assert_not_called()
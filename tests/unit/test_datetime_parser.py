@@ -0,0 +1,178 @@
+"""Unit tests for Russian date/time expression parser"""
+import pytest
+from datetime import datetime, timedelta
+from src.services.nlp.datetime_parser import RussianDateTimeParser
+
+
+# Sunday, 18 October 2026, 12:00
+NOW = datetime(2026, 10, 18, 12, 0)
+
+
+@pytest.fixture
+def parser():
+    """RussianDateTimeParser fixture"""
+    return RussianDateTimeParser(timezone="Europe/Moscow")
+
+
+def _naive(dt: datetime) -> datetime:
+    """Strip timezone for comparison"""
+    return dt.replace(tzinfo=None)
+
+
+def test_tomorrow_with_number_word(parser):
+    """Test 'завтра в три' resolves to 15:00 tomorrow"""
+    result = parser.parse("завтра в три", now=NOW)
+
+    assert _naive(result.start) == datetime(2026, 10, 19, 15, 0)
+    assert _naive(result.end) == datetime(2026, 10, 19, 16, 0)
+
+
+def test_weekday_with_day_part(parser):
+    """Test weekday and 'утра' qualifier"""
+    result = parser.parse("в пятницу в 10 утра", now=NOW)
+
+    assert _naive(result.start) == datetime(2026, 10, 23, 10, 0)
+
+
+def test_same_weekday_means_next_week(parser):
+    """Test weekday equal to today refers to next week"""
+    result = parser.parse("в воскресенье в восемь вечера", now=NOW)
+
+    assert _naive(result.start) == datetime(2026, 10, 25, 20, 0)
+
+
+@pytest.mark.parametrize("text,delta", [
+    ("через 2 часа", timedelta(hours=2)),
+    ("через час", timedelta(hours=1)),
+    ("через полчаса", timedelta(minutes=30)),
+    ("через двадцать минут", timedelta(minutes=20)),
+    ("через полтора часа", timedelta(minutes=90)),
+    ("через неделю", timedelta(weeks=1)),
+])
+def test_relative_offsets(parser, text, delta):
+    """Test 'через N ...' expressions"""
+    result = parser.parse(text, now=NOW)
+
+    assert _naive(result.start) == NOW + delta
+
+
+def test_range_with_number_words(parser):
+    """Test 'с трёх до пяти' range"""
+    result = parser.parse("с трёх до пяти", now=NOW)
+
+    assert _naive(result.start) == datetime(2026, 10, 18, 15, 0)
+    assert _naive(result.end) == datetime(2026, 10, 18, 17, 0)
+
+
+def test_range_with_day_parts(parser):
+    """Test range with explicit day parts"""
+    result = parser.parse("послезавтра с 9 утра до 6 вечера", now=NOW)
+
+    assert _naive(result.start) == datetime(2026, 10, 20, 9, 0)
+    assert _naive(result.end) == datetime(2026, 10, 20, 18, 0)
+
+
+def test_date_with_month_name(parser):
+    """Test '15 марта в 14:30' rolls over to next year"""
+    result = parser.parse("15 марта в 14:30", now=NOW)
+
+    assert _naive(result.start) == datetime(2027, 3, 15, 14, 30)
+
+
+def test_compound_number_words(parser):
+    """Test 'двадцать три' is parsed as 23"""
+    result = parser.parse("сегодня в двадцать три часа", now=NOW)
+
+    assert _naive(result.start) == datetime(2026, 10, 18, 23, 0)
+
+
+def test_past_time_rolls_to_tomorrow(parser):
+    """Test bare time that already passed refers to tomorrow"""
+    result = parser.parse("в 11", now=NOW)
+
+    assert _naive(result.start) == datetime(2026, 10, 19, 11, 0)
+
+
+def test_day_without_time_uses_default_hour(parser):
+    """Test day-only expression uses default hour"""
+    result = parser.parse("завтра", now=NOW)
+
+    assert _naive(result.start) == datetime(2026, 10, 19, 9, 0)
+
+
+def test_no_temporal_expression(parser):
+    """Test text without date/time returns None"""
+    assert parser.parse("создай встречу с Иваном", now=NOW) is None
+    assert parser.parse("", now=NOW) is None
+
+
+def test_result_is_timezone_aware(parser):
+    """Test parsed datetimes carry user timezone"""
+    result = parser.parse("завтра в 10:00", now=NOW)
+
+    assert result.start.tzinfo is not None
+    assert result.start.utcoffset() == timedelta(hours=3)
+
+
+def test_normalize_number_words():
+    """Test number word normalization"""
+    assert RussianDateTimeParser.normalize("В ДВАДЦАТЬ ТРИ") == "в 23"
+    assert RussianDateTimeParser.normalize("с трёх до пяти") == "с 3 до 5"
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("завтра в одиннадцать тридцать", datetime(2026, 10, 19, 11, 30)),
+    ("завтра в 11 30", datetime(2026, 10, 19, 11, 30)),
+    ("завтра в двенадцать сорок пять", datetime(2026, 10, 19, 12, 45)),
+    ("в пятницу в семь пятнадцать вечера", datetime(2026, 10, 23, 19, 15)),
+])
+def test_spoken_hour_and_minutes(parser, text, expected):
+    """Test 'H MM' after number word normalization sets minutes"""
+    result = parser.parse(text, now=NOW)
+
+    assert _naive(result.start) == expected
+
+
+def test_spoken_minutes_in_range(parser):
+    """Test 'с десяти тридцати до двенадцати' keeps start minutes"""
+    result = parser.parse("завтра с 10 30 до 12", now=NOW)
+
+    assert _naive(result.start) == datetime(2026, 10, 19, 10, 30)
+    assert _naive(result.end) == datetime(2026, 10, 19, 12, 0)
+
+
+def test_hour_before_date_not_taken_as_minutes(parser):
+    """Test 'в 3 15 марта' is 15:00 on 15 March, not 03:15"""
+    result = parser.parse("в 3 15 марта", now=NOW)
+
+    assert _naive(result.start) == datetime(2027, 3, 15, 15, 0)
+
+
+def test_explicit_today_in_past_flagged(parser):
+    """Test 'сегодня в 10' at noon stays today and is marked past"""
+    result = parser.parse("сегодня в 10", now=NOW)
+
+    assert _naive(result.start) == datetime(2026, 10, 18, 10, 0)
+    assert result.past
+    assert not parser.parse("в 10", now=NOW).past
+    assert not parser.parse("сегодня в 15", now=NOW).past
+
+
+def test_leap_day_after_it_passed_is_next_leap_year(parser):
+    """Test '29 февраля' said after the leap day refers to the next one"""
+    result = parser.parse("29 февраля в 10 утра", now=datetime(2028, 3, 10, 12, 0))
+
+    assert _naive(result.start) == datetime(2032, 2, 29, 10, 0)
+
+
+def test_impossible_date_not_parsed(parser):
+    """Test a day that does not exist in the month yields no date"""
+    assert parser.parse("31 ноября", now=NOW) is None
+
+
+def test_days_offset_keeps_clock_time(parser):
+    """Test 'через N дней в 10' picks the day by offset and the time by clock"""
+    result = parser.parse("через 3 дня в 10", now=NOW)
+
+    assert _naive(result.start) == datetime(2026, 10, 21, 10, 0)
+    assert not result.past
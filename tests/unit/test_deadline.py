@@ -0,0 +1,98 @@
+"""Unit tests for per-request deadline budget"""
+import pytest
+import asyncio
+import time
+from src.bot.deadline import Deadline, DeadlineExceeded, DeadlineStats
+
+
+@pytest.mark.asyncio
+async def test_stage_within_budget_returns_result():
+    """Test work finishing in time returns its result"""
+    deadline = Deadline(1.0)
+
+    async def work():
+        return "ok"
+
+    assert await deadline.run("nlp", work()) == "ok"
+    assert deadline.stats.total_misses == 0
+
+
+@pytest.mark.asyncio
+async def test_late_stage_cancelled_and_counted():
+    """Test work exceeding its share is cancelled and recorded as a miss"""
+    stats = DeadlineStats()
+    deadline = Deadline(0.05, stats=stats)
+    cancelled = False
+
+    async def hang():
+        nonlocal cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    with pytest.raises(DeadlineExceeded) as exc_info:
+        await deadline.run("calendar", hang())
+
+    assert exc_info.value.stage == "calendar"
+    assert cancelled
+    assert stats.misses == {"calendar": 1}
+    assert stats.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_timeout_of_the_work_is_not_a_miss():
+    """Test TimeoutError raised by the work itself propagates unchanged"""
+    deadline = Deadline(1.0)
+
+    async def client_timeout():
+        raise TimeoutError("read timeout")
+
+    async def nested():
+        return await Deadline(0.01).run("inner", asyncio.sleep(10))
+
+    with pytest.raises(TimeoutError, match="read timeout"):
+        await deadline.run("stt", client_timeout())
+    with pytest.raises(DeadlineExceeded) as exc_info:
+        await deadline.run("nlp", nested())
+
+    assert exc_info.value.stage == "inner"
+    assert deadline.stats.total_misses == 0
+
+
+@pytest.mark.asyncio
+async def test_share_of_remaining_budget():
+    """Test stage timeout is a share of what is left"""
+    deadline = Deadline(10.0)
+
+    assert deadline.timeout(0.5) == pytest.approx(5.0, abs=0.1)
+    assert not deadline.expired
+
+
+@pytest.mark.asyncio
+async def test_expired_budget_fails_next_stage_immediately():
+    """Test stage starting after the budget is used up misses at once"""
+    deadline = Deadline(0.01)
+    await asyncio.sleep(0.02)
+
+    assert deadline.expired
+    with pytest.raises(DeadlineExceeded):
+        await deadline.run("tts", asyncio.sleep(0))
+
+
+@pytest.mark.asyncio
+async def test_no_budget_means_no_timeout():
+    """Test deadline without budget never times out"""
+    deadline = Deadline(None)
+
+    assert deadline.timeout(0.5) is None
+    assert not deadline.expired
+    assert await deadline.run("stt", asyncio.sleep(0.01, result="text")) == "text"
+
+
+def test_budget_counted_from_arrival():
+    """Test time spent before the deadline was created counts against it"""
+    deadline = Deadline(10.0, started=time.monotonic() - 4.0)
+
+    assert deadline.remaining == pytest.approx(6.0, abs=0.1)
@@ -0,0 +1,72 @@
+"""Unit tests for async ElevenLabs streaming client"""
+import pytest
+import re
+from aioresponses import aioresponses
+from src.services.voice.elevenlabs_client import ElevenLabsError, ElevenLabsStreamingClient
+
+STREAM_URL = re.compile(r"^https://api\.elevenlabs\.io/v1/text-to-speech/voice/stream\?.*$")
+
+
+@pytest.fixture
+async def client():
+    """ElevenLabsStreamingClient fixture with small read chunks"""
+    client = ElevenLabsStreamingClient(api_key="test_key", chunk_size=4)
+    yield client
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_synthesize_collects_streamed_chunks(client):
+    """Test chunks are assembled into the complete audio"""
+    audio = bytes(range(256)) * 40
+
+    with aioresponses() as mocked:
+        mocked.post(STREAM_URL, status=200, body=audio)
+        result = await client.synthesize("Привет", voice_id="voice", output_format="mp3_44100_128")
+
+        request = next(iter(mocked.requests.values()))[0]
+
+    assert result == audio
+    assert isinstance(result, bytes)
+    assert request.kwargs["json"] == {"text": "Привет", "model_id": "eleven_multilingual_v2"}
+    assert request.kwargs["params"] == {"output_format": "mp3_44100_128"}
+
+
+@pytest.mark.asyncio
+async def test_stream_reports_first_byte_and_total_latency(client):
+    """Test first-byte and total latency are recorded separately"""
+    with aioresponses() as mocked:
+        mocked.post(STREAM_URL, status=200, body=b"audio-data")
+        chunks = [chunk async for chunk in client.stream("Тест", voice_id="voice")]
+
+    assert b"".join(chunks) == b"audio-data"
+    assert len(chunks) > 1
+    assert client.stats.requests == 1
+    assert client.stats.bytes_received == len(b"audio-data")
+    assert 0 < client.stats.first_byte_seconds <= client.stats.total_seconds
+
+
+@pytest.mark.asyncio
+async def test_api_error_raised(client):
+    """Test error status raises ElevenLabsError"""
+    with aioresponses() as mocked:
+        mocked.post(STREAM_URL, status=401, body="invalid api key")
+
+        with pytest.raises(ElevenLabsError) as exc_info:
+            await client.synthesize("Тест", voice_id="voice")
+
+    assert exc_info.value.status == 401
+    assert client.stats.requests == 0
+
+
+@pytest.mark.asyncio
+async def test_session_is_reused(client):
+    """Test one pooled session serves consecutive requests"""
+    with aioresponses() as mocked:
+        mocked.post(STREAM_URL, status=200, body=b"a", repeat=True)
+        await client.synthesize("Один", voice_id="voice")
+        session = client._session
+        await client.synthesize("Два", voice_id="voice")
+
+    assert client._session is session
+    assert client.stats.requests == 2
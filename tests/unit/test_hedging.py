@@ -0,0 +1,128 @@
+"""Unit tests for hedged requests"""
+import pytest
+import asyncio
+from unittest.mock import Mock, AsyncMock
+from src.services.hedging import RequestHedger
+from src.services.voice.stt_service import STTService
+
+
+def _warm_hedger(latency: float = 0.01, **kwargs) -> RequestHedger:
+    """Hedger with enough samples and budget to hedge immediately"""
+    hedger = RequestHedger(name="test", min_samples=5, max_hedge_ratio=1.0, **kwargs)
+    for _ in range(5):
+        hedger.record_latency(latency)
+    return hedger
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_before_min_samples():
+    """Test cold hedger never duplicates requests"""
+    hedger = RequestHedger(name="test", min_samples=5, max_hedge_ratio=1.0)
+    calls = []
+
+    async def request():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    assert await hedger.run(request) == "ok"
+    assert len(calls) == 1
+    assert hedger.hedge_delay() is None
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged_and_hedge_wins():
+    """Test slow primary triggers hedge and faster hedge wins"""
+    hedger = _warm_hedger(latency=0.01)
+    delays = [1.0, 0.01]
+    cancelled = []
+
+    async def request():
+        delay = delays.pop(0)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(delay)
+            raise
+        return delay
+
+    result = await hedger.run(request)
+    await asyncio.sleep(0)
+
+    assert result == 0.01
+    assert hedger.stats.hedges == 1
+    assert hedger.stats.hedge_wins == 1
+    assert cancelled == [1.0]
+
+
+@pytest.mark.asyncio
+async def test_fast_request_not_hedged():
+    """Test request finishing before threshold is not hedged"""
+    hedger = _warm_hedger(latency=0.5)
+
+    async def request():
+        return "fast"
+
+    assert await hedger.run(request) == "fast"
+    assert hedger.stats.hedges == 0
+
+
+@pytest.mark.asyncio
+async def test_budget_limits_hedges():
+    """Test hedges are denied when budget is exhausted"""
+    hedger = RequestHedger(name="test", min_samples=1, max_hedge_ratio=0.0)
+    hedger.record_latency(0.001)
+
+    async def request():
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    assert await hedger.run(request) == "ok"
+    assert hedger.stats.hedges == 0
+    assert hedger.stats.budget_denied == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_primary_falls_back_to_hedge():
+    """Test error in one attempt still returns the other's result"""
+    hedger = _warm_hedger(latency=0.01)
+    attempts = []
+
+    async def request():
+        attempts.append(1)
+        if len(attempts) == 1:
+            await asyncio.sleep(0.05)
+            raise Exception("API Error")
+        await asyncio.sleep(0.1)
+        return "hedged"
+
+    assert await hedger.run(request) == "hedged"
+
+
+@pytest.mark.asyncio
+async def test_all_attempts_fail():
+    """Test error is raised when every attempt fails"""
+    hedger = RequestHedger(name="test")
+
+    async def request():
+        raise Exception("API Error")
+
+    with pytest.raises(Exception, match="API Error"):
+        await hedger.run(request)
+
+
+@pytest.mark.asyncio
+async def test_stt_service_uses_hedger():
+    """Test STTService routes Whisper calls through hedger"""
+    hedger = RequestHedger(name="whisper")
+    service = STTService(api_key="test_key", hedger=hedger)
+    mock_client = AsyncMock()
+    mock_response = Mock()
+    mock_response.text = "привет"
+    mock_client.audio.transcriptions.create = AsyncMock(return_value=mock_response)
+    service.client = mock_client
+
+    result = await service.transcribe_bytes(b"audio", "audio.ogg")
+
+    assert result == "привет"
+    assert hedger.stats.requests == 1
@@ -1,5 +1,6 @@
 """Unit tests for Main Bot Application"""
 import pytest
+import asyncio
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from src.main import BotApplication, create_bot_application
 
@@ -14,6 +15,52 @@ def mock_config():
     config.yandex_calendar_login = "test@example.com"
     config.yandex_calendar_password = "test_password"
     config.yandex_calendar_url = "https://caldav.yandex.ru"
+    config.timezone = "Europe/Moscow"
+    config.nlp_batching_enabled = False
+    config.openai_max_connections = 20
+    config.openai_max_keepalive_connections = 10
+    config.openai_http2 = False
+    config.openai_connect_timeout = 5.0
+    config.openai_read_timeout = 60.0
+    config.openai_keepalive_ping_interval = 30.0
+    config.openai_hedging_enabled = False
+    config.stt_preprocess_enabled = False
+    config.voice_file_id_cache_size = 1000
+    config.stt_backend = "whisper_api"
+    config.stt_local_routing_enabled = False
+    config.stt_max_concurrent = 8
+    config.stt_max_queue_size = 50
+    config.stt_max_queue_wait = 30.0
+    config.stt_chunking_enabled = False
+    config.stt_chunk_concurrency = 4
+    config.stt_cache_enabled = False
+    config.tts_cache_enabled = False
+    config.tts_parallel_enabled = False
+    config.tts_phrase_library_enabled = False
+    config.tts_opus_enabled = False
+    config.tts_output_format = "opus_48000_32"
+    config.tts_max_concurrency = 3
+    config.update_max_concurrent = 8
+    config.update_max_pending = 256
+    config.calendar_prefetch_enabled = False
+    config.pipeline_download_workers = 8
+    config.pipeline_stt_workers = 8
+    config.pipeline_nlp_workers = 8
+    config.pipeline_calendar_workers = 8
+    config.pipeline_tts_workers = 4
+    config.pipeline_send_workers = 8
+    config.pipeline_queue_size = 16
+    config.voice_deadline_seconds = 20.0
+    config.voice_deadline_per_audio_second = 0.25
+    config.reply_max_voice_events = 3
+    config.reply_max_voice_chars = 600
+    config.reply_summary_queue_depth = 4
+    config.reply_text_queue_depth = 8
+    config.reply_eager_pages = 3
+    config.tts_max_connections = 10
+    config.tts_segment_max_chars = 250
+    config.tts_parallel_min_chars = 300
+    config.audio_workers = 2
     return config
 
 
@@ -38,7 +85,8 @@ def test_bot_application_initialization(mock_config):
 
 def test_bot_application_services_initialized(mock_config):
     """Test that all services are properly initialized"""
-    with patch('src.main.STTService') as MockSTT, \
+    with patch('src.main.OpenAITransport') as MockTransport, \
+         patch('src.main.STTService') as MockSTT, \
          patch('src.main.TTSService') as MockTTS, \
          patch('src.main.NLPService') as MockNLP, \
          patch('src.main.YandexCalendarProvider') as MockYandex, \
@@ -48,9 +96,19 @@ def test_bot_application_services_initialized(mock_config):
         app = BotApplication(mock_config)
 
         # Verify services were initialized with correct parameters
-        MockSTT.assert_called_once_with(api_key="test_openai_key")
-        MockTTS.assert_called_once_with(api_key="test_elevenlabs_key")
-        MockNLP.assert_called_once_with(api_key="test_openai_key")
+        shared_client = MockTransport.return_value.client
+        MockTransport.assert_called_once()
+        MockSTT.assert_called_once_with(
+            api_key="test_openai_key", backend=app.stt_backend, admission=app.stt_admission,
+            preprocessor=None, cache=None, chunker=None, chunk_concurrency=4
+        )
+        assert app.stt_backend.client is shared_client
+        MockTTS.assert_called_once_with(
+            api_key="test_elevenlabs_key", cache=None, output_format="opus_48000_32", stitcher=None,
+            max_concurrency=3, segment_max_chars=250, parallel_min_chars=300,
+            voice_encoder=None, http_client=app.elevenlabs_client
+        )
+        MockNLP.assert_called_once_with(api_key="test_openai_key", client=shared_client, hedger=None)
         MockYandex.assert_called_once_with(
             login="test@example.com",
             password="test_password",
@@ -58,6 +116,8 @@ def test_bot_application_services_initialized(mock_config):
         )
         MockAgg.assert_called_once()
         MockHandlers.assert_called_once()
+        assert MockHandlers.call_args.kwargs["stage_workers"]["tts"] == 4
+        assert MockHandlers.call_args.kwargs["stage_queue_size"] == 16
 
 
 @patch('src.main.Application')
@@ -75,6 +135,9 @@ def test_create_telegram_app(mock_telegram_app, mock_config):
 
         # Verify Application.builder() was called with token
         mock_telegram_app.builder.assert_called_once()
+        builder = mock_telegram_app.builder.return_value.token.return_value
+        builder.concurrent_updates.assert_called_once_with(app.update_processor)
+        assert app.update_processor.max_concurrent == 8
 
 
 @patch('src.main.Application')
@@ -89,7 +152,7 @@ def test_setup_handlers(mock_telegram_app, mock_config):
 
         # Mock the application instance
         mock_app_instance = MagicMock()
-        mock_telegram_app.builder.return_value.token.return_value.build.return_value = mock_app_instance
+        mock_telegram_app.builder.return_value.token.return_value.concurrent_updates.return_value.update_queue.return_value.build.return_value = mock_app_instance
 
         app = BotApplication(mock_config)
         telegram_app = app.create_telegram_app()
@@ -164,7 +227,7 @@ def test_command_handlers_registered(mock_telegram_app, mock_config):
 
         # Mock application
         mock_app_instance = MagicMock()
-        mock_telegram_app.builder.return_value.token.return_value.build.return_value = mock_app_instance
+        mock_telegram_app.builder.return_value.token.return_value.concurrent_updates.return_value.update_queue.return_value.build.return_value = mock_app_instance
 
         app = BotApplication(mock_config)
         telegram_app = app.create_telegram_app()
@@ -207,3 +270,94 @@ def test_bot_application_has_all_services(mock_config):
         assert app.yandex_calendar == mock_yandex
         assert app.calendar_aggregator == mock_agg
         assert app.handlers == mock_handlers
+
+
+@pytest.mark.asyncio
+async def test_run_selects_mode_from_config(mock_config):
+    """Test run() dispatches to polling or webhook mode"""
+    with patch('src.main.STTService'), \
+         patch('src.main.TTSService'), \
+         patch('src.main.NLPService'), \
+         patch('src.main.YandexCalendarProvider'), \
+         patch('src.main.CalendarAggregator'), \
+         patch('src.main.BotHandlers'):
+
+        app = BotApplication(mock_config)
+        app.run_polling = AsyncMock()
+        app.run_webhook = AsyncMock()
+
+        mock_config.bot_mode = "webhook"
+        await app.run()
+        app.run_webhook.assert_awaited_once()
+        app.run_polling.assert_not_called()
+
+        mock_config.bot_mode = "polling"
+        await app.run()
+        app.run_polling.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_run_webhook_requires_secret_token(mock_config):
+    """Test webhook mode refuses to start without URL and secret token"""
+    with patch('src.main.STTService'), \
+         patch('src.main.TTSService'), \
+         patch('src.main.NLPService'), \
+         patch('src.main.YandexCalendarProvider'), \
+         patch('src.main.CalendarAggregator'), \
+         patch('src.main.BotHandlers'):
+
+        app = BotApplication(mock_config)
+        mock_config.webhook_url = "https://bot.example.com/telegram"
+        mock_config.webhook_secret_token = None
+
+        with pytest.raises(ValueError):
+            await app.run_webhook()
+
+
+@pytest.mark.asyncio
+async def test_phrase_warmup_cancelled_on_shutdown(mock_config):
+    """Test fragment rendering still running is cancelled before clients close"""
+    with patch('src.main.STTService'), \
+         patch('src.main.TTSService'), \
+         patch('src.main.NLPService'), \
+         patch('src.main.YandexCalendarProvider'), \
+         patch('src.main.CalendarAggregator'), \
+         patch('src.main.BotHandlers'):
+
+        app = BotApplication(mock_config)
+        assert app._phrase_warmup is None
+
+        app._phrase_warmup = asyncio.create_task(asyncio.sleep(10))
+        await app._stop_phrase_warmup()
+
+        assert app._phrase_warmup.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_run_webhook_keeps_pending_updates(mock_config):
+    """Test a starting replica does not drop updates queued for the others"""
+    with patch('src.main.STTService'), \
+         patch('src.main.TTSService'), \
+         patch('src.main.NLPService'), \
+         patch('src.main.YandexCalendarProvider'), \
+         patch('src.main.CalendarAggregator'), \
+         patch('src.main.BotHandlers'), \
+         patch('src.main.WebhookServer') as mock_server_class:
+
+        mock_server_class.return_value.start = AsyncMock()
+        mock_server_class.return_value.stop = AsyncMock()
+        app = BotApplication(mock_config)
+        mock_config.webhook_url = "https://bot.example.com/telegram"
+        mock_config.webhook_secret_token = "secret"
+        mock_config.webhook_drop_pending_updates = False
+        application = AsyncMock()
+        application.bot.set_webhook = AsyncMock(side_effect=RuntimeError("stop"))
+        app.create_telegram_app = Mock(return_value=application)
+        app.setup_handlers = Mock()
+        app._start_application = AsyncMock()
+        app._close_services = AsyncMock()
+
+        with pytest.raises(RuntimeError):
+            await app.run_webhook()
+
+        assert application.bot.set_webhook.call_args.kwargs["drop_pending_updates"] is False
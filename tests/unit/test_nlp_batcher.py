@@ -0,0 +1,111 @@
+"""Unit tests for NLP micro-batching layer"""
+import pytest
+import asyncio
+from unittest.mock import Mock, AsyncMock
+from src.services.nlp.batcher import NLPBatcher
+from src.services.calendar.models import Command, Intent
+
+
+def _command(text: str, intent: Intent = Intent.GET_TODAY) -> Command:
+    """Build Command for text"""
+    return Command(intent=intent, original_text=text, parameters={}, confidence=0.9)
+
+
+@pytest.fixture
+def nlp_service():
+    """Mock NLPService with slow single parse"""
+    service = Mock()
+
+    async def parse(text):
+        await asyncio.sleep(0.05)
+        return _command(text)
+
+    async def parse_batch(texts):
+        return [_command(text, Intent.GET_TOMORROW) for text in texts]
+
+    service.parse = AsyncMock(side_effect=parse)
+    service.parse_batch = AsyncMock(side_effect=parse_batch)
+    service.close = AsyncMock()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_single_request_bypasses_batching(nlp_service):
+    """Test shallow queue goes straight to parse"""
+    batcher = NLPBatcher(nlp_service, max_wait_ms=50)
+
+    result = await batcher.parse("что сегодня")
+
+    assert result.original_text == "что сегодня"
+    nlp_service.parse_batch.assert_not_called()
+    assert batcher.stats.direct_requests == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_batched(nlp_service):
+    """Test requests beyond queue depth are sent as one batch"""
+    batcher = NLPBatcher(nlp_service, max_batch_size=8, max_wait_ms=5, min_queue_depth=1)
+
+    texts = [f"команда {i}" for i in range(4)]
+    results = await asyncio.gather(*(batcher.parse(t) for t in texts))
+
+    assert [r.original_text for r in results] == texts
+    nlp_service.parse_batch.assert_called_once_with(texts[1:])
+    assert batcher.stats.batches_sent == 1
+    assert batcher.stats.batched_items == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_size_limit(nlp_service):
+    """Test batches never exceed max_batch_size"""
+    batcher = NLPBatcher(nlp_service, max_batch_size=2, max_wait_ms=5, min_queue_depth=0)
+
+    await asyncio.gather(*(batcher.parse(f"команда {i}") for i in range(5)))
+
+    sizes = [len(call.args[0]) for call in nlp_service.parse_batch.call_args_list]
+    assert max(sizes) <= 2
+    assert sum(sizes) + nlp_service.parse.call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_malformed_batch_falls_back_to_single(nlp_service):
+    """Test malformed batch response is retried per item"""
+    nlp_service.parse_batch.side_effect = ValueError("Malformed batch response")
+    batcher = NLPBatcher(nlp_service, max_wait_ms=5, min_queue_depth=0)
+
+    results = await asyncio.gather(batcher.parse("а"), batcher.parse("б"))
+
+    assert [r.original_text for r in results] == ["а", "б"]
+    assert batcher.stats.fallback_items == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_api_error_propagates(nlp_service):
+    """Test API errors are delivered to every waiting caller"""
+    nlp_service.parse_batch.side_effect = Exception("API Error")
+    batcher = NLPBatcher(nlp_service, max_wait_ms=5, min_queue_depth=0)
+
+    results = await asyncio.gather(
+        batcher.parse("а"), batcher.parse("б"), return_exceptions=True
+    )
+
+    assert all(isinstance(r, Exception) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_parse_empty_text(nlp_service):
+    """Test empty text is rejected"""
+    batcher = NLPBatcher(nlp_service)
+
+    with pytest.raises(ValueError):
+        await batcher.parse("  ")
+
+
+@pytest.mark.asyncio
+async def test_close_closes_service(nlp_service):
+    """Test close delegates to NLP service"""
+    batcher = NLPBatcher(nlp_service)
+
+    await batcher.close()
+
+    nlp_service.close.assert_called_once()
@@ -0,0 +1,129 @@
+"""Unit tests for offline NLP evaluation harness"""
+import pytest
+import json
+from pathlib import Path
+from unittest.mock import Mock, AsyncMock
+from src.services.nlp.nlp_service import NLPService
+from src.services.nlp.evaluation import (
+    EvaluationCase,
+    EvaluationReport,
+    ReplayChatClient,
+    RecordingChatClient,
+    evaluate,
+    load_corpus,
+)
+from src.services.stats import percentile
+from src.services.calendar.models import Intent
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+def _record(content: str, tokens: int = 100, latency_ms: float = 0) -> dict:
+    """Build recording entry"""
+    return {
+        "content": content,
+        "usage": {"prompt_tokens": tokens - 10, "completion_tokens": 10, "total_tokens": tokens},
+        "latency_ms": latency_ms
+    }
+
+
+@pytest.fixture
+def replay_client():
+    """ReplayChatClient with a few recordings"""
+    return ReplayChatClient({
+        "что сегодня": _record('{"intent": "get_today", "params": {}}', tokens=100),
+        "когда встреча с Иваном": _record('{"intent": "find_meeting", "params": {"person": "Иван"}}', tokens=120),
+        "что в ближайшие 3 часа": _record('{"intent": "get_tomorrow", "params": {}}', tokens=110),
+    }, latency_scale=0)
+
+
+@pytest.mark.asyncio
+async def test_evaluate_reports_accuracy_and_tokens(replay_client):
+    """Test accuracy, slot accuracy and token metrics"""
+    service = NLPService(api_key="test_key")
+    service.client = replay_client
+    cases = [
+        EvaluationCase("что сегодня", Intent.GET_TODAY),
+        EvaluationCase("когда встреча с Иваном", Intent.FIND_MEETING, {"person": "иван"}),
+        EvaluationCase("что в ближайшие 3 часа", Intent.GET_UPCOMING, {"hours": 3}),
+    ]
+
+    report = await evaluate(service, cases, client=replay_client)
+
+    assert report.total == 3
+    assert report.intent_accuracy == pytest.approx(2 / 3, abs=1e-3)
+    assert report.slot_accuracy == 0.5
+    assert report.tokens_per_request == 110.0
+    assert len(report.failures) == 1
+    assert report.failures[0]["text"] == "что в ближайшие 3 часа"
+
+
+@pytest.mark.asyncio
+async def test_replay_unknown_utterance(replay_client):
+    """Test unrecorded utterances replay as unknown intent"""
+    service = NLPService(api_key="test_key")
+    service.client = replay_client
+
+    command = await service.parse("не записанная фраза")
+
+    assert command.intent == Intent.UNKNOWN
+
+
+@pytest.mark.asyncio
+async def test_recording_client_stores_responses():
+    """Test RecordingChatClient captures content and usage"""
+    response = Mock()
+    response.choices = [Mock()]
+    response.choices[0].message.content = '{"intent": "get_today", "params": {}}'
+    response.usage = Mock(prompt_tokens=90, completion_tokens=10, total_tokens=100)
+
+    real_client = Mock()
+    real_client.chat.completions.create = AsyncMock(return_value=response)
+    recorder = RecordingChatClient(real_client)
+
+    await recorder.chat.completions.create(messages=[{"role": "user", "content": "что сегодня"}])
+
+    assert recorder.recordings["что сегодня"]["usage"]["total_tokens"] == 100
+    assert recorder.total_tokens == 100
+
+
+def test_compare_detects_regressions():
+    """Test baseline comparison flags accuracy, latency and token regressions"""
+    report = EvaluationReport(
+        total=10, intent_accuracy=0.8, slot_accuracy=1.0,
+        latency_p50_ms=500, latency_p95_ms=1500, tokens_per_request=600
+    )
+    baseline = {
+        "intent_accuracy": 0.9, "slot_accuracy": 1.0,
+        "latency_p95_ms": 1000, "tokens_per_request": 500
+    }
+
+    regressions = report.compare(baseline)
+
+    assert len(regressions) == 3
+    assert report.compare(report.to_dict()) == []
+
+
+def test_percentile():
+    """Test nearest-rank percentile"""
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile([], 50) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_bundled_corpus_matches_baseline():
+    """Test bundled corpus and recordings do not regress against baseline"""
+    cases = load_corpus(str(FIXTURES / "nlp_corpus.json"))
+    client = ReplayChatClient.from_file(str(FIXTURES / "nlp_recordings.json"), latency_scale=0)
+    service = NLPService(api_key="test_key")
+    service.client = client
+
+    report = await evaluate(service, cases, client=client)
+
+    with open(FIXTURES / "nlp_baseline.json", encoding="utf-8") as f:
+        baseline = json.load(f)
+    baseline.pop("latency_p95_ms")  # latency is not replayed in unit tests
+
+    assert report.compare(baseline) == []
@@ -166,3 +166,37 @@ def test_nlp_service_custom_model():
     """Test NLPService with custom model"""
     service = NLPService(api_key="test_key", model="gpt-4-turbo")
     assert service.model == "gpt-4-turbo"
+
+
+@pytest.mark.asyncio
+async def test_parse_batch(nlp_service):
+    """Test parsing several commands in one request"""
+    mock_client = AsyncMock()
+    mock_response = Mock()
+    mock_response.choices = [Mock()]
+    mock_response.choices[0].message.content = (
+        '[{"id": 1, "intent": "get_tomorrow", "params": {}},'
+        ' {"id": 0, "intent": "get_today", "params": {}}]'
+    )
+    mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+    nlp_service.client = mock_client
+
+    result = await nlp_service.parse_batch(["что сегодня", "что завтра"])
+
+    assert [c.intent for c in result] == [Intent.GET_TODAY, Intent.GET_TOMORROW]
+    assert result[1].original_text == "что завтра"
+    mock_client.chat.completions.create.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_parse_batch_missing_item(nlp_service):
+    """Test batch response without every item raises ValueError"""
+    mock_client = AsyncMock()
+    mock_response = Mock()
+    mock_response.choices = [Mock()]
+    mock_response.choices[0].message.content = '[{"id": 0, "intent": "get_today", "params": {}}]'
+    mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+    nlp_service.client = mock_client
+
+    with pytest.raises(ValueError, match="Malformed batch response"):
+        await nlp_service.parse_batch(["что сегодня", "что завтра"])
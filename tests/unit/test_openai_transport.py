@@ -0,0 +1,60 @@
+"""Unit tests for shared OpenAI transport"""
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, patch
+from src.services.openai_transport import OpenAITransport
+from src.services.voice.stt_service import STTService
+from src.services.nlp.nlp_service import NLPService
+
+
+@pytest.mark.asyncio
+async def test_transport_pool_configuration():
+    """Test connection pool limits are applied"""
+    transport = OpenAITransport(api_key="test_key", max_connections=7, keepalive_ping_interval=0)
+
+    pool = transport.http_client._transport._pool
+    assert pool._max_connections == 7
+    assert transport.client._client is transport.http_client
+
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_http2_falls_back_without_h2():
+    """Test HTTP/2 is disabled when h2 is not installed"""
+    with patch('src.services.openai_transport.HTTP2_AVAILABLE', False):
+        transport = OpenAITransport(api_key="test_key", http2=True, keepalive_ping_interval=0)
+
+    assert transport.http2 is False
+    await transport.close()
+
+
+@pytest.mark.asyncio
+async def test_keepalive_ping_started_and_stopped():
+    """Test keep-alive ping loop pings until closed"""
+    transport = OpenAITransport(api_key="test_key", keepalive_ping_interval=0.01)
+    transport.http_client.head = AsyncMock()
+
+    transport.start()
+    await asyncio.sleep(0.05)
+    await transport.close()
+
+    assert transport.http_client.head.call_count >= 1
+    assert transport._ping_task is None
+
+
+@pytest.mark.asyncio
+async def test_services_share_client_without_closing_it():
+    """Test services using shared client leave closing to transport"""
+    transport = OpenAITransport(api_key="test_key", keepalive_ping_interval=0)
+    stt = STTService(api_key="test_key", client=transport.client)
+    nlp = NLPService(api_key="test_key", client=transport.client)
+
+    assert stt.client is nlp.client
+
+    await stt.close()
+    await nlp.close()
+    assert not transport.http_client.is_closed
+
+    await transport.close()
+    assert transport.http_client.is_closed
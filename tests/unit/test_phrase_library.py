@@ -0,0 +1,164 @@
+"""Unit tests for phrase fragment library"""
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+from src.bot.reply_policy import summarize_events
+from src.bot.rendering import render_events
+from src.services.calendar.models import Event
+from src.services.voice.tts_cache import TTSCache
+from src.services.voice.phrase_library import (
+    FRAGMENT,
+    TEXT,
+    PhraseLibrary,
+    events_word,
+    fragment_texts,
+    number_words,
+)
+
+
+async def _join(parts, encoder=None):
+    return b"|".join(parts)
+
+
+@pytest.fixture
+def library():
+    """PhraseLibrary over a TTS mock returning the text as audio"""
+    tts = AsyncMock()
+    tts.synthesize.side_effect = lambda text, **kwargs: text.encode()
+    tts.voice_encoder = None
+    tts.cache = None
+    stitcher = AsyncMock()
+    stitcher.concatenate.side_effect = _join
+    return PhraseLibrary(tts, stitcher)
+
+
+def test_number_words_and_plurals():
+    """Test Russian numerals and plural agreement"""
+    assert number_words(0) == "ноль"
+    assert number_words(15) == "пятнадцать"
+    assert number_words(40) == "сорок"
+    assert number_words(42) == "сорок два"
+    assert [events_word(n) for n in (1, 3, 5, 11, 21, 22)] == [
+        "событие", "события", "событий", "событий", "событие", "события"
+    ]
+
+
+def test_plan_agenda_uses_fragments_for_template_parts(library):
+    """Test only event titles are free text"""
+    reply = "У вас 2 события на сегодня:\n\n1. Стендап\n   Время: 10:05 - 11:00\n\n2. Обед\n   Время: 13:30 - 14:00"
+
+    parts = library.plan(reply)
+
+    assert [value for kind, value in parts if kind == TEXT] == ["Стендап", "Обед"]
+    assert parts[:4] == [(FRAGMENT, "У вас"), (FRAGMENT, "два"), (FRAGMENT, "события"), (FRAGMENT, "на сегодня")]
+    assert parts[6:13] == [
+        (FRAGMENT, "с"), (FRAGMENT, "десять"), (FRAGMENT, "ноль"), (FRAGMENT, "пять"),
+        (FRAGMENT, "до"), (FRAGMENT, "одиннадцать"), (FRAGMENT, "ноль-ноль"),
+    ]
+
+
+def test_plan_unknown_text_is_single_segment(library):
+    """Test unmatched lines are merged into one free-text request"""
+    assert library.plan("Встреча «Ревью» создана.\nДо встречи!") == [
+        (TEXT, "Встреча «Ревью» создана. До встречи!")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_warm_up_renders_each_fragment_once(library):
+    """Test fragments are rendered once and reused"""
+    await library.warm_up()
+    await library.warm_up()
+
+    assert library.tts_service.synthesize.call_count == len(fragment_texts())
+    assert library.fragment_count == len(fragment_texts())
+
+
+@pytest.mark.asyncio
+async def test_warm_library_calls_tts_only_for_titles(library):
+    """Test agenda reply after warm-up synthesizes titles only"""
+    await library.warm_up()
+    library.tts_service.synthesize.reset_mock()
+
+    audio = await library.synthesize("У вас 1 событие на завтра:\n\n1. Ревью\n   Время: 16:00 - 17:00")
+
+    library.tts_service.synthesize.assert_called_once_with("Ревью", raw=True)
+    assert audio.decode().split("|") == [
+        "У вас", "один", "событие", "на завтра", "один", "Ревью",
+        "с", "шестнадцать", "ноль-ноль", "до", "семнадцать", "ноль-ноль",
+    ]
+    assert library.stats.fragment_misses == 0
+
+    await library.synthesize("У вас нет событий на сегодня. Вы свободны!")
+    library.tts_service.synthesize.assert_called_once()
+
+
+def _events(count):
+    start = datetime(2026, 10, 19, 9, 0)
+    return [
+        Event(
+            id=str(i),
+            title=f"Встреча {i + 1}",
+            start=start + timedelta(hours=i),
+            end=start + timedelta(hours=i, minutes=30),
+            attendees=[],
+            source="yandex",
+            raw_data={},
+        )
+        for i in range(count)
+    ]
+
+
+def test_plan_matches_rendered_replies(library):
+    """Test headers and summaries the bot produces are all templates"""
+    for text in (
+        render_events(_events(1), "на сегодня"),
+        render_events(_events(3), "на завтра"),
+        summarize_events(_events(1), "на завтра"),
+        summarize_events(_events(5), "на сегодня"),
+    ):
+        titles = [value for kind, value in library.plan(text) if kind == TEXT]
+        assert all(title.startswith("Встреча") for title in titles), text
+
+
+def test_plan_summary(library):
+    """Test spoken summary keeps only event titles as free text"""
+    parts = library.plan(summarize_events(_events(5), "на сегодня"))
+
+    assert parts == [
+        (FRAGMENT, "У вас"), (FRAGMENT, "пять"), (FRAGMENT, "событий"), (FRAGMENT, "на сегодня"),
+        (FRAGMENT, "Первое —"), (TEXT, "Встреча 1"), (FRAGMENT, "в"), (FRAGMENT, "девять"), (FRAGMENT, "ноль-ноль"),
+        (FRAGMENT, "последнее —"), (TEXT, "Встреча 5"), (FRAGMENT, "в"),
+        (FRAGMENT, "тринадцать"), (FRAGMENT, "ноль-ноль"),
+        (FRAGMENT, "Полный список — в сообщении."),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_single_fragment_is_not_stitched(library):
+    """Test a fixed reply is encoded directly without the stitcher"""
+    library.tts_service.voice_encoder = AsyncMock()
+    library.tts_service.voice_encoder.encode.side_effect = lambda audio: b"ogg:" + audio
+
+    audio = await library.synthesize("Эта команда пока не поддерживается.")
+
+    assert audio == "ogg:Эта команда пока не поддерживается.".encode()
+    library.stitcher.concatenate.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_assembled_reply_is_cached(library):
+    """Test a repeated reply is served from the TTS cache without rendering"""
+    library.tts_service.cache = TTSCache()
+    library.tts_service.voice_id = "voice"
+    library.tts_service.output_format = "mp3_44100_128"
+    reply = "У вас 1 событие на завтра:\n\n1. Ревью\n   Время: 16:00 - 17:00"
+
+    first = await library.synthesize(reply)
+    library.tts_service.synthesize.reset_mock()
+    library.stitcher.concatenate.reset_mock()
+
+    assert await library.synthesize(reply) == first
+    library.tts_service.synthesize.assert_not_called()
+    library.stitcher.concatenate.assert_not_called()
+    assert library.stats.replies == 2
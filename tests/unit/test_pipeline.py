@@ -0,0 +1,160 @@
+"""Unit tests for staged pipeline executor"""
+import pytest
+import asyncio
+from src.bot.pipeline import Stage, StagedPipeline
+
+
+class _Job:
+    def __init__(self, name: str):
+        self.name = name
+        self.trace = []
+
+
+def _append(label: str):
+    async def handler(job):
+        job.trace.append(label)
+    return handler
+
+
+@pytest.fixture
+async def started():
+    """Start pipelines created in a test and stop them afterwards"""
+    pipelines = []
+
+    async def start(stages):
+        pipeline = StagedPipeline(stages)
+        await pipeline.start()
+        pipelines.append(pipeline)
+        return pipeline
+
+    yield start
+    for pipeline in pipelines:
+        await pipeline.stop()
+
+
+@pytest.mark.asyncio
+async def test_job_passes_stages_in_order(started):
+    """Test job visits every stage in order and is returned"""
+    pipeline = await started([Stage("a", _append("a")), Stage("b", _append("b")), Stage("c", _append("c"))])
+
+    job = await pipeline.run(_Job("one"))
+
+    assert job.trace == ["a", "b", "c"]
+    assert [stage.stats.processed for stage in pipeline.stages] == [1, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_stage_concurrency_limited_by_workers(started):
+    """Test a stage never runs more jobs than it has workers"""
+    active = 0
+    peak = 0
+
+    async def slow(job):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    pipeline = await started([Stage("fast", _append("fast"), workers=4), Stage("slow", slow, workers=2)])
+
+    await asyncio.gather(*(pipeline.run(_Job(str(i))) for i in range(6)))
+
+    assert peak == 2
+    assert pipeline.stages[1].stats.processed == 6
+
+
+@pytest.mark.asyncio
+async def test_slow_stage_throttles_intake(started):
+    """Test a stalled stage blocks upstream stages once its queue is full"""
+    release = asyncio.Event()
+
+    async def stalled(job):
+        await release.wait()
+
+    pipeline = await started([
+        Stage("intake", _append("intake"), queue_size=1),
+        Stage("stalled", stalled, queue_size=1),
+    ])
+    intake, stalled_stage = pipeline.stages
+
+    runs = [asyncio.create_task(pipeline.run(_Job(str(i)))) for i in range(10)]
+    await asyncio.sleep(0.01)
+
+    # One job in the stalled handler, one in its queue, one waiting to be put
+    assert intake.stats.processed == 3
+    assert intake.queue.qsize() == 1
+    assert stalled_stage.queue.qsize() == 1
+
+    release.set()
+    await asyncio.gather(*runs)
+
+    assert stalled_stage.stats.processed == 10
+    assert stalled_stage.stats.backpressure_seconds > 0
+    assert intake.stats.backpressure_seconds > 0
+    assert stalled_stage.stats.peak_queue == 1
+
+
+@pytest.mark.asyncio
+async def test_failing_stage_fails_job(started):
+    """Test stage exception is raised by run() and later stages are skipped"""
+    async def fail(job):
+        raise ValueError("STT failed")
+
+    pipeline = await started([Stage("stt", fail), Stage("send", _append("send"))])
+    job = _Job("one")
+
+    with pytest.raises(ValueError, match="STT failed"):
+        await pipeline.run(job)
+
+    assert job.trace == []
+    assert pipeline.stages[0].stats.failed == 1
+    assert pipeline.stages[1].stats.processed == 0
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_queued_jobs():
+    """Test jobs still queued when the pipeline stops are cancelled"""
+    async def hang(job):
+        await asyncio.sleep(10)
+
+    pipeline = StagedPipeline([Stage("hang", hang, queue_size=4)])
+    await pipeline.start()
+    runs = [asyncio.create_task(pipeline.run(_Job(str(i)))) for i in range(3)]
+    await asyncio.sleep(0.01)
+
+    await pipeline.stop()
+    results = await asyncio.gather(*runs, return_exceptions=True)
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    assert not pipeline.running
+
+
+@pytest.mark.asyncio
+async def test_run_requires_start():
+    """Test run() on a stopped pipeline raises RuntimeError"""
+    pipeline = StagedPipeline([Stage("a", _append("a"))])
+
+    with pytest.raises(RuntimeError):
+        await pipeline.run(_Job("one"))
+
+
+def test_utilization_and_throughput():
+    """Test utilization is busy time over worker time"""
+    stage = Stage("tts", _append("tts"), workers=2)
+    stage.stats.processed = 10
+    stage.stats.busy_seconds = 5.0
+
+    assert stage.throughput(elapsed=5.0) == 2.0
+    assert stage.utilization(elapsed=5.0) == 0.5
+    assert stage.utilization(elapsed=0.0) == 0.0
+
+
+def test_invalid_stage_rejected():
+    """Test non-positive worker count or queue size raises ValueError"""
+    with pytest.raises(ValueError):
+        Stage("a", _append("a"), workers=0)
+    with pytest.raises(ValueError):
+        Stage("a", _append("a"), queue_size=0)
+    with pytest.raises(ValueError):
+        StagedPipeline([])
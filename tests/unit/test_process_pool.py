@@ -0,0 +1,50 @@
+"""Unit tests for shared audio worker pool"""
+import pytest
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.services.voice.process_pool import ProcessPool
+
+
+def _scale(value: int, factor: int = 1) -> int:
+    return value * factor
+
+
+@pytest.mark.asyncio
+async def test_run_in_worker_process():
+    """Test function runs in the lazily started process pool"""
+    pool = ProcessPool(max_workers=1)
+
+    assert await pool.run(_scale, 3, factor=2) == 6
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_custom_executor_left_to_owner():
+    """Test closing the pool does not shut down a custom executor"""
+    executor = ThreadPoolExecutor(1)
+    pool = ProcessPool(executor=executor)
+
+    await pool.close()
+
+    assert await pool.run(_scale, 4) == 4
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_job_counts_as_busy_until_it_finishes():
+    """Test a worker stays busy after its caller is cancelled"""
+    release = threading.Event()
+    executor = ThreadPoolExecutor(1)
+    pool = ProcessPool(executor=executor)
+
+    task = asyncio.create_task(pool.run(release.wait))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert pool.busy == 1
+    release.set()
+    executor.shutdown(wait=True)
+    assert pool.busy == 0
@@ -0,0 +1,89 @@
+"""Unit tests for in-place progress message"""
+import pytest
+import asyncio
+from unittest.mock import AsyncMock, Mock
+from src.bot.progress import ProgressMessage
+
+
+def _message(send_delay: float = 0.0):
+    """User message whose reply_text returns an editable status message"""
+    status = Mock()
+    status.edit_text = AsyncMock()
+    status.delete = AsyncMock()
+
+    async def reply_text(text):
+        await asyncio.sleep(send_delay)
+        return status
+
+    message = Mock()
+    message.reply_text = AsyncMock(side_effect=reply_text)
+    return message, status
+
+
+@pytest.mark.asyncio
+async def test_status_sent_while_work_runs():
+    """Test sending the status does not delay the work"""
+    message, status = _message(send_delay=0.05)
+    progress = ProgressMessage(message)
+
+    progress.start("🎤 Распознаю...")
+    await asyncio.sleep(0)
+
+    # The status round trip is still in flight while the caller continues
+    assert message.reply_text.await_count == 1
+    assert progress.stats.sent == 0
+
+    await progress.finish()
+    assert progress.stats.sent == 1
+    status.delete.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_updates_coalesced_into_latest_text():
+    """Test updates issued during the send produce one edit with the last text"""
+    message, status = _message(send_delay=0.02)
+    progress = ProgressMessage(message)
+
+    progress.start("🎤 Распознаю...")
+    await asyncio.sleep(0)
+    progress.update("📅 Проверяю календарь...")
+    progress.update("🔊 Генерирую ответ...")
+    await asyncio.sleep(0.05)
+
+    status.edit_text.assert_awaited_once_with("🔊 Генерирую ответ...")
+    message.reply_text.assert_awaited_once()
+
+    await progress.finish()
+    assert progress.stats.edited == 1
+    assert progress.stats.deleted == 1
+
+
+@pytest.mark.asyncio
+async def test_status_skipped_when_answer_is_ready_first():
+    """Test nothing is sent if work finishes before the status send starts"""
+    message, status = _message()
+    progress = ProgressMessage(message)
+
+    progress.start("🎤 Распознаю...")
+    progress.update("🔊 Генерирую ответ...")
+    await progress.finish()
+
+    message.reply_text.assert_not_called()
+    status.delete.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_telegram_errors_do_not_propagate():
+    """Test failed edits and deletes are counted, not raised"""
+    message, status = _message()
+    status.edit_text.side_effect = Exception("message is not modified")
+    status.delete.side_effect = Exception("message can't be deleted")
+    progress = ProgressMessage(message)
+
+    progress.start("🎤 Распознаю...")
+    await asyncio.sleep(0.01)
+    progress.update("🔊 Генерирую ответ...")
+    await asyncio.sleep(0.01)
+    await progress.finish()
+
+    assert progress.stats.failed == 2
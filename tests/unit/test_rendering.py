@@ -0,0 +1,119 @@
+"""Unit tests for paged event list rendering"""
+import re
+from datetime import datetime, timedelta
+from src.bot.rendering import (
+    TELEGRAM_MESSAGE_LIMIT,
+    PageStore,
+    event_blocks,
+    first_page,
+    format_event,
+    paginate,
+    render_events,
+)
+from src.services.calendar.models import Event
+
+
+def _events(count: int, title: str = "Встреча") -> list:
+    start = datetime(2024, 1, 15, 9, 0)
+    return [
+        Event(
+            id=str(i), title=f"{title} {i}",
+            start=start + timedelta(minutes=i), end=start + timedelta(minutes=i + 30),
+            attendees=["a@example.com"], source="yandex", raw_data={}, location="Офис"
+        )
+        for i in range(count)
+    ]
+
+
+def test_render_matches_reply_format():
+    """Test rendered list keeps header, blank line between events and details"""
+    text = render_events(_events(2), "на сегодня")
+
+    assert text == (
+        "У вас 2 события на сегодня:\n\n"
+        "1. Встреча 0\n   Время: 09:00 - 09:30\n   Участники: 1\n   Место: Офис\n\n"
+        "2. Встреча 1\n   Время: 09:01 - 09:31\n   Участники: 1\n   Место: Офис"
+    )
+
+
+def test_empty_list():
+    """Test empty list renders the free-time message"""
+    assert render_events([], "на завтра") == "У вас нет событий на завтра. Вы свободны!"
+
+
+def test_pages_split_on_event_boundaries():
+    """Test 1000 events are split into pages under the limit without cutting events"""
+    events = _events(1000)
+    blocks = list(event_blocks(events, "на сегодня"))
+
+    pages = list(paginate(iter(blocks)))
+
+    assert len(pages) > 1
+    assert all(len(page) <= TELEGRAM_MESSAGE_LIMIT for page in pages)
+    assert "\n\n".join(pages) == render_events(events, "на сегодня")
+    assert all(re.match(r"\d+\. Встреча \d+\n", page) for page in pages[1:])
+
+
+def test_oversized_block_truncated():
+    """Test a single block above the limit is cut with an ellipsis"""
+    pages = list(paginate(["x" * 50, "y" * 200], limit=100))
+
+    assert pages == ["x" * 50, "y" * 99 + "…"]
+
+
+def test_pages_rendered_lazily():
+    """Test only events of requested pages are rendered"""
+    rendered = []
+
+    def blocks():
+        for i in range(1000):
+            rendered.append(i)
+            yield f"{i}. " + "event " * 20
+
+    pages = paginate(blocks(), limit=500)
+    next(pages)
+
+    assert len(rendered) < 10
+
+
+def test_page_store_serves_remaining_pages():
+    """Test continuation pages are taken in order until exhausted"""
+    store = PageStore()
+    page, token = first_page(["a" * 60, "b" * 60, "c" * 60], store, limit=100)
+
+    assert page == "a" * 60
+    assert store.take(token) == ("b" * 60, True)
+    assert store.take(token) == ("c" * 60, False)
+    assert store.take(token) is None
+    assert store.stats.continuations == 2
+    assert store.stats.expired == 1
+
+
+def test_short_reply_not_stored():
+    """Test reply fitting one page does not create a continuation"""
+    store = PageStore()
+
+    page, token = first_page(["short"], store)
+
+    assert (page, token) == ("short", None)
+    assert len(store) == 0
+
+
+def test_page_store_drops_oldest():
+    """Test store keeps at most max_entries replies"""
+    store = PageStore(max_entries=2)
+    tokens = [store.add(f"page {i}", iter([])) for i in range(3)]
+
+    assert store.take(tokens[0]) is None
+    assert store.take(tokens[2]) == ("page 2", False)
+
+
+def test_format_event_without_optional_fields():
+    """Test attendees and location lines are omitted when empty"""
+    event = Event(
+        id="1", title="Созвон",
+        start=datetime(2024, 1, 15, 10, 0), end=datetime(2024, 1, 15, 10, 30),
+        attendees=[], source="google", raw_data={}
+    )
+
+    assert format_event(3, event) == "3. Созвон\n   Время: 10:00 - 10:30"
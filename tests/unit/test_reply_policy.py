@@ -0,0 +1,99 @@
+"""Unit tests for reply modality policy"""
+import pytest
+from datetime import datetime, timedelta
+from src.bot.reply_policy import ReplyMode, ReplyPolicy, summarize_events
+from src.services.calendar.models import Event
+
+
+def _events(count: int):
+    start = datetime(2024, 1, 15, 9, 0)
+    return [
+        Event(
+            id=str(i), title=f"Встреча {i}",
+            start=start + timedelta(hours=i), end=start + timedelta(hours=i, minutes=30),
+            attendees=[], source="yandex", raw_data={}
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def test_summary_is_deterministic():
+    """Test summary names count, first and last event"""
+    summary = summarize_events(_events(5), "на сегодня")
+
+    assert summary == (
+        "У вас 5 событий на сегодня. Первое — «Встреча 1» в 10:00, "
+        "последнее — «Встреча 5» в 14:00. Полный список — в сообщении."
+    )
+    assert summarize_events(_events(5), "на сегодня") == summary
+
+
+def test_summary_agrees_with_count():
+    """Test plural forms and single event summary"""
+    assert summarize_events(_events(2)).startswith("У вас 2 события.")
+    assert summarize_events(_events(1), "на завтра") == "У вас 1 событие на завтра: «Встреча 1» в 10:00."
+
+
+def test_short_reply_spoken_in_full():
+    """Test short agenda is read out"""
+    policy = ReplyPolicy(max_voice_events=3)
+
+    decision = policy.decide(1, "У вас 2 событий на сегодня: ...", _events(2), "на сегодня")
+
+    assert decision.mode == ReplyMode.VOICE
+    assert decision.spoken_text == "У вас 2 событий на сегодня: ..."
+    assert not decision.sends_text
+
+
+def test_long_agenda_summarized():
+    """Test many events give spoken summary plus text list"""
+    policy = ReplyPolicy(max_voice_events=3)
+
+    decision = policy.decide(1, "список", _events(6), "на сегодня")
+
+    assert decision.mode == ReplyMode.SUMMARY_VOICE
+    assert decision.spoken_text.startswith("У вас 6 событий на сегодня.")
+    assert decision.sends_text
+    assert policy.stats.summary == 1
+
+
+def test_long_text_without_events_sent_as_text():
+    """Test long reply that cannot be summarized goes out as text"""
+    policy = ReplyPolicy(max_voice_chars=100)
+
+    assert policy.decide(1, "а" * 101).mode == ReplyMode.TEXT
+
+
+@pytest.mark.asyncio
+async def test_load_degrades_to_summary_then_text():
+    """Test TTS queue depth downgrades reply mode"""
+    policy = ReplyPolicy(summary_queue_depth=1, text_queue_depth=2)
+    events = _events(2)
+
+    async with policy.synthesis():
+        assert policy.decide(1, "коротко", events).mode == ReplyMode.SUMMARY_VOICE
+        assert policy.decide(1, "коротко").mode == ReplyMode.VOICE
+
+        async with policy.synthesis():
+            assert policy.active_syntheses == 2
+            assert policy.decide(1, "коротко", events).mode == ReplyMode.TEXT
+
+    assert policy.active_syntheses == 0
+    assert policy.stats.load_downgrades == 2
+
+
+def test_user_preference_overrides_rules():
+    """Test stored preference wins over size rules and can be reset"""
+    policy = ReplyPolicy(max_voice_events=3)
+    events = _events(6)
+
+    policy.set_preference(1, ReplyMode.VOICE)
+    assert policy.decide(1, "список", events).mode == ReplyMode.VOICE
+    assert policy.decide(2, "список", events).mode == ReplyMode.SUMMARY_VOICE
+
+    policy.set_preference(1, ReplyMode.TEXT)
+    assert policy.decide(1, "коротко").mode == ReplyMode.TEXT
+
+    policy.set_preference(1, None)
+    assert policy.get_preference(1) is None
+    assert policy.decide(1, "коротко").mode == ReplyMode.VOICE
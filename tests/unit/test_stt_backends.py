@@ -0,0 +1,115 @@
+"""Unit tests for STT backends and routing"""
+import pytest
+import asyncio
+import hashlib
+from unittest.mock import Mock, AsyncMock, patch
+from src.services.voice.stt_backends import (
+    STTRouter,
+    StubSTTBackend,
+    LocalWhisperBackend,
+    WhisperAPIBackend,
+    available_backends,
+    create_backend,
+)
+from src.services.voice.stt_service import STTService
+
+
+class _LocalStub(StubSTTBackend):
+    """Stub with a distinct name and bounded capacity"""
+    name = "local"
+    capacity = 1
+
+
+def test_registry_contains_builtin_backends():
+    """Test built-in backends are registered"""
+    assert {"whisper_api", "local", "stub"} <= set(available_backends())
+    assert isinstance(create_backend("stub", text="привет"), StubSTTBackend)
+
+    with pytest.raises(ValueError, match="Unknown STT backend"):
+        create_backend("missing")
+
+
+def test_local_backend_requires_faster_whisper():
+    """Test local backend fails clearly without faster-whisper"""
+    with patch("src.services.voice.stt_backends.FASTER_WHISPER_AVAILABLE", False):
+        with pytest.raises(RuntimeError, match="faster-whisper"):
+            LocalWhisperBackend()
+
+
+@pytest.mark.asyncio
+async def test_stub_backend_is_deterministic():
+    """Test stub returns registered text per audio hash"""
+    backend = StubSTTBackend(text="по умолчанию", responses={hashlib.sha256(b"a").hexdigest(): "известно"})
+
+    assert await backend.transcribe(b"a") == "известно"
+    assert await backend.transcribe(memoryview(b"b")) == "по умолчанию"
+    assert backend.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_stt_service_uses_backend():
+    """Test STTService delegates to given backend without network"""
+    service = STTService(api_key="test", backend=StubSTTBackend(text="что завтра"))
+
+    assert await service.transcribe_bytes(b"audio", "voice.ogg", language="ru") == "что завтра"
+    assert service.client is None
+
+
+@pytest.mark.asyncio
+async def test_whisper_api_backend_passes_language():
+    """Test Whisper API backend sends model and language"""
+    client = AsyncMock()
+    client.audio.transcriptions.create = AsyncMock(return_value=Mock(text="привет"))
+    backend = WhisperAPIBackend(client=client, model="whisper-1")
+
+    assert await backend.transcribe(memoryview(b"audio"), "voice.ogg", language="ru") == "привет"
+    kwargs = client.audio.transcriptions.create.call_args[1]
+    assert kwargs["model"] == "whisper-1"
+    assert kwargs["language"] == "ru"
+    assert kwargs["file"].name == "voice.ogg"
+
+
+def test_router_prefers_default_when_idle():
+    """Test short audio stays on default backend while it is not backed up"""
+    router = STTRouter(default=StubSTTBackend(), local=_LocalStub(), queue_depth_threshold=2)
+
+    assert router.select(3.0) is router.default
+    assert router.select(None) is router.default
+
+
+@pytest.mark.asyncio
+async def test_router_offloads_short_audio_under_load():
+    """Test short audio goes local while default backend is backed up"""
+    default = StubSTTBackend(text="api", latency_ms=50)
+    local = _LocalStub(text="local")
+    router = STTRouter(default=default, local=local, local_max_duration=10.0, queue_depth_threshold=1)
+
+    slow = asyncio.create_task(router.transcribe(b"1", duration=30.0))
+    await asyncio.sleep(0)
+
+    assert router.select(30.0) is default
+    assert await router.transcribe(b"2", duration=3.0) == "local"
+    assert await slow == "api"
+    assert router.stats.routed == {"stub": 1, "local": 1}
+
+
+def test_router_respects_local_capacity():
+    """Test busy local backend is not overloaded"""
+    router = STTRouter(default=StubSTTBackend(), local=_LocalStub(), queue_depth_threshold=0)
+    assert router.select(3.0) is router.local
+
+    router._in_flight["local"] = 1
+    assert router.select(3.0) is router.default
+
+
+@pytest.mark.asyncio
+async def test_router_counts_abandoned_local_jobs():
+    """Test a cancelled local request keeps its worker slot until the job ends"""
+    local = LocalWhisperBackend(pool=Mock(max_workers=1, busy=1))
+    router = STTRouter(default=StubSTTBackend(), local=local, queue_depth_threshold=0)
+
+    assert router.queue_depth(local) == 1
+    assert router.select(3.0) is router.default
+
+    local.pool.busy = 0
+    assert router.select(3.0) is local
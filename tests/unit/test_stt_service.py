@@ -4,6 +4,7 @@ import io
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from pathlib import Path
 from src.services.voice.stt_service import STTService
+from src.services.voice.transcription_cache import TranscriptionCache
 
 
 @pytest.fixture
@@ -121,3 +122,18 @@ def test_stt_service_custom_model():
     """Test STTService with custom model"""
     service = STTService(api_key="test_key", model="custom-whisper")
     assert service.model == "custom-whisper"
+
+
+@pytest.mark.asyncio
+async def test_transcribe_file_uses_bytes_path(tmp_path):
+    """Test a file spilled to disk is cached and chunked like in-memory audio"""
+    audio_path = tmp_path / "voice.ogg"
+    audio_path.write_bytes(b"large voice")
+    backend = AsyncMock()
+    backend.transcribe.return_value = "созвон завтра"
+    service = STTService(api_key="test", backend=backend, cache=TranscriptionCache())
+
+    assert await service.transcribe(str(audio_path), language="ru", file_unique_id="uniq", duration=5) == "созвон завтра"
+
+    backend.transcribe.assert_awaited_once_with(b"large voice", "voice.ogg", "ru", 5)
+    assert await service.get_cached_transcription("uniq", language="ru") == "созвон завтра"
@@ -0,0 +1,132 @@
+"""Unit tests for transcription cache"""
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+from src.services.voice.stt_service import STTService
+from src.services.voice.transcription_cache import TranscriptionCache
+
+
+@pytest.mark.asyncio
+async def test_get_returns_stored_text():
+    """Test stored transcription is returned"""
+    cache = TranscriptionCache()
+    await cache.set("key", "привет")
+
+    assert await cache.get("key") == "привет"
+    assert await cache.get("other") is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction():
+    """Test least recently used entry is evicted"""
+    cache = TranscriptionCache(max_entries=2)
+    await cache.set("a", "1")
+    await cache.set("b", "2")
+    await cache.get("a")
+    await cache.set("c", "3")
+
+    assert await cache.get("a") == "1"
+    assert await cache.get("b") is None
+    assert await cache.get("c") == "3"
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_not_returned():
+    """Test entries expire after TTL"""
+    cache = TranscriptionCache(ttl_seconds=10)
+
+    with patch("src.services.voice.transcription_cache.time.time", return_value=1000.0):
+        await cache.set("key", "текст")
+    with patch("src.services.voice.transcription_cache.time.time", return_value=1011.0):
+        assert await cache.get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_survives_restart(tmp_path):
+    """Test entries are read back from disk by a new cache instance"""
+    await TranscriptionCache(disk_dir=str(tmp_path)).set("key", "встреча завтра")
+
+    cache = TranscriptionCache(disk_dir=str(tmp_path))
+    assert cache.disk_entries == 1
+    assert await cache.get("key") == "встреча завтра"
+    assert cache.stats.disk_hits == 1
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_bounded(tmp_path):
+    """Test least recently used files are removed beyond max_disk_entries"""
+    cache = TranscriptionCache(max_entries=1, disk_dir=str(tmp_path), max_disk_entries=2)
+    await cache.set("a", "1")
+    await cache.set("b", "2")
+    await cache.get("a")
+    await cache.set("c", "3")
+
+    assert len(list(tmp_path.glob("*.json"))) == 2
+    restarted = TranscriptionCache(disk_dir=str(tmp_path))
+    assert await restarted.get("a") == "1"
+    assert await restarted.get("b") is None
+    assert await restarted.get("c") == "3"
+
+
+@pytest.mark.asyncio
+async def test_expired_and_partial_files_removed_at_start(tmp_path):
+    """Test files past their TTL and interrupted writes are cleaned up on start"""
+    await TranscriptionCache(disk_dir=str(tmp_path)).set("key", "текст")
+    (tmp_path / "leftover.tmp").write_text("{")
+
+    cache = TranscriptionCache(disk_dir=str(tmp_path), ttl_seconds=0)
+
+    assert cache.disk_entries == 0
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.asyncio
+async def test_corrupt_disk_entry_treated_as_miss(tmp_path):
+    """Test valid JSON without expected fields is a miss and is removed"""
+    cache = TranscriptionCache(disk_dir=str(tmp_path))
+    await cache.set("key", "текст")
+    path = next(tmp_path.glob("*.json"))
+    path.write_text('{"text": "текст"}')
+
+    fresh = TranscriptionCache(disk_dir=str(tmp_path))
+    assert await fresh.get("key") is None
+    assert not path.exists()
+
+
+@pytest.mark.asyncio
+async def test_failed_disk_write_leaves_no_temp_file(tmp_path):
+    """Test temporary file is removed when writing fails"""
+    cache = TranscriptionCache(disk_dir=str(tmp_path))
+
+    with patch("src.services.voice.transcription_cache.json.dump", side_effect=OSError("disk full")):
+        await cache.set("key", "текст")
+
+    assert not list(tmp_path.iterdir())
+    assert cache.disk_entries == 0
+    assert await cache.get("key") == "текст"
+
+
+def test_content_key_accepts_memoryview():
+    """Test content hash is equal for bytes and buffer views"""
+    data = bytearray(b"audio")
+    assert TranscriptionCache.content_key(memoryview(data)) == TranscriptionCache.content_key(b"audio")
+
+
+@pytest.mark.asyncio
+async def test_stt_service_uses_cache():
+    """Test repeated audio is transcribed only once"""
+    mock_client = AsyncMock()
+    mock_client.audio.transcriptions.create = AsyncMock(return_value=Mock(text="что сегодня"))
+    service = STTService(api_key="test", client=mock_client, cache=TranscriptionCache())
+
+    first = await service.transcribe_bytes(b"audio", "voice.ogg", language="ru", file_unique_id="u1")
+    # Same audio forwarded: new file_unique_id is unknown, content hash hits
+    second = await service.transcribe_bytes(b"audio", "voice.ogg", language="ru", file_unique_id="u2")
+
+    assert first == second == "что сегодня"
+    mock_client.audio.transcriptions.create.assert_called_once()
+    assert await service.get_cached_transcription("u1", language="ru") == "что сегодня"
+    assert await service.get_cached_transcription("u2", language="ru") == "что сегодня"
+    assert await service.get_cached_transcription("u1", language="en") is None
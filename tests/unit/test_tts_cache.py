@@ -0,0 +1,76 @@
+"""Unit tests for TTS audio cache"""
+import pytest
+from unittest.mock import AsyncMock, Mock
+from src.services.voice.tts_cache import TTSCache
+from src.services.voice.tts_service import TTSService
+
+
+def test_key_depends_on_all_parts():
+    """Test key changes with text, voice, model and format"""
+    base = TTSCache.make_key("Привет", "voice", "model", "mp3")
+
+    assert base == TTSCache.make_key("Привет", "voice", "model", "mp3")
+    assert base != TTSCache.make_key("Привет!", "voice", "model", "mp3")
+    assert base != TTSCache.make_key("Привет", "other", "model", "mp3")
+    assert base != TTSCache.make_key("Привет", "voice", "other", "mp3")
+    assert base != TTSCache.make_key("Привет", "voice", "model", "opus")
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_bounded_by_bytes():
+    """Test least recently used audio is evicted over the byte bound"""
+    cache = TTSCache(max_memory_bytes=10)
+    await cache.set("a", b"12345")
+    await cache.set("b", b"12345")
+    await cache.get("a")
+    await cache.set("c", b"12345")
+
+    assert await cache.get("a") == b"12345"
+    assert await cache.get("b") is None
+    assert cache.memory_bytes == 10
+
+
+@pytest.mark.asyncio
+async def test_disk_tier_persists_and_is_bounded(tmp_path):
+    """Test disk entries survive restart and old files are evicted"""
+    cache = TTSCache(max_memory_bytes=0, disk_dir=str(tmp_path), max_disk_bytes=8)
+    await cache.set("a", b"aaaa", synthesis_seconds=1.5)
+    await cache.set("b", b"bbbb")
+    await cache.set("c", b"cccc")
+
+    assert sorted(f.name for f in tmp_path.iterdir()) == ["b.audio", "c.audio"]
+    assert cache.disk_bytes == 8
+
+    restarted = TTSCache(disk_dir=str(tmp_path), max_disk_bytes=8)
+    assert await restarted.get("c") == b"cccc"
+    assert restarted.stats.disk_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_unwritable_disk_dir_disables_disk_tier(tmp_path):
+    """Test cache falls back to memory when directory cannot be created"""
+    blocker = tmp_path / "file"
+    blocker.write_bytes(b"")
+
+    cache = TTSCache(disk_dir=str(blocker / "cache"))
+    await cache.set("a", b"audio")
+
+    assert cache.disk_dir is None
+    assert await cache.get("a") == b"audio"
+
+
+@pytest.mark.asyncio
+async def test_tts_service_reports_saved_seconds():
+    """Test repeated reply is synthesized once and hits are reported"""
+    cache = TTSCache()
+    service = TTSService(api_key="test", voice_id="voice", cache=cache)
+    service.client = Mock()
+    service.client.synthesize = AsyncMock(return_value=b"audio")
+
+    for _ in range(3):
+        assert await service.synthesize("У вас нет событий на сегодня. Вы свободны!") == b"audio"
+
+    service.client.synthesize.assert_called_once()
+    assert cache.stats.hits == 2
+    assert cache.stats.hit_ratio == pytest.approx(2 / 3)
+    assert cache.stats.saved_seconds >= 0
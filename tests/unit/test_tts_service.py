@@ -13,39 +13,36 @@ def tts_service():
 @pytest.mark.asyncio
 async def test_synthesize_speech(tts_service):
     """Test synthesizing speech from text"""
-    # Mock the client.generate method
+    # Mock the streaming client
     tts_service.client = Mock()
-    tts_service.client.generate = Mock(return_value=b"fake audio data")
-    tts_service.use_new_api = True
+    tts_service.client.synthesize = AsyncMock(return_value=b"fake audio data")
 
     # Test synthesis
     result = await tts_service.synthesize("Привет мир")
 
     assert result == b"fake audio data"
-    tts_service.client.generate.assert_called_once()
+    tts_service.client.synthesize.assert_called_once()
 
 
 @pytest.mark.asyncio
 async def test_synthesize_with_custom_voice(tts_service):
     """Test synthesis with custom voice"""
     tts_service.client = Mock()
-    tts_service.client.generate = Mock(return_value=b"audio with custom voice")
-    tts_service.use_new_api = True
+    tts_service.client.synthesize = AsyncMock(return_value=b"audio with custom voice")
 
     result = await tts_service.synthesize("Тест", voice_id="custom_voice_id")
 
     assert result == b"audio with custom voice"
     # Verify custom voice was used
-    call_kwargs = tts_service.client.generate.call_args[1]
-    assert call_kwargs.get('voice') == 'custom_voice_id'
+    call_kwargs = tts_service.client.synthesize.call_args[1]
+    assert call_kwargs.get('voice_id') == 'custom_voice_id'
 
 
 @pytest.mark.asyncio
 async def test_synthesize_api_error(tts_service):
     """Test synthesis handles API errors"""
     tts_service.client = Mock()
-    tts_service.client.generate = Mock(side_effect=Exception("API Error"))
-    tts_service.use_new_api = True
+    tts_service.client.synthesize = AsyncMock(side_effect=Exception("API Error"))
 
     with pytest.raises(Exception):
         await tts_service.synthesize("Тест")
@@ -62,8 +59,7 @@ async def test_synthesize_empty_text(tts_service):
 async def test_synthesize_long_text(tts_service):
     """Test synthesis with long text"""
     tts_service.client = Mock()
-    tts_service.client.generate = Mock(return_value=b"long audio")
-    tts_service.use_new_api = True
+    tts_service.client.synthesize = AsyncMock(return_value=b"long audio")
 
     long_text = "А" * 5000  # Very long text
     result = await tts_service.synthesize(long_text)
@@ -88,12 +84,11 @@ def test_tts_service_default_voice():
 async def test_synthesize_with_model_parameter(tts_service):
     """Test synthesis with model parameter"""
     tts_service.client = Mock()
-    tts_service.client.generate = Mock(return_value=b"audio data")
-    tts_service.use_new_api = True
+    tts_service.client.synthesize = AsyncMock(return_value=b"audio data")
 
     result = await tts_service.synthesize("Текст", model="eleven_multilingual_v2")
 
     assert result == b"audio data"
     # Verify model was passed
-    call_kwargs = tts_service.client.generate.call_args[1]
-    assert call_kwargs.get('model') == 'eleven_multilingual_v2'
+    call_kwargs = tts_service.client.synthesize.call_args[1]
+    assert call_kwargs.get('model_id') == 'eleven_multilingual_v2'
@@ -0,0 +1,173 @@
+"""Unit tests for fair per-user update processor"""
+import pytest
+import asyncio
+import time
+from telegram import Update
+from src.bot.update_processor import ArrivalStampingQueue, FairUpdateProcessor
+
+_update_ids = iter(range(1, 10000))
+
+
+def _update(user_id: int) -> Update:
+    update_id = next(_update_ids)
+    return Update.de_json({
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": 0,
+            "chat": {"id": user_id, "type": "private"},
+            "from": {"id": user_id, "is_bot": False, "first_name": "Test"},
+            "text": "что сегодня",
+        },
+    }, None)
+
+
+class _Recorder:
+    """Handler coroutines that log start/end order and track concurrency"""
+
+    def __init__(self):
+        self.log = []
+        self.active = 0
+        self.peak = 0
+
+    async def handle(self, name: str, delay: float = 0.01):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.log.append(f"start {name}")
+        await asyncio.sleep(delay)
+        self.log.append(f"end {name}")
+        self.active -= 1
+
+
+@pytest.mark.asyncio
+async def test_same_user_processed_in_order():
+    """Test one user's updates never overlap and keep arrival order"""
+    processor = FairUpdateProcessor(max_concurrent=4)
+    recorder = _Recorder()
+
+    await asyncio.gather(*(
+        processor.process_update(_update(1), recorder.handle(f"m{i}")) for i in range(3)
+    ))
+
+    assert recorder.log == ["start m0", "end m0", "start m1", "end m1", "start m2", "end m2"]
+    assert recorder.peak == 1
+
+
+@pytest.mark.asyncio
+async def test_different_users_concurrent_within_limit():
+    """Test updates of different users run in parallel up to max_concurrent"""
+    processor = FairUpdateProcessor(max_concurrent=2)
+    recorder = _Recorder()
+
+    await asyncio.gather(*(
+        processor.process_update(_update(user_id), recorder.handle(f"u{user_id}"))
+        for user_id in range(4)
+    ))
+
+    assert recorder.peak == 2
+    assert processor.stats.processed == 4
+    assert processor.stats.queued == 2
+    assert processor.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_users_take_turns():
+    """Test a user with a backlog does not starve a user who arrives later"""
+    processor = FairUpdateProcessor(max_concurrent=1)
+    recorder = _Recorder()
+
+    tasks = [
+        asyncio.create_task(processor.process_update(_update(1), recorder.handle(f"a{i}")))
+        for i in range(3)
+    ]
+    tasks.append(asyncio.create_task(processor.process_update(_update(2), recorder.handle("b0"))))
+    await asyncio.gather(*tasks)
+
+    starts = [entry.split()[1] for entry in recorder.log if entry.startswith("start")]
+    assert starts == ["a0", "b0", "a1", "a2"]
+
+
+@pytest.mark.asyncio
+async def test_queue_wait_measured():
+    """Test wait of queued updates is recorded"""
+    processor = FairUpdateProcessor(max_concurrent=1)
+    recorder = _Recorder()
+
+    await asyncio.gather(
+        processor.process_update(_update(1), recorder.handle("first", delay=0.05)),
+        processor.process_update(_update(2), recorder.handle("second")),
+    )
+
+    assert processor.stats.queued == 1
+    assert processor.stats.max_wait_seconds >= 0.04
+    assert processor.wait_percentile_ms(100) >= 40
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_waiting_updates():
+    """Test waiting updates are cancelled and their handlers never start"""
+    processor = FairUpdateProcessor(max_concurrent=1)
+    recorder = _Recorder()
+
+    running = asyncio.create_task(processor.process_update(_update(1), recorder.handle("running")))
+    waiting = asyncio.create_task(processor.process_update(_update(1), recorder.handle("waiting")))
+    await asyncio.sleep(0)
+
+    await processor.shutdown()
+    await running
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    assert recorder.log == ["start running", "end running"]
+    assert processor.pending == 0
+
+
+def test_invalid_limit_rejected():
+    """Test non-positive concurrency limit raises ValueError"""
+    with pytest.raises(ValueError):
+        FairUpdateProcessor(max_concurrent=0)
+
+
+@pytest.mark.asyncio
+async def test_arrival_time_includes_queue_wait():
+    """Test an update queued behind the user's previous one keeps its arrival time"""
+    processor = FairUpdateProcessor(max_concurrent=4)
+    recorder = _Recorder()
+    first, second = _update(1), _update(1)
+    seen = {}
+
+    async def handle():
+        seen["arrival"] = processor.arrival_time(second)
+        seen["started"] = time.monotonic()
+
+    await asyncio.gather(
+        processor.process_update(first, recorder.handle("first", delay=0.05)),
+        processor.process_update(second, handle())
+    )
+
+    assert seen["started"] - seen["arrival"] >= 0.04
+    assert processor.arrival_time(second) is None
+
+
+@pytest.mark.asyncio
+async def test_arrival_stamped_before_semaphore():
+    """Test time waiting for PTB's pending limit counts from queue ingress"""
+    processor = FairUpdateProcessor(max_concurrent=4, max_pending=1)
+    queue = ArrivalStampingQueue(processor)
+    recorder = _Recorder()
+    first, second = _update(1), _update(2)
+    seen = {}
+
+    async def handle():
+        seen["arrival"] = processor.arrival_time(second)
+        seen["started"] = time.monotonic()
+
+    await queue.put(second)
+    assert await queue.get() is second
+    await asyncio.gather(
+        processor.process_update(first, recorder.handle("first", delay=0.05)),
+        processor.process_update(second, handle())
+    )
+
+    assert seen["started"] - seen["arrival"] >= 0.04
+    assert processor.arrival_time(second) is None
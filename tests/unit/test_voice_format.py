@@ -0,0 +1,90 @@
+"""Unit tests for OGG/Opus voice encoding"""
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, Mock, patch
+from src.services.voice.process_pool import ProcessPool
+from src.services.voice.tts_cache import TTSCache
+from src.services.voice.tts_service import TTSService
+from src.services.voice.voice_format import VoiceEncoder, VoiceFormatError, audio_format_of, is_ogg_opus
+
+OGG_OPUS = b"OggS\x00\x02" + bytes(20) + b"\x01\x13" + b"OpusHead" + bytes(11)
+OGG_VORBIS = b"OggS\x00\x02" + bytes(20) + b"\x01\x1e" + b"\x01vorbis" + bytes(23)
+
+
+async def _async(value):
+    return value
+
+
+def test_is_ogg_opus():
+    """Test only Ogg streams starting with OpusHead are accepted"""
+    assert is_ogg_opus(OGG_OPUS)
+    assert not is_ogg_opus(OGG_VORBIS)
+    assert not is_ogg_opus(b"ID3\x03" + bytes(100))
+    assert not is_ogg_opus(b"OggS")
+
+
+def test_audio_format_of_elevenlabs_output():
+    """Test ElevenLabs output formats map to decodable containers"""
+    assert audio_format_of("opus_48000_32") == "ogg"
+    assert audio_format_of("mp3_44100_128") == "mp3"
+
+
+@pytest.mark.asyncio
+async def test_opus_api_output_is_sent_without_transcoding():
+    """Test Opus requested from ElevenLabs reaches the reply untouched"""
+    pool = Mock()
+    encoder = VoiceEncoder(input_format="ogg", pool=pool)
+    service = TTSService(api_key="test", voice_encoder=encoder)
+    service.client = Mock()
+    service.client.synthesize = AsyncMock(return_value=OGG_OPUS)
+
+    assert await service.synthesize("Привет") == OGG_OPUS
+    assert service.client.synthesize.call_args.kwargs["output_format"] == "opus_48000_32"
+    pool.run.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_encoder_passes_opus_through():
+    """Test audio already in OGG/Opus is not transcoded"""
+    encoder = VoiceEncoder(pool=ProcessPool(executor=ThreadPoolExecutor(1)))
+
+    assert await encoder.encode(OGG_OPUS) is OGG_OPUS
+    assert encoder.stats.passthrough == 1
+
+
+@pytest.mark.asyncio
+async def test_encoder_rejects_invalid_output():
+    """Test transcoder output is validated"""
+    encoder = VoiceEncoder(pool=ProcessPool(executor=ThreadPoolExecutor(1)))
+
+    with patch("src.services.voice.voice_format.transcode_to_opus", return_value=b"not opus"):
+        with pytest.raises(VoiceFormatError, match="not OGG/Opus"):
+            await encoder.encode(b"ID3 mp3")
+
+    assert encoder.stats.failed == 1
+
+
+@pytest.mark.asyncio
+async def test_encoder_wraps_transcoding_errors():
+    """Test undecodable audio raises VoiceFormatError"""
+    encoder = VoiceEncoder(pool=ProcessPool(executor=ThreadPoolExecutor(1)))
+
+    with pytest.raises(VoiceFormatError):
+        await encoder.encode(b"garbage")
+
+
+@pytest.mark.asyncio
+async def test_tts_service_caches_encoded_voice():
+    """Test encoded reply is cached under the Opus format key"""
+    encoder = Mock(format_id="ogg_opus_32k")
+    encoder.encode = Mock(side_effect=lambda audio: _async(OGG_OPUS))
+    service = TTSService(api_key="test", cache=TTSCache(), voice_encoder=encoder)
+    service.client = Mock()
+    service.client.synthesize = AsyncMock(return_value=b"mp3")
+
+    assert await service.synthesize("Привет") == OGG_OPUS
+    assert await service.synthesize("Привет") == OGG_OPUS
+    assert await service.synthesize("Привет", raw=True) == b"mp3"
+
+    encoder.encode.assert_called_once()
+    service.client.synthesize.assert_called_once()
@@ -0,0 +1,111 @@
+"""Unit tests for Telegram webhook server"""
+import pytest
+import asyncio
+from unittest.mock import Mock
+from aiohttp.test_utils import TestClient, TestServer
+from src.bot.webhook import SECRET_TOKEN_HEADER, WebhookServer
+
+SECRET = "test-secret_token"
+
+
+def _update(update_id: int) -> dict:
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": 0,
+            "chat": {"id": 1, "type": "private"},
+            "text": "что сегодня",
+        },
+    }
+
+
+@pytest.fixture
+def application():
+    """Telegram application mock with update queue and processor"""
+    application = Mock()
+    application.bot = None
+    application.update_queue = asyncio.Queue()
+    application.update_processor = Mock(pending=0)
+    return application
+
+
+@pytest.fixture
+async def webhook(application):
+    """Webhook server with a test HTTP client"""
+    server = WebhookServer(application, secret_token=SECRET, max_pending=2)
+    client = TestClient(TestServer(server.create_app()))
+    await client.start_server()
+    yield server, client
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_update_queued_for_application(webhook, application):
+    """Test valid update is acknowledged and put on the update queue"""
+    server, client = webhook
+
+    response = await client.post("/telegram", json=_update(1), headers={SECRET_TOKEN_HEADER: SECRET})
+
+    assert response.status == 200
+    assert application.update_queue.get_nowait().update_id == 1
+    assert server.stats.accepted == 1
+
+
+@pytest.mark.asyncio
+async def test_invalid_secret_rejected(webhook, application):
+    """Test requests without the secret token are rejected"""
+    server, client = webhook
+
+    missing = await client.post("/telegram", json=_update(1))
+    wrong = await client.post("/telegram", json=_update(2), headers={SECRET_TOKEN_HEADER: "wrong"})
+
+    assert missing.status == 403
+    assert wrong.status == 403
+    assert application.update_queue.empty()
+    assert server.stats.rejected == 2
+
+
+@pytest.mark.asyncio
+async def test_redelivered_update_processed_once(webhook, application):
+    """Test duplicate update_id is acknowledged but not processed again"""
+    server, client = webhook
+    headers = {SECRET_TOKEN_HEADER: SECRET}
+
+    first = await client.post("/telegram", json=_update(7), headers=headers)
+    second = await client.post("/telegram", json=_update(7), headers=headers)
+
+    assert first.status == second.status == 200
+    assert application.update_queue.qsize() == 1
+    assert server.stats.duplicates == 1
+
+
+@pytest.mark.asyncio
+async def test_overload_asks_for_redelivery(webhook, application):
+    """Test update is refused with 503 (and not remembered) while too many are pending"""
+    server, client = webhook
+    headers = {SECRET_TOKEN_HEADER: SECRET}
+    application.update_processor.pending = 1
+
+    accepted = await client.post("/telegram", json=_update(1), headers=headers)
+    refused = await client.post("/telegram", json=_update(2), headers=headers)
+
+    # Once the processor catches up, the redelivered update is accepted
+    application.update_queue.get_nowait()
+    application.update_processor.pending = 0
+    retried = await client.post("/telegram", json=_update(2), headers=headers)
+
+    assert accepted.status == 200
+    assert refused.status == 503
+    assert retried.status == 200
+    assert server.stats.overloaded == 1
+
+
+@pytest.mark.asyncio
+async def test_invalid_payload_rejected(webhook):
+    """Test malformed body returns 400"""
+    server, client = webhook
+
+    response = await client.post("/telegram", data=b"not json", headers={SECRET_TOKEN_HEADER: SECRET})
+
+    assert response.status == 400
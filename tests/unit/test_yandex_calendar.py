@@ -240,3 +240,31 @@ END:VCALENDAR"""
         assert len(events) == 1
         assert events[0].title == "Важная встреча"
         assert events[0].id == "unique-event-id-123"
+
+
+@pytest.mark.asyncio
+async def test_create_event(yandex_calendar):
+    """Test creating event saves iCalendar data"""
+    mock_dav = MagicMock()
+    mock_principal = MagicMock()
+    mock_dav.principal.return_value = mock_principal
+    mock_calendar = MagicMock()
+    mock_principal.calendars.return_value = [mock_calendar]
+
+    yandex_calendar.client = mock_dav
+
+    start = datetime(2025, 11, 6, 15, 0)
+    event = Event(
+        id="new-event", title="Созвон",
+        start=start, end=start + timedelta(hours=1),
+        attendees=["ivan@example.com"], source="", raw_data={}
+    )
+
+    created = await yandex_calendar.create_event(event)
+
+    assert created.id == "new-event"
+    assert created.source == "yandex"
+    mock_calendar.save_event.assert_called_once()
+    ical_data = mock_calendar.save_event.call_args[0][0]
+    assert "SUMMARY:Созвон" in ical_data
+    assert "mailto:ivan@example.com" in ical_data